@@ -0,0 +1,31 @@
+"""Admin site config shared by the apps."""
+
+from django.contrib import admin
+from django.forms import ModelForm
+from django.http import HttpRequest
+
+from server.apps.generic.models import GenericModel
+
+
+class GenericModelAdmin(admin.ModelAdmin):
+    """Model admin saving the instances already validated by the form."""
+
+    def save_model(
+        self,
+        request: HttpRequest,
+        obj: GenericModel,
+        form: ModelForm,
+        change: bool,
+    ) -> None:
+        """Save the instance without running full_clean() again.
+
+        Model form validates the fields, model and unique constraints
+        of the instance before it is saved.
+
+        Args:
+            request (HttpRequest): admin request.
+            obj (GenericModel): instance to save.
+            form (ModelForm): validated model form.
+            change (bool): indicates if the instance is changed.
+        """
+        obj.save(validate=False)
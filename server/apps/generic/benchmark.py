@@ -0,0 +1,115 @@
+"""Benchmark of the primary key generators."""
+
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Callable
+
+from django.db import connection, transaction
+
+KeyGenerator = Callable[[], uuid.UUID]
+MIN_ELAPSED = 1e-9  # noqa: WPS432
+
+
+@dataclass(frozen=True)
+class KeyBenchmarkResult:
+    """Insert throughput and index size for the generated keys."""
+
+    name: str
+    rows_count: int
+    elapsed: float
+    index_size: int
+
+    @property
+    def rows_per_second(self) -> float:
+        """Return the insert throughput.
+
+        Returns:
+            float: number of rows inserted per second.
+        """
+        return self.rows_count / max(self.elapsed, MIN_ELAPSED)
+
+
+class KeyBenchmark:
+    """Measure how the primary key generators affect the inserts.
+
+    Rows are inserted in batches to the temporary table with the UUID
+    primary key, so only the key index is maintained. Random keys touch
+    pages all over the index and split them half full, while the ordered
+    ones append to its right edge, which shows in both the throughput
+    and the index size.
+    """
+
+    @classmethod
+    def run(
+        cls,
+        name: str,
+        generator: KeyGenerator,
+        rows_count: int,
+        batch_size: int,
+    ) -> KeyBenchmarkResult:
+        """Insert the rows with the generated keys and measure the index.
+
+        The temporary table is dropped afterwards.
+
+        Args:
+            name (str): name of the generator.
+            generator (KeyGenerator): function generating the keys.
+            rows_count (int): number of inserted rows.
+            batch_size (int): number of rows inserted at once.
+
+        Returns:
+            KeyBenchmarkResult: measured throughput and index size.
+        """
+        table_name = f"benchmark_{name}"
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"CREATE TEMPORARY TABLE {table_name} "
+                    + "(uuid uuid PRIMARY KEY, created_at timestamptz)",
+                )
+                elapsed = sum(
+                    cls.insert_rows(
+                        cursor,
+                        table_name,
+                        [
+                            generator()
+                            for _ in range(min(batch_size, rows_count - offset))
+                        ],
+                    )
+                    for offset in range(0, rows_count, batch_size)
+                )
+                cursor.execute(
+                    "SELECT pg_relation_size(%s::regclass)",  # noqa: WPS323
+                    [f"{table_name}_pkey"],
+                )
+                index_size = cursor.fetchone()[0]
+                cursor.execute(f"DROP TABLE {table_name}")
+        return KeyBenchmarkResult(name, rows_count, elapsed, index_size)
+
+    @classmethod
+    def insert_rows(
+        cls,
+        cursor,
+        table_name: str,
+        keys: list[uuid.UUID],
+    ) -> float:
+        """Insert the rows with the keys in a single statement.
+
+        Keys are generated beforehand, so only the insert is timed.
+
+        Args:
+            cursor (CursorWrapper): database cursor.
+            table_name (str): name of the benchmark table.
+            keys (list[uuid.UUID]): primary keys of the rows.
+
+        Returns:
+            float: elapsed seconds.
+        """
+        started_at = time.perf_counter()
+        cursor.execute(
+            f"INSERT INTO {table_name} (uuid, created_at) "
+            + "SELECT UNNEST(%s::uuid[]), NOW()",  # noqa: WPS323
+            [keys],
+        )
+        return time.perf_counter() - started_at
@@ -0,0 +1,79 @@
+"""Generators of the primary keys."""
+
+import os
+import secrets
+import threading
+import time
+import uuid
+
+TIMESTAMP_SHIFT = 80
+VERSION_SHIFT = 76
+RANDOM_A_SHIFT = 64
+VARIANT_SHIFT = 62
+RANDOM_B_BITS = 62
+RANDOM_BITS = 74
+RANDOM_B_MASK = (1 << RANDOM_B_BITS) - 1
+MAX_RANDOM = (1 << RANDOM_BITS) - 1
+MAX_INCREMENT = 65536
+NANOSECONDS_IN_MILLISECOND = 1000000
+
+
+class MonotonicUUIDGenerator:
+    """Generate the time-ordered UUIDs, version 7 as defined by RFC 9562.
+
+    The leading 48 bits are the Unix time in milliseconds, followed by
+    the version, 74 random bits and the variant. Keys generated within
+    the same millisecond increase the random bits of the previous key
+    by a random step, so the keys are strictly increasing even when
+    the clock does not move or goes back.
+    """
+
+    def __init__(self) -> None:
+        """Start with the zero timestamp, so the first key draws the bits."""
+        self.timestamp = 0
+        self.random_bits = 0
+        self.lock = threading.Lock()
+
+    def __call__(self) -> uuid.UUID:
+        """Return the next key.
+
+        Returns:
+            uuid.UUID: time-ordered UUID.
+        """
+        with self.lock:
+            timestamp = time.time_ns() // NANOSECONDS_IN_MILLISECOND
+            if timestamp > self.timestamp:
+                self.timestamp = timestamp
+                # The top random bit is left clear to make room
+                # for the increments within the millisecond.
+                self.random_bits = int.from_bytes(os.urandom(10), "big") >> 7
+            else:
+                self.random_bits += secrets.randbelow(MAX_INCREMENT) + 1
+                if self.random_bits > MAX_RANDOM:
+                    self.timestamp += 1
+                    self.random_bits &= MAX_RANDOM
+            return uuid.UUID(
+                int=(
+                    self.timestamp << TIMESTAMP_SHIFT
+                    | 7 << VERSION_SHIFT
+                    | (self.random_bits >> RANDOM_B_BITS) << RANDOM_A_SHIFT
+                    | 2 << VARIANT_SHIFT
+                    | self.random_bits & RANDOM_B_MASK
+                ),
+            )
+
+
+generate_uuid7 = MonotonicUUIDGenerator()
+
+
+def uuid7() -> uuid.UUID:
+    """Return the time-ordered UUID, the default primary key.
+
+    Keys created later sort after the earlier ones, so the new rows
+    are appended to the right edge of the primary key index instead
+    of being scattered over it.
+
+    Returns:
+        uuid.UUID: time-ordered UUID.
+    """
+    return generate_uuid7()
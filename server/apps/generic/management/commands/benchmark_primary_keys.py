@@ -0,0 +1,64 @@
+"""Command comparing the random and time-ordered primary keys."""
+
+import uuid
+from argparse import ArgumentParser
+
+from django.core.management.base import BaseCommand
+from django.template.defaultfilters import filesizeformat
+
+from server.apps.generic.benchmark import KeyBenchmark
+from server.apps.generic.identifiers import uuid7
+
+DEFAULT_ROWS_COUNT = 200000
+DEFAULT_BATCH_SIZE = 1000
+GENERATORS = (("uuid4", uuid.uuid4), ("uuid7", uuid7))
+
+
+class Command(BaseCommand):
+    """Insert the same number of rows keyed with UUIDv4 and UUIDv7.
+
+    Reports the insert throughput and the size of the primary key
+    index for each of the generators.
+    """
+
+    help = "Compare the inserts with the random and time-ordered keys."
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        """Add the rows count and batch size arguments.
+
+        Args:
+            parser (ArgumentParser): command arguments parser.
+        """
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=DEFAULT_ROWS_COUNT,
+            help="Number of rows inserted with each generator.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Number of rows inserted at once.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Run the benchmark for each generator.
+
+        Args:
+            args (list): command arguments.
+            options (dict): command options.
+        """
+        for name, generator in GENERATORS:
+            benchmark_result = KeyBenchmark.run(
+                name,
+                generator,
+                options["rows"],
+                options["batch_size"],
+            )
+            rows_per_second = round(benchmark_result.rows_per_second)
+            index_size = filesizeformat(benchmark_result.index_size)
+            self.stdout.write(
+                f"{name}: {rows_per_second} rows/s, "
+                + f"primary key index {index_size}.",
+            )
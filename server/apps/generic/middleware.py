@@ -0,0 +1,55 @@
+"""Middleware of the generic app."""
+
+from typing import Callable
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+
+from server.apps.generic.routers import ReplicaRouting, routed_reads
+
+SAFE_METHODS = frozenset(("GET", "HEAD", "OPTIONS"))
+PRIMARY_COOKIE = "use_primary"
+
+
+class ReplicaRoutingMiddleware:
+    """Let the safe requests read from the replicas.
+
+    Requests that write are answered with the cookie keeping the client
+    on the primary database for a while, so its next requests read
+    its writes, even if the replicas lag behind.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        """Store the next handler of the request.
+
+        Args:
+            get_response (Callable): next middleware or view.
+        """
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Route the reads of the request and pin the writing clients.
+
+        Args:
+            request (HttpRequest): incoming request.
+
+        Returns:
+            HttpResponse: response of the request.
+        """
+        routing = ReplicaRouting(
+            use_replicas=(
+                request.method in SAFE_METHODS
+                and PRIMARY_COOKIE not in request.COOKIES
+            ),
+        )
+        with routed_reads(routing):
+            response = self.get_response(request)
+        if routing.has_written:
+            response.set_cookie(
+                PRIMARY_COOKIE,
+                "1",
+                max_age=settings.REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
@@ -1,28 +1,41 @@
 """Generic app models."""
-import uuid
 
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from server.apps.generic.identifiers import uuid7
+from server.apps.generic.validation import BatchValidator
+
 
 class GenericModel(models.Model):
-    """Base model for storing fields necessary for every model."""
+    """Base model for storing fields necessary for every model.
+
+    Primary keys are time-ordered, so the inserts stay local
+    to the right edge of the indexes.
+    """
 
     uuid = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
     )
     created_at = models.DateTimeField(_("Created at"), auto_now_add=True)
 
-    def save(self, *args, **kwargs) -> None:
-        """Call full_clean() before saving.
+    def save(self, *args, validate: bool = True, **kwargs) -> None:
+        """Validate the instance before saving, unless validated already.
+
+        Instance is validated by the batch validator, so the related
+        instances already set on it are not queried again. Instances
+        validated together with the batch, or by the model forms,
+        are saved with 'validate=False'.
 
         Args:
             args(list): save arguments.
+            validate(bool): indicates if the instance should be validated.
             kwargs(dict): save keyword arguments.
         """
-        self.full_clean()
+        if validate:
+            BatchValidator.validate([self])
         super().save(*args, **kwargs)
 
     class Meta:
@@ -0,0 +1,130 @@
+"""Routing of the database queries to the read replicas."""
+
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, models
+
+
+@dataclass
+class ReplicaRouting:
+    """Routing state of the current request."""
+
+    use_replicas: bool
+    has_written: bool = False
+
+
+REPLICA_ROUTING: ContextVar[Optional[ReplicaRouting]] = ContextVar(
+    "replica_routing",
+    default=None,
+)
+
+
+@contextmanager
+def routed_reads(routing: Optional[ReplicaRouting]) -> Iterator[None]:
+    """Route the reads within the block, restoring the routing after it.
+
+    Args:
+        routing (Optional[ReplicaRouting]): routing state of the block,
+            reads go to the primary database if not given.
+
+    Yields:
+        None: control back to the block.
+    """
+    token = REPLICA_ROUTING.set(routing)
+    try:
+        yield
+    finally:
+        REPLICA_ROUTING.reset(token)
+
+
+@contextmanager
+def primary_reads() -> Iterator[None]:
+    """Read from the primary database within the block.
+
+    Used for the reads which results outlive the request, like the cached
+    graphs, so they are not built from the lagging replica.
+
+    Yields:
+        None: control back to the block.
+    """
+    with routed_reads(None):
+        yield
+
+
+class ReplicaRouter:
+    """Send the reads of the safe requests to the read replicas.
+
+    Replicas are only used within the requests routed by the middleware,
+    until the first write of the request, so the request reads its own
+    writes. Everything else, like the commands, uses the primary database.
+    """
+
+    def db_for_read(self, model: type[models.Model], **hints) -> str:
+        """Return the random replica, if the request can use it.
+
+        Args:
+            model (type[models.Model]): model of the query.
+            hints (dict): routing hints.
+
+        Returns:
+            str: alias of the database.
+        """
+        routing = REPLICA_ROUTING.get()
+        if routing is None or not routing.use_replicas:
+            return DEFAULT_DB_ALIAS
+        if routing.has_written or not settings.DATABASE_REPLICAS:
+            return DEFAULT_DB_ALIAS
+        return random.choice(settings.DATABASE_REPLICAS)  # noqa: S311
+
+    def db_for_write(self, model: type[models.Model], **hints) -> str:
+        """Return the primary database and stop reading from the replicas.
+
+        Args:
+            model (type[models.Model]): model of the query.
+            hints (dict): routing hints.
+
+        Returns:
+            str: alias of the primary database.
+        """
+        routing = REPLICA_ROUTING.get()
+        if routing is not None:
+            routing.has_written = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(
+        self,
+        obj1: models.Model,
+        obj2: models.Model,
+        **hints,
+    ) -> bool:
+        """Allow relations between the instances of all the databases.
+
+        Replicas hold the same data as the primary database.
+
+        Args:
+            obj1 (models.Model): first instance.
+            obj2 (models.Model): second instance.
+            hints (dict): routing hints.
+
+        Returns:
+            bool: always True.
+        """
+        return True
+
+    def allow_migrate(self, db: str, app_label: str, **hints) -> bool:
+        """Migrate only the primary database, replicas follow it.
+
+        Args:
+            db (str): alias of the database.
+            app_label (str): label of the migrated app.
+            hints (dict): routing hints.
+
+        Returns:
+            bool: indicates if the database is not a replica.
+        """
+        return db not in settings.DATABASE_REPLICAS
@@ -0,0 +1,47 @@
+"""Word similarity expressions of the pg_trgm extension.
+
+Django 3.2 exposes only the similarity of the whole strings, which
+ranks the short typed text low against the longer names.
+"""
+
+from typing import Any
+
+from django.db import models
+
+
+class TrigramWordSimilarity(models.Func):
+    """Greatest similarity of the text to any part of the expression."""
+
+    function = "WORD_SIMILARITY"
+    output_field = models.FloatField()
+
+    def __init__(self, text: str, expression: Any, **extra: Any) -> None:
+        """Compare the text with the expression.
+
+        Args:
+            text (str): typed text.
+            expression (Any): field name or expression compared with.
+            extra (Any): expression keyword arguments.
+        """
+        super().__init__(models.Value(text), expression, **extra)
+
+
+class TrigramWordSimilar(models.Func):
+    """Word similarity of the text to the expression above the threshold.
+
+    Uses the '%>' operator, which the trigram GIN index supports.
+    """
+
+    template = "%(expressions)s"  # noqa: WPS323
+    arg_joiner = " %%> "  # noqa: WPS323
+    output_field = models.BooleanField()
+
+    def __init__(self, expression: Any, text: str, **extra: Any) -> None:
+        """Compare the expression with the text.
+
+        Args:
+            expression (Any): field name or expression compared with.
+            text (str): typed text.
+            extra (Any): expression keyword arguments.
+        """
+        super().__init__(expression, models.Value(text), **extra)
@@ -0,0 +1,102 @@
+"""Bulk inserts updating the rows which already exist.
+
+Django 3.2 bulk_create can only ignore the conflicting rows,
+so the upsert statement is built by hand.
+"""
+
+from typing import Sequence
+
+from django.db import connection, models
+
+UPSERT_BATCH_SIZE = 1000
+UPSERT_QUERY = """
+    INSERT INTO {table} ({columns}) VALUES {rows}
+    ON CONFLICT ({unique_columns}) DO UPDATE SET {updates}
+    WHERE ({updated_columns}) IS DISTINCT FROM ({excluded_columns})
+"""
+
+
+def bulk_upsert(
+    instances: Sequence[models.Model],
+    unique_fields: Sequence[str],
+    update_fields: Sequence[str],
+) -> None:
+    """Insert the instances, updating the rows with the same unique fields.
+
+    Unlike deleting and inserting the rows again, concurrent upserts
+    of the same rows do not violate the unique constraint. Rows which
+    would not change are not updated.
+
+    Args:
+        instances (Sequence[models.Model]): new instances of the model.
+        unique_fields (Sequence[str]): fields of the unique constraint.
+        update_fields (Sequence[str]): fields updated on the conflict.
+    """
+    if not instances:
+        return
+    fields = [
+        field
+        for field in instances[0]._meta.concrete_fields  # noqa: WPS437
+        if not isinstance(field, models.AutoField)
+    ]
+    query = upsert_query(fields, unique_fields, update_fields)
+    with connection.cursor() as cursor:
+        for offset in range(0, len(instances), UPSERT_BATCH_SIZE):
+            batch = instances[offset : offset + UPSERT_BATCH_SIZE]  # noqa: E203
+            cursor.execute(
+                query.format(rows=", ".join(row_sql(fields) for _ in batch)),
+                [
+                    field.get_db_prep_save(
+                        field.pre_save(instance, add=True),
+                        connection,
+                    )
+                    for instance in batch
+                    for field in fields
+                ],
+            )
+
+
+def upsert_query(
+    fields: Sequence[models.Field],
+    unique_fields: Sequence[str],
+    update_fields: Sequence[str],
+) -> str:
+    """Return the upsert statement, with the rows left to be formatted.
+
+    Args:
+        fields (Sequence[models.Field]): inserted fields of the model.
+        unique_fields (Sequence[str]): fields of the unique constraint.
+        update_fields (Sequence[str]): fields updated on the conflict.
+
+    Returns:
+        str: upsert statement with the '{rows}' placeholder.
+    """
+    opts = fields[0].model._meta  # noqa: WPS437
+    quote = connection.ops.quote_name
+    table = quote(opts.db_table)
+    updated = [quote(opts.get_field(name).column) for name in update_fields]
+    return UPSERT_QUERY.format(
+        table=table,
+        columns=", ".join(quote(field.column) for field in fields),
+        unique_columns=", ".join(
+            quote(opts.get_field(name).column) for name in unique_fields
+        ),
+        updates=", ".join(
+            f"{column} = EXCLUDED.{column}" for column in updated
+        ),
+        updated_columns=", ".join(f"{table}.{column}" for column in updated),
+        excluded_columns=", ".join(f"EXCLUDED.{column}" for column in updated),
+        rows="{rows}",
+    )
+
+
+def row_sql(fields: Sequence[models.Field]) -> str:
+    """Return the placeholders of the values of the single row.
+
+    Args:
+        fields (Sequence[models.Field]): inserted fields.
+
+    Returns:
+        str: parenthesized placeholders.
+    """
+    return "({0})".format(", ".join("%s" for _ in fields))  # noqa: WPS323
@@ -0,0 +1,375 @@
+"""Batched validation of the model instances."""
+
+import itertools
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Collection, Iterable, Sequence
+
+from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
+from django.db import models
+
+ErrorDict = dict[str, list[ValidationError]]
+
+
+def clean_instance(instance: models.Model, exclude: list[str]) -> ErrorDict:
+    """Clean the fields and the instance, collecting the errors of both.
+
+    Args:
+        instance (Model): instance to clean.
+        exclude (list[str]): names of the fields not to clean.
+
+    Returns:
+        ErrorDict: errors of the instance, empty if it is valid.
+    """
+    errors: ErrorDict = {}
+    cleaners = (partial(instance.clean_fields, exclude=exclude), instance.clean)
+    for clean in cleaners:
+        try:
+            clean()
+        except ValidationError as error:
+            error.update_error_dict(errors)
+    return errors
+
+
+def add_foreign_key_error(
+    errors: ErrorDict,
+    field: models.ForeignKey,
+    value: Any,
+    existing_values: Collection,
+) -> None:
+    """Add the error of the missing or not existing related instance.
+
+    Args:
+        errors (ErrorDict): errors of the instance.
+        field (ForeignKey): foreign key field of the model.
+        value (Any): value of the foreign key.
+        existing_values (Collection): values of the existing instances.
+    """
+    if value is None:
+        if field.null:
+            return
+        error = ValidationError(field.error_messages["null"], code="null")
+    elif value in existing_values:
+        return
+    else:
+        error = ValidationError(
+            field.error_messages["invalid"],
+            code="invalid",
+            params={
+                "model": field.related_model._meta.verbose_name,  # noqa: WPS437
+                "pk": value,
+                "field": field.target_field.attname,
+                "value": value,
+            },
+        )
+    errors.setdefault(field.name, []).append(error)
+
+
+@dataclass
+class UniqueCheck:
+    """Unique constraint of the model, checked for the whole batch."""
+
+    model: type[models.Model]
+    field_names: tuple[str, ...]
+
+    @property
+    def attnames(self) -> list[str]:
+        """Return the column attributes of the unique fields.
+
+        Returns:
+            list[str]: attribute names, with '_id' suffix for foreign keys.
+        """
+        return [
+            self.model._meta.get_field(name).attname  # noqa: WPS437
+            for name in self.field_names
+        ]
+
+    def applies_to(self, instance: models.Model, errors: ErrorDict) -> bool:
+        """Return False if the check is skipped for the instance.
+
+        As in 'full_clean()', the fields already invalid and the missing
+        values are not checked, nor the primary key of the saved instance.
+
+        Args:
+            instance (Model): instance to check.
+            errors (ErrorDict): errors of the instance.
+
+        Returns:
+            bool: indicates if the check is needed.
+        """
+        is_invalid = any(name in errors for name in self.field_names)
+        if is_invalid or None in self.values(instance):
+            return False
+        is_pk_check = self.field_names == (
+            self.model._meta.pk.name,  # noqa: WPS437
+        )
+        return not is_pk_check or instance._state.adding  # noqa: WPS437
+
+    def values(self, instance: models.Model) -> tuple:
+        """Return the values of the unique fields of the instance.
+
+        Args:
+            instance (Model): instance to check.
+
+        Returns:
+            tuple: values of the unique fields.
+        """
+        return tuple(getattr(instance, name) for name in self.attnames)
+
+    def lookup(self, unique_values: Iterable[tuple]) -> models.Q:
+        """Return the lookup of the rows with the values of every field.
+
+        Each field is looked up with its own 'IN' list, so the query does
+        not grow with the combinations of the values. For multiple fields,
+        rows it returns have to be matched against the values.
+
+        Args:
+            unique_values (Iterable[tuple]): values of the unique fields.
+
+        Returns:
+            Q: lookup of the unique fields.
+        """
+        field_values = zip(*unique_values)
+        return models.Q(
+            **{
+                f"{attname}__in": set(values)
+                for attname, values in zip(self.attnames, field_values)
+            },
+        )
+
+    def is_taken(self, instance: models.Model, row_pk: Any) -> bool:
+        """Return True if the row with the values is not the instance itself.
+
+        Args:
+            instance (Model): instance with the values of the row.
+            row_pk (Any): primary key of the row.
+
+        Returns:
+            bool: indicates if the values are taken by the other row.
+        """
+        return instance._state.adding or instance.pk != row_pk  # noqa: WPS437
+
+    def add_error(self, instance: models.Model, errors: ErrorDict) -> None:
+        """Add the same error as the model unique validation does.
+
+        Args:
+            instance (Model): instance violating the constraint.
+            errors (ErrorDict): errors of the instance.
+        """
+        error_key = NON_FIELD_ERRORS
+        if len(self.field_names) == 1:
+            error_key = self.field_names[0]
+        message = instance.unique_error_message(self.model, self.field_names)
+        errors.setdefault(error_key, []).append(message)
+
+
+class BatchValidator:
+    """Validate a batch of instances of the same model at once.
+
+    Validation matches 'full_clean()', raising all the errors of the first
+    invalid instance at once, but instead of the queries per instance,
+    there is a single query per foreign key and per unique constraint
+    for the whole batch. Related instances already saved and set
+    on the instances are not queried again.
+    """
+
+    @classmethod
+    def validate(
+        cls,
+        instances: Sequence[models.Model],
+        exclude: Collection[str] = (),
+    ) -> None:
+        """Validate the fields, model and unique constraints of the instances.
+
+        Args:
+            instances (Sequence[Model]): instances of the same model.
+            exclude (Collection[str]): names of the fields not to validate,
+                as in 'full_clean()'.
+
+        Raises:
+            ValidationError: errors of the first invalid instance.
+        """
+        if not instances:
+            return
+        foreign_keys = [
+            field
+            for field in instances[0]._meta.concrete_fields  # noqa: WPS437
+            if field.is_relation and field.name not in exclude
+        ]
+        cleaned_exclude = [*exclude, *(field.name for field in foreign_keys)]
+        errors = [
+            clean_instance(instance, cleaned_exclude) for instance in instances
+        ]
+        for foreign_key in foreign_keys:
+            cls.validate_foreign_key(foreign_key, instances, errors)
+        cls.validate_unique(instances, exclude, errors)
+        invalid_errors = next(filter(None, errors), None)
+        if invalid_errors:
+            raise ValidationError(invalid_errors)
+
+    @classmethod
+    def validate_foreign_key(
+        cls,
+        field: models.ForeignKey,
+        instances: Sequence[models.Model],
+        errors: Sequence[ErrorDict],
+    ) -> None:
+        """Check the related instances exist, with a single query.
+
+        Instances get the error if the related instance does not exist,
+        or the value is missing for not nullable field.
+
+        Args:
+            field (ForeignKey): foreign key field of the model.
+            instances (Sequence[Model]): instances of the model.
+            errors (Sequence[ErrorDict]): errors of the instances.
+        """
+        checked = [
+            (getattr(instance, field.attname), instance_errors)
+            for instance, instance_errors in zip(instances, errors)
+            if not cls.is_saved_relation(field, instance)
+        ]
+        existing_values = cls.find_existing_values(
+            field,
+            {value for value, _ in checked if value is not None},
+        )
+        for value, instance_errors in checked:
+            add_foreign_key_error(
+                instance_errors,
+                field,
+                value,
+                existing_values,
+            )
+
+    @classmethod
+    def find_existing_values(
+        cls,
+        field: models.ForeignKey,
+        values: set[Any],
+    ) -> set[Any]:
+        """Find the values of the foreign key the related instances exist for.
+
+        Args:
+            field (ForeignKey): foreign key field of the model.
+            values (set[Any]): values of the foreign key.
+
+        Returns:
+            set[Any]: values of the existing related instances.
+        """
+        if not values:
+            return set()
+        target_name = field.target_field.attname
+        return set(
+            field.related_model._base_manager.filter(  # noqa: WPS437
+                **{f"{target_name}__in": values},
+            ).values_list(target_name, flat=True),
+        )
+
+    @classmethod
+    def is_saved_relation(
+        cls,
+        field: models.ForeignKey,
+        instance: models.Model,
+    ) -> bool:
+        """Return True if the related instance is set and already saved.
+
+        Args:
+            field (ForeignKey): foreign key field of the model.
+            instance (Model): instance of the model.
+
+        Returns:
+            bool: indicates if the related instance is known to exist.
+        """
+        related = field.get_cached_value(instance, default=None)
+        return related is not None and not related._state.adding  # noqa: WPS437
+
+    @classmethod
+    def validate_unique(
+        cls,
+        instances: Sequence[models.Model],
+        exclude: Collection[str],
+        errors: Sequence[ErrorDict],
+    ) -> None:
+        """Check the unique constraints of the model.
+
+        Args:
+            instances (Sequence[Model]): instances of the model.
+            exclude (Collection[str]): names of the fields not to validate.
+            errors (Sequence[ErrorDict]): errors of the instances.
+        """
+        unique_checks = instances[0]._get_unique_checks(  # noqa: WPS437
+            exclude=list(exclude),
+        )[0]
+        for unique_check in itertools.starmap(UniqueCheck, unique_checks):
+            checked = cls.collect_unique_values(unique_check, instances, errors)
+            taken = cls.find_taken_positions(unique_check, checked, instances)
+            for index in sorted(taken):
+                unique_check.add_error(instances[index], errors[index])
+
+    @classmethod
+    def find_taken_positions(
+        cls,
+        unique_check: UniqueCheck,
+        checked: dict[tuple, int],
+        instances: Sequence[models.Model],
+    ) -> set[int]:
+        """Find the instances with the values taken by other rows, in one query.
+
+        Only the row of the instance itself does not conflict with it.
+        Rows of the other instances of the batch do, even if they leave
+        the values, as the instances are saved one by one.
+
+        Args:
+            unique_check (UniqueCheck): unique constraint to check.
+            checked (dict[tuple, int]): positions of the checked instances.
+            instances (Sequence[Model]): instances of the model.
+
+        Returns:
+            set[int]: positions of the instances with the taken values.
+        """
+        if not checked:
+            return set()
+        rows = (
+            unique_check.model._default_manager.filter(  # noqa: WPS437
+                unique_check.lookup(checked),
+            )
+            .order_by()
+            .values_list("pk", *unique_check.attnames)
+        )
+        taken_positions = set()
+        for row_pk, *row_values in rows:
+            index = checked.get(tuple(row_values))
+            if index is None:
+                continue
+            if unique_check.is_taken(instances[index], row_pk):
+                taken_positions.add(index)
+        return taken_positions
+
+    @classmethod
+    def collect_unique_values(
+        cls,
+        unique_check: UniqueCheck,
+        instances: Sequence[models.Model],
+        errors: Sequence[ErrorDict],
+    ) -> dict[tuple, int]:
+        """Check the unique fields within the batch.
+
+        Instances repeating the values of the preceding ones get the error.
+
+        Args:
+            unique_check (UniqueCheck): unique constraint to check.
+            instances (Sequence[Model]): instances of the model.
+            errors (Sequence[ErrorDict]): errors of the instances.
+
+        Returns:
+            dict[tuple, int]: positions of the instances keyed by the values
+                of the unique fields, if they are to be checked.
+        """
+        checked: dict[tuple, int] = {}
+        for index, instance in enumerate(instances):
+            if not unique_check.applies_to(instance, errors[index]):
+                continue
+            unique_values = unique_check.values(instance)
+            if checked.setdefault(unique_values, index) != index:
+                unique_check.add_error(instance, errors[index])
+        return checked
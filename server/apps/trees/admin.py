@@ -1,11 +1,48 @@
 """Admin site config for the trees app."""
 
+from typing import Any, Optional
+
+from django import forms
 from django.contrib import admin
+from django.db import models
+from django.http import HttpRequest
 
+from server.apps.generic.admin import GenericModelAdmin
+from server.apps.trees.derived_models import Inconsistency
 from server.apps.trees.models import Option, Path, Solution, Step, Tree
 
-admin.site.register(Solution)
-admin.site.register(Option)
-admin.site.register(Step)
-admin.site.register(Path)
-admin.site.register(Tree)
+
+class TreeAdmin(GenericModelAdmin):
+    """Tree admin editing the paths, though they have the through model."""
+
+    def formfield_for_manytomany(
+        self,
+        db_field: models.ManyToManyField,
+        request: HttpRequest,
+        **kwargs: Any,
+    ) -> Optional[forms.Field]:
+        """Return the form field of the paths, as for the other relations.
+
+        Through model of the paths has no fields of its own, so the paths
+        are set by the relation, which sends the signals refreshing
+        the tree.
+
+        Args:
+            db_field (models.ManyToManyField): many to many field.
+            request (HttpRequest): admin request.
+            kwargs (Any): form field keyword arguments.
+
+        Returns:
+            Optional[forms.Field]: form field, if the field is editable.
+        """
+        if db_field.name == "paths":
+            return db_field.formfield(**kwargs)
+        return super().formfield_for_manytomany(db_field, request, **kwargs)
+
+
+admin.site.register(Solution, GenericModelAdmin)
+admin.site.register(Option, GenericModelAdmin)
+admin.site.register(Step, GenericModelAdmin)
+admin.site.register(Path, GenericModelAdmin)
+admin.site.register(Tree, TreeAdmin)
+admin.site.register(Inconsistency, GenericModelAdmin)
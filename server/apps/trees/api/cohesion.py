@@ -0,0 +1,45 @@
+"""Cohesion validation action of the trees API."""
+
+from uuid import UUID
+
+from rest_framework import response, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.request import Request
+
+from server.apps.trees.api.schema import extend_cohesion_schema
+from server.apps.trees.api.serializers.cohesion import TreeCohesionSerializer
+from server.apps.trees.services.tree import TreeService
+
+
+class TreeCohesionMixin:
+    """Add the cohesion validation action to a tree view.
+
+    Validation runs on the compiled graph of the tree, so once the graph
+    is cached, checking the whole tree is cheap enough to give the editors
+    feedback as they go.
+    """
+
+    @extend_cohesion_schema
+    @action(detail=True, methods=["get"])
+    def cohesion(
+        self: viewsets.ModelViewSet,
+        request: Request,
+        pk: UUID,
+    ) -> response.Response:
+        """Return response with the cohesion issues of the tree.
+
+        Args:
+            request (Request): incomming request.
+            pk (UUID): primary key of the tree.
+
+        Returns:
+            Response: response with the found issues.
+        """
+        issues = TreeService.check_cohesion(self.get_object())
+        serializer = TreeCohesionSerializer(
+            {"is_cohesive": not issues, "issues": issues},
+        )
+        return response.Response(
+            status=status.HTTP_200_OK,
+            data=serializer.data,
+        )
@@ -0,0 +1,42 @@
+"""Conditional reads of the trees API."""
+
+import hashlib
+import json
+from typing import Optional
+
+from django.core.exceptions import ValidationError
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import etag
+from rest_framework.request import Request
+
+from server.apps.trees.selectors import SolutionSelector
+
+
+def solution_etag(request: Request, pk: str) -> Optional[str]:
+    """Return the ETag of the retrieved solution, before it is serialized.
+
+    Clients don't download the unchanged descriptions again.
+    Requested fieldsets are taken into account, as they change
+    the served representation.
+
+    Args:
+        request (Request): incomming request.
+        pk (str): primary key of the solution.
+
+    Returns:
+        Optional[str]: ETag of the solution, None if it doesn't exist.
+    """
+    try:
+        version = SolutionSelector.version(pk)
+    except ValidationError:
+        return None
+    if version is None:
+        return None
+    content = json.dumps([*version, request.GET.urlencode()])
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+solution_etag_condition = method_decorator(
+    etag(solution_etag),
+    name="retrieve",
+)
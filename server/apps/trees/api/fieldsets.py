@@ -0,0 +1,133 @@
+"""Sparse fieldsets of the trees API reads."""
+
+from typing import Any, Callable, Optional
+
+from django.db.models import QuerySet
+from rest_framework import serializers
+
+from server.apps.trees.api.mixins import ReadQuerysetMixin
+
+FIELDS_PARAM = "fields"
+EXPAND_PARAM = "expand"
+
+ReadSelector = Callable[[Optional[dict]], QuerySet]
+SparseFieldsets = tuple[Optional[set[str]], Optional[dict]]
+
+
+def split_param(param_value: str) -> list[str]:
+    """Split the comma separated query parameter.
+
+    Args:
+        param_value (str): value of the query parameter.
+
+    Returns:
+        list[str]: non-empty items of the parameter.
+    """
+    return [item.strip() for item in param_value.split(",") if item.strip()]
+
+
+def parse_expand(param_value: str) -> dict:
+    """Parse the dotted nested relations into the tree of relations.
+
+    Args:
+        param_value (str): comma separated relations, e.g. 'paths.steps'.
+
+    Returns:
+        dict: nested relations of the deeper levels keyed by the name.
+    """
+    expand: dict = {}
+    for relation in split_param(param_value):
+        level = expand
+        for name in relation.split("."):
+            level = level.setdefault(name, {})
+    return expand
+
+
+class SparseReadQuerysetMixin(ReadQuerysetMixin):
+    """Allow choosing the fields and the nested instances to read.
+
+    '?fields=' limits the serialized fields, '?expand=' lists the nested
+    relations to embed, with dots separating the deeper levels. Once any
+    of them is given, nested relations that are not expanded are neither
+    serialized nor prefetched. Reads of the plain columns only are made
+    with a single values() query.
+    """
+
+    request: Any
+    paginator: Any
+    read_selector: Optional[ReadSelector] = None
+
+    def get_queryset_for_read(self) -> QuerySet:
+        """Return the queryset prefetching the expanded relations only.
+
+        Returns:
+            QuerySet: queryset for the reading actions.
+        """
+        fields, expand = self.get_sparse_fieldsets()
+        if fields is not None and fields <= self.get_column_names():
+            return self.queryset.values(*fields, *self.get_ordering_names())
+        if self.read_selector is None:
+            return super().get_queryset_for_read()
+        return self.read_selector(expand)
+
+    def get_serializer(
+        self,
+        *args: Any,
+        **kwargs: Any,
+    ) -> serializers.Serializer:
+        """Return the serializer limited to the requested fieldsets.
+
+        Args:
+            args (Any): serializer arguments.
+            kwargs (Any): serializer keyword arguments.
+
+        Returns:
+            Serializer: serializer instance.
+        """
+        if self.action in self.read_actions:
+            fields, expand = self.get_sparse_fieldsets()
+            kwargs.update(fields=fields, expand=expand)
+        return super().get_serializer(*args, **kwargs)
+
+    def get_sparse_fieldsets(self) -> SparseFieldsets:
+        """Parse the requested fields and nested relations.
+
+        Requested fields that are relations are expanded one level deep,
+        relations that are not requested are never expanded.
+
+        Returns:
+            SparseFieldsets: names of the fields and nested relations
+                keyed by the name, None if not limited.
+        """
+        params = self.request.query_params
+        if FIELDS_PARAM not in params and EXPAND_PARAM not in params:
+            return None, None
+        expand = parse_expand(params.get(EXPAND_PARAM, ""))
+        if FIELDS_PARAM not in params:
+            return None, expand
+        fields = set(split_param(params[FIELDS_PARAM]))
+        return fields, {name: expand.get(name, {}) for name in fields}
+
+    def get_column_names(self) -> set[str]:
+        """Return names of the plain columns of the model.
+
+        Returns:
+            set[str]: primary key, non-relational field
+                and annotation names.
+        """
+        model_fields = self.queryset.model._meta.concrete_fields  # noqa: WPS437
+        return {"pk", *self.queryset.query.annotations} | {
+            field.name for field in model_fields if not field.is_relation
+        }
+
+    def get_ordering_names(self) -> list[str]:
+        """Return names of the fields the page is ordered by.
+
+        Returns:
+            list[str]: field names, without the descending prefixes.
+        """
+        get_ordering = getattr(self.paginator, "get_ordering", None)
+        if get_ordering is None:
+            return []
+        ordering = get_ordering(self.request, self.queryset, self)
+        return [field_name.lstrip("-") for field_name in ordering]
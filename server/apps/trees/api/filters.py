@@ -0,0 +1,44 @@
+"""Filter backends for trees API."""
+
+from typing import Any
+
+from django.db.models import QuerySet
+from rest_framework.filters import OrderingFilter
+from rest_framework.request import Request
+
+from server.apps.trees.api.pagination import CreatedAtCursorPagination
+
+
+class StableOrderingFilter(OrderingFilter):
+    """Ordering by the requested fields, ties broken by the cursor ordering.
+
+    Cursor pagination needs the total order of the instances, so the
+    creation time and the uuid always end the requested ordering.
+    """
+
+    def get_ordering(
+        self,
+        request: Request,
+        queryset: QuerySet,
+        view: Any,
+    ) -> list[str]:
+        """Return the requested ordering followed by the tie breakers.
+
+        Args:
+            request (Request): current request.
+            queryset (QuerySet): queryset to order.
+            view (Any): view listing the queryset.
+
+        Returns:
+            list[str]: fields to order by, the cursor ordering if none.
+        """
+        ordering = list(super().get_ordering(request, queryset, view) or ())
+        ordered_names = {field_name.lstrip("-") for field_name in ordering}
+        return [
+            *ordering,
+            *(
+                field_name
+                for field_name in CreatedAtCursorPagination.ordering
+                if field_name not in ordered_names
+            ),
+        ]
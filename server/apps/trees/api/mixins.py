@@ -2,24 +2,28 @@
 
 from uuid import UUID
 
-from drf_spectacular.types import OpenApiTypes
-from drf_spectacular.utils import OpenApiParameter, extend_schema
-from rest_framework import response, serializers, status, viewsets
+from django.core.exceptions import ValidationError
+from django.db.models import QuerySet
+from rest_framework import exceptions, response, serializers, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.request import Request
 
-from server.apps.trees.api.serializers.step import TreeStepModelSerializer
-from server.apps.trees.models import Step, Tree
-from server.apps.trees.selectors import OptionSelector, StepSelector
-
-extend_first_step_schema = extend_schema(responses=TreeStepModelSerializer)
-
-extend_change_step_schema = extend_schema(
-    parameters=[
-        OpenApiParameter("step_uuid", OpenApiTypes.UUID, OpenApiParameter.PATH),
-    ],
-    responses=TreeStepModelSerializer,
+from server.apps.trees.api.schema import (
+    extend_change_step_schema,
+    extend_first_step_schema,
+    extend_resolve_schema,
+)
+from server.apps.trees.api.serializers.step import (
+    TreeStepModelSerializer,
+    TreeStepQuerySerializer,
+)
+from server.apps.trees.api.serializers.tree import (
+    TreeAnswersSerializer,
+    TreeWalkSerializer,
 )
+from server.apps.trees.graph import TreeGraph, TreeGraphCache
+from server.apps.trees.models import Tree
+from server.apps.trees.selectors import StepSelector
 
 
 class SerializerPerActionMixin:
@@ -42,8 +46,65 @@ class SerializerPerActionMixin:
         )
 
 
+class ReadQuerysetMixin:
+    """Allow prefetching nested instances for the reading actions only.
+
+    Other actions use the plain queryset, so they don't pay for
+    the prefetching of instances they won't serialize.
+    """
+
+    action: str
+    read_actions = ("list", "retrieve")
+    queryset: QuerySet
+    read_queryset: QuerySet
+
+    def get_queryset(self) -> QuerySet:  # noqa: WPS615
+        """Based on the action, return the queryset.
+
+        Returns:
+            QuerySet: queryset with nested instances prefetched if needed.
+        """
+        if self.action in self.read_actions:
+            return self.get_queryset_for_read()
+        return self.queryset.all()
+
+    def get_queryset_for_read(self) -> QuerySet:
+        """Return the queryset for the reading actions.
+
+        Returns:
+            QuerySet: queryset with nested instances prefetched.
+        """
+        return self.read_queryset.all()
+
+
+class TraversalQuerysetMixin(ReadQuerysetMixin):
+    """Look up the plain trees for the traversal actions.
+
+    Traversal is served from the stored first step or the compiled graph,
+    so it doesn't pay for the annotations the trees are listed with.
+    """
+
+    traversal_actions = ("first_step", "change_step", "resolve")
+
+    def get_queryset(self) -> QuerySet:  # noqa: WPS615
+        """Based on the action, return the queryset.
+
+        Returns:
+            QuerySet: trees with only the first step for the traversal.
+        """
+        if self.action in self.traversal_actions:
+            return Tree.objects.only("first_step")
+        return super().get_queryset()
+
+
 class TreeStepsMixin:
-    """Add step selection actions to a tree view."""
+    """Add step selection actions to a tree view.
+
+    Steps are served from the compiled graph of the tree, so the traversal
+    does not query the tree data once the graph is cached. The tree itself
+    is still looked up, so the queryset and the permissions of the view
+    apply to the cached graphs as well.
+    """
 
     @extend_first_step_schema
     @action(detail=True, methods=["get"])
@@ -54,6 +115,12 @@ class TreeStepsMixin:
     ) -> response.Response:
         """Return response with the first step and its options for specific tree.
 
+        The first step is stored on the tree, so without the 'depth'
+        query parameter it is served with a single lookup of the tree.
+        Otherwise given number of next steps is embedded from the tree graph.
+        Trees not refreshed since their paths were added have no first step
+        stored yet, so it is read from the graph as well.
+
         Args:
             request (Request): incomming request.
             pk (UUID): primary key of the tree.
@@ -62,18 +129,16 @@ class TreeStepsMixin:
             Response: response with serialized first step and its options.
         """
         tree = self.get_object()
-        first_step_name = StepSelector.first_name_for_tree(tree)
-        if first_step_name:
-            step_data = {
-                "name": first_step_name,
-                "options": OptionSelector.for_step_name_and_tree(
-                    first_step_name,
-                    tree,
-                ),
-            }
-            data = TreeStepModelSerializer(step_data).data
-        else:
-            data = {}
+        depth = self.get_lookahead_depth()
+        data = tree.first_step
+        if depth or not data:
+            graph = self.get_tree_graph(tree)
+            first_step = graph.first_step_data()
+            if first_step:
+                data = TreeStepModelSerializer(
+                    first_step,
+                    context={"graph": graph, "depth": depth},
+                ).data
         return response.Response(
             status=status.HTTP_200_OK,
             data=data,
@@ -94,41 +159,106 @@ class TreeStepsMixin:
         """Return response with the step for specific tree.
 
         Request data contains the pk of the step to be serialized.
+        The 'depth' query parameter embeds given number of next steps.
+        The tree is looked up first, and if its graph is not cached,
+        the membership of the step is checked before the graph is compiled.
 
         Args:
             request (Request): incomming request.
             pk (UUID): primary key of the tree.
             step_uuid (UUID): primary key of the step.
 
+        Raises:
+            NotFound: if the step is not part of the tree.
+
         Returns:
             Response: response with serialized step and its options,
                 or solution if it's the last step.
         """
         tree = self.get_object()
-        step = Step.objects.get(pk=step_uuid)
-        step_data = self._build_step_data(tree, step)
-        serializer = TreeStepModelSerializer(step_data)
+        graph = TreeGraphCache.get(tree.pk)
+        if graph is None:
+            if not StepSelector.is_in_tree(step_uuid, tree):
+                raise exceptions.NotFound("Step is not part of the tree.")
+            graph = TreeGraphCache.compile(tree)
+        step = graph.get_step(step_uuid)
+        if step is None:
+            raise exceptions.NotFound("Step is not part of the tree.")
+        serializer = TreeStepModelSerializer(
+            graph.step_data(step),
+            context={"graph": graph, "depth": self.get_lookahead_depth()},
+        )
         return response.Response(
             status=status.HTTP_200_OK,
             data=serializer.data,
         )
 
-    def _build_step_data(self, tree: Tree, step: Step) -> dict:
-        """Return a dictionary with the step data.
+    @extend_resolve_schema
+    @action(detail=True, methods=["get"])
+    def resolve(
+        self: viewsets.ModelViewSet,
+        request: Request,
+        pk: UUID,
+    ) -> response.Response:
+        """Return response with the step reached by following the answers.
+
+        The whole walk is validated at once, starting from the first step.
 
         Args:
-            tree (Tree): tree object.
-            step (Step): step to serialize.
+            request (Request): incomming request.
+            pk (UUID): primary key of the tree.
+
+        Raises:
+            ValidationError: if the answers do not form a valid walk.
 
         Returns:
-            dict: serialized step data.
+            Response: response with serialized final step of the walk
+                and names of all the visited steps.
         """
-        step_data = {"name": step.name}
-        if step.is_final:
-            step_data["solution"] = step.solution
-        else:
-            step_data["options"] = OptionSelector.for_step_name_and_tree(
-                step.name,
-                tree,
+        answers_serializer = TreeAnswersSerializer(
+            data={"answers": request.query_params.getlist("answers")},
+        )
+        answers_serializer.is_valid(raise_exception=True)
+        graph = self.get_tree_graph(self.get_object())
+        try:
+            step_data, visited_steps = graph.walk(
+                answers_serializer.validated_data["answers"],
             )
-        return step_data
+        except ValidationError as error:
+            raise serializers.ValidationError(error.messages)
+        serializer = TreeWalkSerializer(
+            {"step": step_data, "visited_steps": visited_steps},
+        )
+        return response.Response(
+            status=status.HTTP_200_OK,
+            data=serializer.data,
+        )
+
+    def get_lookahead_depth(self: viewsets.ModelViewSet) -> int:
+        """Return the number of the next steps to embed in the response.
+
+        Returns:
+            int: validated depth from the query parameters.
+        """
+        query_serializer = TreeStepQuerySerializer(
+            data=self.request.query_params,
+        )
+        query_serializer.is_valid(raise_exception=True)
+        return query_serializer.validated_data["depth"]
+
+    def get_tree_graph(self: viewsets.ModelViewSet, tree: Tree) -> TreeGraph:
+        """Return the compiled graph of the tree, compiling it if needed.
+
+        Tree has to be looked up by the view, which checks its permissions,
+        before the cached graph is served.
+
+        Args:
+            tree (Tree): tree looked up by the view.
+
+        Returns:
+            TreeGraph: compiled graph of the tree.
+        """
+        graph = TreeGraphCache.get(tree.pk)
+        if graph is None:
+            graph = TreeGraphCache.compile(tree)
+        return graph
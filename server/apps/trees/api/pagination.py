@@ -0,0 +1,253 @@
+"""Pagination classes for trees API."""
+
+import json
+from typing import Any, Optional, Sequence
+
+from django.core.exceptions import ValidationError
+from django.db import models
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination
+from rest_framework.request import Request
+
+MAX_PAGE_SIZE = 1000
+
+Position = list[str]
+
+
+def reverse_ordering(ordering: Sequence[str]) -> tuple[str, ...]:
+    """Return the ordering with the directions of all the fields swapped.
+
+    Args:
+        ordering (Sequence[str]): fields to order by.
+
+    Returns:
+        tuple[str, ...]: fields to order by in the reverse direction.
+    """
+    return tuple(
+        field_name[1:] if field_name.startswith("-") else f"-{field_name}"
+        for field_name in ordering
+    )
+
+
+def following_field(field_name: str, field_value: str) -> models.Q:
+    """Return the condition of the field value following the given one.
+
+    Args:
+        field_name (str): ordering field, prefixed by '-' if descending.
+        field_value (str): value of the field at the position.
+
+    Returns:
+        models.Q: condition of the values after the given one in the ordering.
+    """
+    name = field_name.lstrip("-")
+    lookup = "lt" if field_name.startswith("-") else "gt"
+    return models.Q(**{f"{name}__{lookup}": field_value})
+
+
+def keyset_filter(ordering: Sequence[str], position: Position) -> models.Q:
+    """Return the condition of the instances following the position.
+
+    Instances follow the position if they have the same values of the
+    leading fields, and the next field value following the position.
+
+    Args:
+        ordering (Sequence[str]): fields to order by, the last one unique.
+        position (Position): values of the ordering fields.
+
+    Returns:
+        models.Q: condition of the instances after the position in the ordering.
+    """
+    *leading_fields, last_field = zip(ordering, position)
+    condition = following_field(*last_field)
+    for field_name, field_value in reversed(leading_fields):
+        condition = following_field(field_name, field_value) | (
+            models.Q(**{field_name.lstrip("-"): field_value}) & condition
+        )
+    return condition
+
+
+class KeysetCursorPagination(CursorPagination):  # noqa: WPS230
+    """Cursor pagination over all the fields of the ordering.
+
+    Cursor holds the values of all the ordering fields at the page
+    boundary, and the page starts right after them, however many
+    instances share the leading fields. No offsets are needed,
+    as the ordering has to end with a unique field.
+    """
+
+    def paginate_queryset(
+        self,
+        queryset: models.QuerySet,
+        request: Request,
+        view: Any = None,
+    ) -> Optional[list]:
+        """Return the page of the instances following the cursor.
+
+        Args:
+            queryset (models.QuerySet): instances to paginate.
+            request (Request): current request.
+            view (Any): view listing the queryset.
+
+        Returns:
+            Optional[list]: instances of the page, None if not paginated.
+        """
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        reverse = self.cursor is not None and self.cursor.reverse
+        results = list(self.get_page_queryset(queryset)[: self.page_size + 1])
+        self.page = results[: self.page_size]
+        has_following = len(results) > self.page_size
+        if reverse:
+            self.page.reverse()
+            self.has_next = True
+            self.has_previous = has_following
+        else:
+            self.has_next = has_following
+            self.has_previous = self.cursor is not None
+        self.display_page_controls = self.has_next or self.has_previous
+        self.set_boundary_positions()
+        return self.page
+
+    def get_page_queryset(self, queryset: models.QuerySet) -> models.QuerySet:
+        """Order the instances and keep the ones following the cursor.
+
+        Reverse cursors walk the reversed ordering back from the position.
+
+        Args:
+            queryset (models.QuerySet): instances to paginate.
+
+        Raises:
+            NotFound: if the cursor position does not match the fields.
+
+        Returns:
+            models.QuerySet: instances from the cursor on.
+        """
+        ordering = self.ordering
+        if self.cursor is not None and self.cursor.reverse:
+            ordering = reverse_ordering(ordering)
+        queryset = queryset.order_by(*ordering)
+        if self.cursor is None or self.cursor.position is None:
+            return queryset
+        try:
+            return queryset.filter(
+                keyset_filter(ordering, self.cursor.position),
+            )
+        except (ValidationError, ValueError, TypeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_link(self) -> Optional[str]:
+        """Return the link to the page after the last instance.
+
+        Returns:
+            Optional[str]: link to the next page, if any.
+        """
+        if not self.has_next:
+            return None
+        return self.encode_cursor(
+            Cursor(
+                offset=0,
+                reverse=False,
+                position=json.dumps(self.next_position),
+            ),
+        )
+
+    def get_previous_link(self) -> Optional[str]:
+        """Return the link to the page before the first instance.
+
+        Returns:
+            Optional[str]: link to the previous page, if any.
+        """
+        if not self.has_previous:
+            return None
+        return self.encode_cursor(
+            Cursor(
+                offset=0,
+                reverse=True,
+                position=json.dumps(self.previous_position),
+            ),
+        )
+
+    def set_boundary_positions(self) -> None:
+        """Store the positions of the first and the last page instances.
+
+        Empty page stays at the position of the cursor it is reached by.
+        """
+        if not self.page:
+            self.previous_position = self.cursor and self.cursor.position
+            self.next_position = self.previous_position
+            return
+        self.previous_position = self._get_position_from_instance(
+            self.page[0],
+            self.ordering,
+        )
+        self.next_position = self._get_position_from_instance(
+            self.page[-1],
+            self.ordering,
+        )
+
+    def decode_cursor(self, request: Request) -> Optional[Cursor]:
+        """Return the cursor with the position of all the ordering fields.
+
+        Args:
+            request (Request): current request.
+
+        Raises:
+            NotFound: if the cursor position is malformed.
+
+        Returns:
+            Optional[Cursor]: cursor, None on the first page.
+        """
+        cursor = super().decode_cursor(request)
+        if cursor is None or cursor.position is None:
+            return cursor
+        try:
+            position = json.loads(cursor.position)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        is_valid = isinstance(position, list)
+        if not is_valid or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return Cursor(
+            offset=cursor.offset,
+            reverse=cursor.reverse,
+            position=position,
+        )
+
+    def _get_position_from_instance(  # noqa: WPS112
+        self,
+        instance: Any,
+        ordering: Sequence[str],
+    ) -> Position:
+        """Return the values of all the ordering fields of the instance.
+
+        Args:
+            instance (Any): model instance, or its values.
+            ordering (Sequence[str]): fields to order by.
+
+        Returns:
+            Position: values of the fields, as strings.
+        """
+        return [
+            str(
+                instance[field_name.lstrip("-")]
+                if isinstance(instance, dict)
+                else getattr(instance, field_name.lstrip("-")),
+            )
+            for field_name in ordering
+        ]
+
+
+class CreatedAtCursorPagination(KeysetCursorPagination):
+    """Cursor pagination over the creation time.
+
+    The uuid makes the order of the instances created at the same time
+    deterministic, so the pages stay stable when new instances are created.
+    """
+
+    ordering = ("created_at", "uuid")
+    page_size_query_param = "page_size"
+    max_page_size = MAX_PAGE_SIZE
@@ -0,0 +1,117 @@
+"""OpenAPI schema extensions for trees API actions."""
+
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import (
+    OpenApiParameter,
+    extend_schema,
+    extend_schema_view,
+)
+
+from server.apps.trees.api.serializers.cohesion import TreeCohesionSerializer
+from server.apps.trees.api.serializers.inconsistency import (
+    InconsistencyQuerySerializer,
+)
+from server.apps.trees.api.serializers.search import (
+    SearchQuerySerializer,
+    SearchResultSerializer,
+    SimilarNameSerializer,
+    TypeaheadQuerySerializer,
+)
+from server.apps.trees.api.serializers.step import (
+    TreeStepModelSerializer,
+    TreeStepQuerySerializer,
+)
+from server.apps.trees.api.serializers.tree import TreeWalkSerializer
+from server.apps.trees.api.serializers.tree_batch import (
+    TreeBatchResultSerializer,
+    TreeBatchSerializer,
+)
+from server.apps.trees.api.serializers.tree_import import (
+    TreeImportResultSerializer,
+    TreeImportSerializer,
+)
+
+extend_first_step_schema = extend_schema(
+    parameters=[TreeStepQuerySerializer],
+    responses=TreeStepModelSerializer,
+)
+
+extend_change_step_schema = extend_schema(
+    parameters=[
+        OpenApiParameter("step_uuid", OpenApiTypes.UUID, OpenApiParameter.PATH),
+        TreeStepQuerySerializer,
+    ],
+    responses=TreeStepModelSerializer,
+)
+
+extend_resolve_schema = extend_schema(
+    parameters=[
+        OpenApiParameter(
+            "answers",
+            {"type": "array", "items": {"type": "string"}},
+            OpenApiParameter.QUERY,
+            description="Primary keys or names of the chosen options.",
+            explode=True,
+        ),
+    ],
+    responses=TreeWalkSerializer,
+)
+
+extend_cohesion_schema = extend_schema(responses=TreeCohesionSerializer)
+
+extend_snapshot_schema = extend_schema(
+    parameters=[
+        OpenApiParameter(
+            "If-None-Match",
+            OpenApiTypes.STR,
+            OpenApiParameter.HEADER,
+        ),
+    ],
+    responses={(200, "application/json"): OpenApiTypes.OBJECT},
+)
+
+sparse_fieldsets_schema = extend_schema(
+    parameters=[
+        OpenApiParameter(
+            "fields",
+            OpenApiTypes.STR,
+            OpenApiParameter.QUERY,
+            description="Comma separated names of the fields to serialize.",
+        ),
+        OpenApiParameter(
+            "expand",
+            OpenApiTypes.STR,
+            OpenApiParameter.QUERY,
+            description="Comma separated nested relations, e.g. 'paths.steps'.",
+        ),
+    ],
+)
+
+extend_sparse_fieldsets_schema = extend_schema_view(
+    list=sparse_fieldsets_schema,
+    retrieve=sparse_fieldsets_schema,
+)
+
+extend_import_schema = extend_schema(
+    request=TreeImportSerializer,
+    responses={201: TreeImportResultSerializer},
+)
+
+extend_batch_schema = extend_schema(
+    request=TreeBatchSerializer,
+    responses=TreeBatchResultSerializer,
+)
+
+extend_inconsistency_schema = extend_schema_view(
+    list=extend_schema(parameters=[InconsistencyQuerySerializer]),
+)
+
+extend_search_schema = extend_schema(
+    parameters=[SearchQuerySerializer],
+    responses=SearchResultSerializer,
+)
+
+extend_typeahead_schema = extend_schema(
+    parameters=[TypeaheadQuerySerializer],
+    responses=SimilarNameSerializer(many=True),
+)
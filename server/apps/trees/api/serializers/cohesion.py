@@ -0,0 +1,29 @@
+"""Tree cohesion related serializers."""
+
+from rest_framework import serializers
+
+
+class CohesionIssueSerializer(serializers.Serializer):
+    """Read only serializer for the cohesion issue of the tree."""
+
+    kind = serializers.CharField(read_only=True)
+    message = serializers.CharField(read_only=True)
+    step_name = serializers.CharField(read_only=True, allow_null=True)
+    option = serializers.UUIDField(
+        source="option.pk",
+        read_only=True,
+        allow_null=True,
+    )
+
+    class Meta:
+        fields = ("kind", "message", "step_name", "option")
+
+
+class TreeCohesionSerializer(serializers.Serializer):
+    """Read only serializer for the result of the cohesion validation."""
+
+    is_cohesive = serializers.BooleanField(read_only=True)
+    issues = CohesionIssueSerializer(many=True, read_only=True)
+
+    class Meta:
+        fields = ("is_cohesive", "issues")
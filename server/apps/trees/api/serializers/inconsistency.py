@@ -0,0 +1,32 @@
+"""Inconsistency model related serializers."""
+
+from rest_framework import serializers
+
+from server.apps.trees.derived_models import INCONSISTENCY_KINDS, Inconsistency
+
+
+class InconsistencyModelSerializer(serializers.ModelSerializer):
+    """Read only inconsistency model serializer."""
+
+    class Meta:
+        model = Inconsistency
+        fields = (
+            "pk",
+            "tree",
+            "kind",
+            "step_name",
+            "step",
+            "option_name",
+            "option",
+            "created_at",
+        )
+
+
+class InconsistencyQuerySerializer(serializers.Serializer):
+    """Query serializer for filtering the inconsistencies."""
+
+    tree = serializers.UUIDField(required=False)
+    kind = serializers.ChoiceField(choices=INCONSISTENCY_KINDS, required=False)
+
+    class Meta:
+        fields = ("tree", "kind")
@@ -0,0 +1,78 @@
+"""Mixin classes for trees API serializers."""
+
+from typing import Any, Iterable, Optional
+
+from rest_framework import serializers
+
+
+class SparseFieldsetsMixin(serializers.Serializer):
+    """Allow limiting the serialized fields and the nested instances.
+
+    Only the requested 'fields' are serialized, if given. Nested
+    serializers are kept only if named in 'expand', which holds
+    the nested relations of the deeper levels under their names.
+    Everything is serialized if 'expand' is not given.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        fields: Optional[Iterable[str]] = None,
+        expand: Optional[dict] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Store the requested fields and nested relations.
+
+        Args:
+            args (Any): serializer arguments.
+            fields (Optional[Iterable[str]]): names of the fields to keep.
+            expand (Optional[dict]): nested relations to keep.
+            kwargs (Any): serializer keyword arguments.
+        """
+        super().__init__(*args, **kwargs)
+        self.requested_fields = fields
+        self.expand = expand
+
+    def get_fields(self) -> dict[str, serializers.Field]:
+        """Return the requested fields, with unexpanded relations dropped.
+
+        Returns:
+            dict[str, Field]: fields of the serializer.
+        """
+        fields = super().get_fields()
+        if self.requested_fields is not None:
+            fields = {
+                name: field
+                for name, field in fields.items()
+                if name in self.requested_fields
+            }
+        if self.expand is None:
+            return fields
+        return self.get_expanded_fields(fields, self.expand)
+
+    def get_expanded_fields(
+        self,
+        fields: dict[str, serializers.Field],
+        expand: dict,
+    ) -> dict[str, serializers.Field]:
+        """Drop the nested serializers that are not expanded.
+
+        Expanded nested serializers receive their nested relations.
+
+        Args:
+            fields (dict[str, Field]): fields of the serializer.
+            expand (dict): nested relations to keep.
+
+        Returns:
+            dict[str, Field]: fields with the expanded relations only.
+        """
+        expanded_fields = {}
+        for name, field in fields.items():
+            nested = getattr(field, "child", field)
+            if isinstance(nested, serializers.BaseSerializer):
+                if name not in expand:
+                    continue
+                if isinstance(nested, SparseFieldsetsMixin):
+                    nested.expand = expand.get(name)
+            expanded_fields[name] = field
+        return expanded_fields
@@ -3,12 +3,13 @@
 from rest_framework import serializers
 from structlog import get_logger
 
+from server.apps.trees.api.serializers.mixins import SparseFieldsetsMixin
 from server.apps.trees.models import NAME_MAX_LENGTH, Option, Step
 
 log = get_logger()
 
 
-class OptionModelSerializer(serializers.ModelSerializer):
+class OptionModelSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     """Read only option model serializer."""
 
     class Meta:
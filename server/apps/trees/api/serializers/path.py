@@ -2,11 +2,12 @@
 
 from rest_framework import serializers
 
+from server.apps.trees.api.serializers.mixins import SparseFieldsetsMixin
 from server.apps.trees.api.serializers.step import StepModelSerializer
 from server.apps.trees.models import NAME_MAX_LENGTH, Path
 
 
-class PathModelSerializer(serializers.ModelSerializer):
+class PathModelSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     """Read only path model serializer with nested instances."""
 
     steps = StepModelSerializer(many=True, read_only=True, required=False)
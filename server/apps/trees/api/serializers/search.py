@@ -0,0 +1,93 @@
+"""Full-text search related serializers."""
+
+from types import MappingProxyType
+
+from rest_framework import serializers
+
+from server.apps.trees.models import Option, Step
+
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+DEFAULT_TYPEAHEAD_LIMIT = 10
+MAX_TYPEAHEAD_LIMIT = 50
+NAMED_MODELS = MappingProxyType({"step": Step, "option": Option})
+
+
+class SearchQuerySerializer(serializers.Serializer):
+    """Query serializer for the searched text."""
+
+    query = serializers.CharField()
+    limit = serializers.IntegerField(
+        min_value=1,
+        max_value=MAX_SEARCH_LIMIT,
+        default=DEFAULT_SEARCH_LIMIT,
+    )
+
+    class Meta:
+        fields = ("query", "limit")
+
+
+class SearchMatchSerializer(serializers.Serializer):
+    """Read only serializer for the matching tree or solution."""
+
+    pk = serializers.UUIDField(read_only=True)
+    name = serializers.CharField(read_only=True)
+    rank = serializers.FloatField(read_only=True)
+
+    class Meta:
+        fields = ("pk", "name", "rank")
+
+
+class SearchResultSerializer(serializers.Serializer):
+    """Read only serializer for the best matches of each model."""
+
+    trees = SearchMatchSerializer(many=True, read_only=True)
+    solutions = SearchMatchSerializer(many=True, read_only=True)
+
+    class Meta:
+        fields = ("trees", "solutions")
+
+
+class TypeaheadQuerySerializer(serializers.Serializer):
+    """Query serializer for the typed name, within the path or the tree."""
+
+    query = serializers.CharField()
+    model = serializers.ChoiceField(choices=tuple(NAMED_MODELS))
+    path = serializers.UUIDField(required=False)
+    tree = serializers.UUIDField(required=False)
+    limit = serializers.IntegerField(
+        min_value=1,
+        max_value=MAX_TYPEAHEAD_LIMIT,
+        default=DEFAULT_TYPEAHEAD_LIMIT,
+    )
+
+    def validate(self, data: dict) -> dict:
+        """Check the lookup is scoped to either the path or the tree.
+
+        Args:
+            data (dict): data to validate.
+
+        Raises:
+            ValidationError: if neither or both of the scopes are given.
+
+        Returns:
+            dict: data after validation.
+        """
+        if ("path" in data) == ("tree" in data):
+            raise serializers.ValidationError(
+                "Either the path or the tree has to be given.",
+            )
+        return data
+
+    class Meta:
+        fields = ("query", "model", "path", "tree", "limit")
+
+
+class SimilarNameSerializer(serializers.Serializer):
+    """Read only serializer for the name similar to the typed one."""
+
+    name = serializers.CharField(read_only=True)
+    similarity = serializers.FloatField(read_only=True)
+
+    class Meta:
+        fields = ("name", "similarity")
@@ -2,20 +2,42 @@
 
 from rest_framework import serializers
 
+from server.apps.trees.api.serializers.mixins import SparseFieldsetsMixin
 from server.apps.trees.models import NAME_MAX_LENGTH, Solution
 
 
-class SolutionModelSerializer(serializers.ModelSerializer):
-    """Read only solution model serializer."""
+class SolutionModelSerializer(
+    SparseFieldsetsMixin,
+    serializers.ModelSerializer,
+):
+    """Read only solution model serializer.
+
+    Descriptions are served rendered, without the Markdown source.
+    """
 
     author = serializers.CharField(source="creator.username")
 
+    class Meta:
+        model = Solution
+        fields = (
+            "pk",
+            "name",
+            "description_html",
+            "creator",
+            "author",
+        )
+
+
+class SolutionDetailSerializer(SolutionModelSerializer):
+    """Read only solution model serializer, with the Markdown source."""
+
     class Meta:
         model = Solution
         fields = (
             "pk",
             "name",
             "description",
+            "description_html",
             "creator",
             "author",
         )
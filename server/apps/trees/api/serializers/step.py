@@ -1,8 +1,12 @@
 """Step model related serializers."""
 
+from typing import Optional
+from uuid import UUID
+
 from rest_framework import serializers
 from structlog import get_logger
 
+from server.apps.trees.api.serializers.mixins import SparseFieldsetsMixin
 from server.apps.trees.api.serializers.option import OptionModelSerializer
 from server.apps.trees.api.serializers.solution import SolutionModelSerializer
 from server.apps.trees.models import (
@@ -13,10 +17,12 @@ from server.apps.trees.models import (
     Step,
 )
 
+MAX_LOOKAHEAD_DEPTH = 5
+
 log = get_logger()
 
 
-class StepModelSerializer(serializers.ModelSerializer):
+class StepModelSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     """Read only step model serializer with nested instances."""
 
     solution = SolutionModelSerializer(read_only=True, required=False)
@@ -34,6 +40,35 @@ class StepModelSerializer(serializers.ModelSerializer):
         )
 
 
+class TreeOptionModelSerializer(OptionModelSerializer):
+    """Read only option serializer used for displaying the tree steps.
+
+    If the context holds the tree graph and a positive depth,
+    the step the option leads to is embedded under the 'next' key.
+    """
+
+    def to_representation(self, instance: Option) -> dict:
+        """Serialize the option with the next step if requested.
+
+        Args:
+            instance (Option): option to serialize.
+
+        Returns:
+            dict: serialized option.
+        """
+        option_data = super().to_representation(instance)
+        depth = self.context.get("depth", 0)
+        graph = self.context.get("graph")
+        if depth and graph:
+            next_step = graph.get_step(instance.next_step_id)
+            if next_step:
+                option_data["next"] = TreeStepModelSerializer(
+                    graph.step_data(next_step),
+                    context={**self.context, "depth": depth - 1},
+                ).data
+        return option_data
+
+
 class TreeStepModelSerializer(serializers.ModelSerializer):
     """Read only step model serializer with nested instances.
 
@@ -41,7 +76,7 @@ class TreeStepModelSerializer(serializers.ModelSerializer):
     """
 
     solution = SolutionModelSerializer(read_only=True, required=False)
-    options = OptionModelSerializer(many=True, read_only=True)
+    options = TreeOptionModelSerializer(many=True, read_only=True)
 
     class Meta:
         model = Step
@@ -53,6 +88,19 @@ class TreeStepModelSerializer(serializers.ModelSerializer):
         )
 
 
+class TreeStepQuerySerializer(serializers.Serializer):
+    """Query serializer for displaying specific step of the tree."""
+
+    depth = serializers.IntegerField(
+        min_value=0,
+        max_value=MAX_LOOKAHEAD_DEPTH,
+        default=0,
+    )
+
+    class Meta:
+        fields = ("depth",)
+
+
 class StepCreateSerializer(serializers.Serializer):
     """Write only step serializer for creating instances."""
 
@@ -66,13 +114,37 @@ class StepCreateSerializer(serializers.Serializer):
         allow_null=True,
     )
     path = serializers.PrimaryKeyRelatedField(queryset=Path.objects.all())
-    preceding_options = serializers.PrimaryKeyRelatedField(
-        queryset=Option.objects.all(),
-        many=True,
+    preceding_options = serializers.ListField(
+        child=serializers.UUIDField(),
         required=False,
         allow_null=True,
     )
 
+    def validate_preceding_options(
+        self,
+        option_pks: Optional[list[UUID]],
+    ) -> list[Option]:
+        """Load the preceding options with a single query.
+
+        Args:
+            option_pks (Optional[list[UUID]]): primary keys of the options.
+
+        Raises:
+            ValidationError: if any of the options does not exist.
+
+        Returns:
+            list[Option]: preceding options.
+        """
+        unique_pks = set(option_pks or ())
+        options = Option.objects.in_bulk(unique_pks)
+        missing_pks = sorted(map(str, unique_pks - options.keys()))
+        if missing_pks:
+            listed_pks = ", ".join(missing_pks)
+            raise serializers.ValidationError(
+                f"Unknown options: {listed_pks}.",
+            )
+        return list(options.values())
+
     def validate(self, data: dict) -> dict:
         """Check the model constrains.
 
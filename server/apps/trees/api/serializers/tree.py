@@ -2,15 +2,23 @@
 
 from rest_framework import serializers
 
+from server.apps.trees.api.serializers.mixins import SparseFieldsetsMixin
 from server.apps.trees.api.serializers.path import PathModelSerializer
+from server.apps.trees.api.serializers.step import TreeStepModelSerializer
 from server.apps.trees.models import NAME_MAX_LENGTH, Path, Tree
 
 
-class TreeModelSerializer(serializers.ModelSerializer):
+class TreeModelSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     """Read only tree model serializer with nested instances."""
 
     paths = PathModelSerializer(many=True, read_only=True)
     author = serializers.CharField(source="creator.username")
+    paths_count = serializers.IntegerField(read_only=True)
+    steps_count = serializers.IntegerField(read_only=True)
+    options_count = serializers.IntegerField(read_only=True)
+    solutions_count = serializers.IntegerField(read_only=True)
+    max_depth = serializers.IntegerField(read_only=True)
+    average_depth = serializers.FloatField(read_only=True)
 
     class Meta:
         model = Tree
@@ -20,6 +28,12 @@ class TreeModelSerializer(serializers.ModelSerializer):
             "description",
             "paths",
             "author",
+            "paths_count",
+            "steps_count",
+            "options_count",
+            "solutions_count",
+            "max_depth",
+            "average_depth",
         )
 
 
@@ -46,3 +60,28 @@ class TreeUpdateSerializer(serializers.Serializer):
 
     class Meta:
         fields = ("name", "description", "paths")
+
+
+class TreeAnswersSerializer(serializers.Serializer):
+    """Query serializer for the answers given while walking the tree."""
+
+    answers = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+    )
+
+    class Meta:
+        fields = ("answers",)
+
+
+class TreeWalkSerializer(serializers.Serializer):
+    """Read only serializer for the result of walking the tree."""
+
+    step = TreeStepModelSerializer(read_only=True)
+    visited_steps = serializers.ListField(
+        child=serializers.CharField(),
+        read_only=True,
+    )
+
+    class Meta:
+        fields = ("step", "visited_steps")
@@ -0,0 +1,164 @@
+"""Tree batch edit related serializers."""
+
+from types import MappingProxyType
+
+from rest_framework import serializers
+
+from server.apps.trees.api.serializers.tree_import import check_unique
+from server.apps.trees.models import NAME_MAX_LENGTH
+from server.apps.trees.services.tree_batch import (
+    BATCH_MODELS,
+    CREATE,
+    DELETE,
+    UPDATE,
+)
+
+MAX_BATCH_OPERATIONS = 1000
+UPDATE_FIELDS = MappingProxyType(
+    {
+        "path": frozenset(("name",)),
+        "step": frozenset(("name",)),
+        "option": frozenset(("name", "next_step")),
+    },
+)
+
+
+class PathBatchSerializer(serializers.Serializer):
+    """Write only serializer for the path data of the operation."""
+
+    name = serializers.CharField(max_length=NAME_MAX_LENGTH)
+
+    class Meta:
+        fields = ("name",)
+
+
+class StepBatchSerializer(serializers.Serializer):
+    """Write only serializer for the step data of the operation."""
+
+    name = serializers.CharField(max_length=NAME_MAX_LENGTH)
+    path = serializers.CharField()
+    is_first = serializers.BooleanField(default=False)
+    is_final = serializers.BooleanField(default=False)
+    solution = serializers.CharField(required=False, allow_null=True)
+
+    class Meta:
+        fields = ("name", "path", "is_first", "is_final", "solution")
+
+
+class OptionBatchSerializer(serializers.Serializer):
+    """Write only serializer for the option data of the operation."""
+
+    name = serializers.CharField(max_length=NAME_MAX_LENGTH)
+    step = serializers.CharField()
+    next_step = serializers.CharField(required=False, allow_null=True)
+
+    class Meta:
+        fields = ("name", "step", "next_step")
+
+
+DATA_SERIALIZERS: MappingProxyType[
+    str,
+    type[serializers.Serializer],
+] = MappingProxyType(
+    {
+        "path": PathBatchSerializer,
+        "step": StepBatchSerializer,
+        "option": OptionBatchSerializer,
+    },
+)
+
+
+class BatchOperationSerializer(serializers.Serializer):
+    """Write only serializer for the single operation of the batch.
+
+    Created instances can be given the temporary ids, used by the later
+    operations in place of the primary keys.
+    """
+
+    op = serializers.ChoiceField(choices=(CREATE, UPDATE, DELETE))
+    model = serializers.ChoiceField(choices=tuple(BATCH_MODELS))
+    id = serializers.CharField(required=False)
+    pk = serializers.CharField(required=False)
+    data = serializers.DictField(default=dict)
+
+    def validate(self, data: dict) -> dict:
+        """Check the operation refers to the instance and validate its data.
+
+        Args:
+            data (dict): data to validate.
+
+        Raises:
+            ValidationError: if the created instance has the primary key,
+                if the changed instance has no primary key,
+                or the data has fields that cannot be updated.
+
+        Returns:
+            dict: data after validation.
+        """
+        if (data["op"] == CREATE) == ("pk" in data):
+            raise serializers.ValidationError(
+                "Only the updated and deleted instances have primary keys.",
+            )
+        if data["op"] == DELETE:
+            data["data"] = {}
+            return data
+        update_fields = UPDATE_FIELDS[data["model"]]
+        if data["op"] == UPDATE and not update_fields.issuperset(data["data"]):
+            listed_fields = ", ".join(sorted(update_fields))
+            raise serializers.ValidationError(
+                f"Only these fields can be updated: {listed_fields}.",
+            )
+        data_serializer = DATA_SERIALIZERS[data["model"]](
+            data=data["data"],
+            partial=data["op"] == UPDATE,
+        )
+        data_serializer.is_valid(raise_exception=True)
+        data["data"] = data_serializer.validated_data
+        return data
+
+    class Meta:
+        fields = ("op", "model", "id", "pk", "data")
+
+
+class TreeBatchSerializer(serializers.Serializer):
+    """Write only serializer for the ordered operations of the batch."""
+
+    operations = BatchOperationSerializer(many=True, allow_empty=False)
+
+    def validate_operations(self, operations: list[dict]) -> list[dict]:
+        """Check the batch size and the temporary ids are unique.
+
+        Args:
+            operations (list[dict]): operations of the batch.
+
+        Raises:
+            ValidationError: if the batch has too many operations.
+
+        Returns:
+            list[dict]: operations after validation.
+        """
+        if len(operations) > MAX_BATCH_OPERATIONS:
+            raise serializers.ValidationError(
+                f"Batch can have at most {MAX_BATCH_OPERATIONS} operations.",
+            )
+        check_unique(
+            (operation["id"] for operation in operations if "id" in operation),
+            "ids",
+        )
+        return operations
+
+    class Meta:
+        fields = ("operations",)
+
+
+class TreeBatchResultSerializer(serializers.Serializer):
+    """Read only serializer for the result of the batch."""
+
+    mapping = serializers.DictField(
+        child=serializers.UUIDField(),
+        read_only=True,
+    )
+    trees = serializers.ListField(child=serializers.UUIDField(), read_only=True)
+
+    class Meta:
+        fields = ("mapping", "trees")
@@ -0,0 +1,234 @@
+"""Tree import related serializers."""
+
+from collections import Counter
+from typing import Iterable
+
+from rest_framework import serializers
+
+from server.apps.trees.models import NAME_MAX_LENGTH
+
+
+def check_unique(names: Iterable[str], label: str) -> None:
+    """Check the names are unique.
+
+    Args:
+        names (Iterable[str]): names to check.
+        label (str): label of the names used in the error message.
+
+    Raises:
+        ValidationError: if any of the names occurs more than once.
+    """
+    counts = Counter(names)
+    duplicates = sorted(name for name in counts if counts[name] > 1)
+    if duplicates:
+        listed_names = ", ".join(duplicates)
+        raise serializers.ValidationError(
+            f"Duplicated {label}: {listed_names}.",
+        )
+
+
+class SolutionImportSerializer(serializers.Serializer):
+    """Write only serializer for the solution of the imported tree."""
+
+    id = serializers.CharField()
+    name = serializers.CharField(max_length=NAME_MAX_LENGTH)
+    description = serializers.CharField()
+
+    class Meta:
+        fields = ("id", "name", "description")
+
+
+class OptionImportSerializer(serializers.Serializer):
+    """Write only serializer for the option of the imported tree."""
+
+    id = serializers.CharField(required=False)
+    name = serializers.CharField(max_length=NAME_MAX_LENGTH)
+    next_step = serializers.CharField(required=False, allow_null=True)
+
+    class Meta:
+        fields = ("id", "name", "next_step")
+
+
+class StepImportSerializer(serializers.Serializer):
+    """Write only serializer for the step of the imported tree."""
+
+    id = serializers.CharField()
+    name = serializers.CharField(max_length=NAME_MAX_LENGTH)
+    is_first = serializers.BooleanField(default=False)
+    is_final = serializers.BooleanField(default=False)
+    solution = serializers.CharField(required=False, allow_null=True)
+    options = OptionImportSerializer(many=True, default=list)
+
+    def validate_options(self, options: list[dict]) -> list[dict]:
+        """Check the option names are unique within the step.
+
+        Args:
+            options (list[dict]): options of the step.
+
+        Returns:
+            list[dict]: options after validation.
+        """
+        check_unique((option["name"] for option in options), "option names")
+        return options
+
+    def validate(self, data: dict) -> dict:
+        """Check the model constrains.
+
+        Args:
+            data (dict): data to validate.
+
+        Raises:
+            ValidationError: if step is both first and final,
+                if solution is set on non-final step,
+                if there is no solution on final step,
+                or the option leads to its own step.
+
+        Returns:
+            dict: data after validation.
+        """
+        next_steps = {option.get("next_step") for option in data["options"]}
+        if data["id"] in next_steps:
+            raise serializers.ValidationError(
+                "A step cannot be the same as the next step.",
+            )
+        if data["is_first"] and data["is_final"]:
+            raise serializers.ValidationError(
+                "A step cannot be both first and final.",
+            )
+        if data["is_final"] == (data.get("solution") is None):
+            raise serializers.ValidationError(
+                "A solution can only be (and has to be) set on the final step.",
+            )
+        return data
+
+    class Meta:
+        fields = (
+            "id",
+            "name",
+            "is_first",
+            "is_final",
+            "solution",
+            "options",
+        )
+
+
+class PathImportSerializer(serializers.Serializer):
+    """Write only serializer for the path of the imported tree."""
+
+    id = serializers.CharField(required=False)
+    name = serializers.CharField(max_length=NAME_MAX_LENGTH)
+    steps = StepImportSerializer(many=True)
+
+    def validate_steps(self, steps: list[dict]) -> list[dict]:
+        """Check the step names are unique within the path.
+
+        Args:
+            steps (list[dict]): steps of the path.
+
+        Returns:
+            list[dict]: steps after validation.
+        """
+        check_unique((step["name"] for step in steps), "step names")
+        return steps
+
+    class Meta:
+        fields = ("id", "name", "steps")
+
+
+class TreeImportSerializer(serializers.Serializer):
+    """Write only serializer for the whole tree document.
+
+    Solutions, paths, steps and options are identified by the ids local
+    to the document, steps refer to the solutions and options refer
+    to the next steps with these ids. The document is validated
+    in memory, the names taken by the saved rows are checked
+    when the instances are validated in batches by the import.
+    """
+
+    name = serializers.CharField(max_length=NAME_MAX_LENGTH)
+    description = serializers.CharField()
+    solutions = SolutionImportSerializer(many=True, default=list)
+    paths = PathImportSerializer(many=True)
+
+    def validate_paths(self, paths: list[dict]) -> list[dict]:
+        """Check the path names are unique within the document.
+
+        Args:
+            paths (list[dict]): paths of the tree.
+
+        Returns:
+            list[dict]: paths after validation.
+        """
+        check_unique((path["name"] for path in paths), "path names")
+        return paths
+
+    def validate(self, data: dict) -> dict:
+        """Check the document ids are unique and all the references exist.
+
+        Args:
+            data (dict): data to validate.
+
+        Returns:
+            dict: data after validation.
+        """
+        steps = [step for path in data["paths"] for step in path["steps"]]
+        options = [option for step in steps for option in step["options"]]
+        check_unique(
+            (
+                entry["id"]
+                for entry in (
+                    *data["solutions"],
+                    *data["paths"],
+                    *steps,
+                    *options,
+                )
+                if "id" in entry
+            ),
+            "ids",
+        )
+        self.validate_references(data["solutions"], steps)
+        return data
+
+    def validate_references(
+        self,
+        solutions: list[dict],
+        steps: list[dict],
+    ) -> None:
+        """Check the steps and options refer to the existing ids.
+
+        Args:
+            solutions (list[dict]): all the solutions of the tree.
+            steps (list[dict]): all the steps of the tree.
+
+        Raises:
+            ValidationError: if the steps and options refer
+                to missing instances.
+        """
+        missing_ids: set[str] = {
+            step["solution"] for step in steps if step.get("solution")
+        } - {solution["id"] for solution in solutions}
+        missing_ids |= {
+            option["next_step"]
+            for step in steps
+            for option in step["options"]
+            if option.get("next_step")
+        } - {step["id"] for step in steps}
+        if missing_ids:
+            listed_ids = ", ".join(sorted(missing_ids))
+            raise serializers.ValidationError(f"Unknown ids: {listed_ids}.")
+
+    class Meta:
+        fields = ("name", "description", "solutions", "paths")
+
+
+class TreeImportResultSerializer(serializers.Serializer):
+    """Read only serializer for the primary keys of the imported tree."""
+
+    tree = serializers.UUIDField(read_only=True)
+    mapping = serializers.DictField(
+        child=serializers.UUIDField(),
+        read_only=True,
+    )
+
+    class Meta:
+        fields = ("tree", "mapping")
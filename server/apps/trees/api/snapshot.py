@@ -0,0 +1,57 @@
+"""Snapshot action of the trees API."""
+
+from uuid import UUID
+
+from django.http import HttpResponse
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.request import Request
+
+from server.apps.trees.api.schema import extend_snapshot_schema
+from server.apps.trees.snapshot import TreeSnapshot
+
+
+class TreeSnapshotMixin:
+    """Add the snapshot action to a tree view.
+
+    Snapshot holds the whole graph of the tree, so the clients
+    can traverse it offline.
+    """
+
+    @extend_snapshot_schema
+    @action(detail=True, methods=["get"])
+    def snapshot(
+        self: viewsets.ModelViewSet,
+        request: Request,
+        pk: UUID,
+    ) -> HttpResponse:
+        """Return response with the whole graph of the tree.
+
+        Snapshot is versioned with the ETag header, so the clients
+        can traverse the tree offline and download it again after edits.
+
+        Args:
+            request (Request): incomming request.
+            pk (UUID): primary key of the tree.
+
+        Returns:
+            HttpResponse: response with the snapshot document,
+                gzipped if the client accepts it,
+                or empty response if the client has the current version.
+        """
+        tree = self.get_object()
+        gzipped = "gzip" in request.headers.get("Accept-Encoding", "")
+        if_none_match = request.headers.get("If-None-Match", "")
+        if TreeSnapshot.is_current(tree, if_none_match):
+            http_response = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            http_response = HttpResponse(
+                TreeSnapshot.content(tree, gzipped),
+                content_type="application/json",
+            )
+            if gzipped:
+                http_response["Content-Encoding"] = "gzip"
+        # Version of the tree is read again, once the snapshot is built.
+        http_response["ETag"] = TreeSnapshot.etag(tree)
+        http_response["Vary"] = "Accept-Encoding"
+        return http_response
@@ -3,11 +3,15 @@
 from django.urls import include, path
 from rest_framework import routers
 
+from server.apps.trees.api.views.inconsistency import InconsistencyViewSet
 from server.apps.trees.api.views.option import OptionViewSet
 from server.apps.trees.api.views.path import PathViewSet
+from server.apps.trees.api.views.search import SearchViewSet, TypeaheadViewSet
 from server.apps.trees.api.views.solution import SolutionViewSet
 from server.apps.trees.api.views.step import StepViewSet
 from server.apps.trees.api.views.tree import TreeViewSet
+from server.apps.trees.api.views.tree_batch import TreeBatchViewSet
+from server.apps.trees.api.views.tree_import import TreeImportViewSet
 
 app_name = "trees"
 
@@ -17,6 +21,15 @@ router.register("solutions", SolutionViewSet, basename="solutions")
 router.register("options", OptionViewSet, basename="options")
 router.register("steps", StepViewSet, basename="steps")
 router.register("paths", PathViewSet, basename="paths")
+router.register(
+    "inconsistencies",
+    InconsistencyViewSet,
+    basename="inconsistencies",
+)
+router.register("import", TreeImportViewSet, basename="import")
+router.register("batch", TreeBatchViewSet, basename="batch")
+router.register("search", SearchViewSet, basename="search")
+router.register("typeahead", TypeaheadViewSet, basename="typeahead")
 router.register("", TreeViewSet, basename="trees")
 
 urlpatterns = [
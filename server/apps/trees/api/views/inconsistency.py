@@ -0,0 +1,45 @@
+"""Inconsistency model related views."""
+
+from django.db.models import QuerySet
+from rest_framework import viewsets
+
+from server.apps.trees.api.permissions import IsSuperuserOrReadOnly
+from server.apps.trees.api.schema import extend_inconsistency_schema
+from server.apps.trees.api.serializers.inconsistency import (
+    InconsistencyModelSerializer,
+    InconsistencyQuerySerializer,
+)
+from server.apps.trees.derived_models import Inconsistency
+
+
+@extend_inconsistency_schema
+class InconsistencyViewSet(viewsets.ReadOnlyModelViewSet):
+    """Read only viewset for the inconsistencies found by the scanner."""
+
+    queryset = Inconsistency.objects.all()
+    serializer_class = InconsistencyModelSerializer
+    permission_classes = (IsSuperuserOrReadOnly,)
+
+    def filter_queryset(
+        self,
+        queryset: QuerySet[Inconsistency],
+    ) -> QuerySet[Inconsistency]:
+        """Filter the inconsistencies by the tree and the kind.
+
+        Args:
+            queryset (QuerySet[Inconsistency]): inconsistencies to filter.
+
+        Returns:
+            QuerySet[Inconsistency]: filtered inconsistencies.
+        """
+        query_serializer = InconsistencyQuerySerializer(
+            data=self.request.query_params,
+        )
+        query_serializer.is_valid(raise_exception=True)
+        return (
+            super()
+            .filter_queryset(queryset)
+            .filter(
+                **query_serializer.validated_data,
+            )
+        )
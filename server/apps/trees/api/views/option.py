@@ -2,8 +2,10 @@
 
 from rest_framework import viewsets
 
+from server.apps.trees.api.fieldsets import SparseReadQuerysetMixin
 from server.apps.trees.api.mixins import SerializerPerActionMixin
 from server.apps.trees.api.permissions import IsSuperuserOrReadOnly
+from server.apps.trees.api.schema import extend_sparse_fieldsets_schema
 from server.apps.trees.api.serializers.option import (
     OptionCreateSerializer,
     OptionModelSerializer,
@@ -17,13 +19,16 @@ from server.apps.trees.services.option import (
 )
 
 
+@extend_sparse_fieldsets_schema
 class OptionViewSet(
     SerializerPerActionMixin,
+    SparseReadQuerysetMixin,
     viewsets.ModelViewSet,
 ):
     """Crud viewset for Option model."""
 
     queryset = Option.objects.all()
+    read_queryset = Option.objects.all()
     serializer_classes = {
         "default": OptionModelSerializer,
         "create": OptionCreateSerializer,
@@ -2,13 +2,16 @@
 
 from rest_framework import viewsets
 
+from server.apps.trees.api.fieldsets import SparseReadQuerysetMixin
 from server.apps.trees.api.mixins import SerializerPerActionMixin
 from server.apps.trees.api.permissions import IsSuperuserOrReadOnly
+from server.apps.trees.api.schema import extend_sparse_fieldsets_schema
 from server.apps.trees.api.serializers.path import (
     PathInputSerializer,
     PathModelSerializer,
 )
 from server.apps.trees.models import Path
+from server.apps.trees.selectors import PathSelector
 from server.apps.trees.services.path import (
     PathCreatePayload,
     PathService,
@@ -16,13 +19,16 @@ from server.apps.trees.services.path import (
 )
 
 
+@extend_sparse_fieldsets_schema
 class PathViewSet(
     SerializerPerActionMixin,
+    SparseReadQuerysetMixin,
     viewsets.ModelViewSet,
 ):
     """Crud viewset for Path model."""
 
     queryset = Path.objects.all()
+    read_selector = PathSelector.with_nested
     serializer_classes = {
         "default": PathModelSerializer,
         "create": PathInputSerializer,
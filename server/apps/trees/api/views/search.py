@@ -0,0 +1,94 @@
+"""Full-text search related views."""
+
+from rest_framework import response, viewsets
+from rest_framework.request import Request
+
+from server.apps.trees.api.permissions import IsSuperuserOrReadOnly
+from server.apps.trees.api.schema import (
+    extend_search_schema,
+    extend_typeahead_schema,
+)
+from server.apps.trees.api.serializers.search import (
+    NAMED_MODELS,
+    SearchQuerySerializer,
+    SearchResultSerializer,
+    SimilarNameSerializer,
+    TypeaheadQuerySerializer,
+)
+from server.apps.trees.models import Solution, Tree
+from server.apps.trees.selectors import SearchSelector
+
+
+class SearchViewSet(viewsets.GenericViewSet):
+    """Viewset for searching the trees and solutions by their text."""
+
+    serializer_class = SearchResultSerializer
+    permission_classes = (IsSuperuserOrReadOnly,)
+    pagination_class = None
+
+    @extend_search_schema
+    def list(self, request: Request) -> response.Response:
+        """Find the trees and solutions best matching the text.
+
+        Names are ranked above the descriptions, and the number
+        of the matches of each model is limited.
+
+        Args:
+            request (Request): incomming request.
+
+        Returns:
+            Response: response with the ranked trees and solutions.
+        """
+        query_serializer = SearchQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        text = query_serializer.validated_data["query"]
+        limit = query_serializer.validated_data["limit"]
+        return response.Response(
+            self.get_serializer(
+                {
+                    "trees": SearchSelector.search(
+                        Tree.objects.only("name"),
+                        text,
+                        limit,
+                    ),
+                    "solutions": SearchSelector.search(
+                        Solution.objects.only("name"),
+                        text,
+                        limit,
+                    ),
+                },
+            ).data,
+        )
+
+
+class TypeaheadViewSet(viewsets.GenericViewSet):
+    """Viewset for looking up the step and option names as they are typed."""
+
+    serializer_class = SimilarNameSerializer
+    permission_classes = (IsSuperuserOrReadOnly,)
+    pagination_class = None
+
+    @extend_typeahead_schema
+    def list(self, request: Request) -> response.Response:
+        """Find the existing names most similar to the typed one.
+
+        Args:
+            request (Request): incomming request.
+
+        Returns:
+            Response: response with the distinct names, most similar first.
+        """
+        query_serializer = TypeaheadQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        query = query_serializer.validated_data
+        names = SearchSelector.similar_names(
+            NAMED_MODELS[query["model"]],
+            {
+                scope_name: query[scope_name]
+                for scope_name in ("path", "tree")
+                if scope_name in query
+            },
+            query["query"],
+            query["limit"],
+        )
+        return response.Response(self.get_serializer(names, many=True).data)
@@ -2,13 +2,17 @@
 
 from rest_framework import viewsets
 
+from server.apps.trees.api.conditional import solution_etag_condition
+from server.apps.trees.api.fieldsets import SparseReadQuerysetMixin
 from server.apps.trees.api.mixins import SerializerPerActionMixin
 from server.apps.trees.api.permissions import IsSuperuserOrReadOnly
+from server.apps.trees.api.schema import extend_sparse_fieldsets_schema
 from server.apps.trees.api.serializers.solution import (
+    SolutionDetailSerializer,
     SolutionInputSerializer,
-    SolutionModelSerializer,
 )
 from server.apps.trees.models import Solution
+from server.apps.trees.selectors import SolutionSelector
 from server.apps.trees.services.solution import (
     SolutionCreatePayload,
     SolutionService,
@@ -16,15 +20,19 @@ from server.apps.trees.services.solution import (
 )
 
 
+@extend_sparse_fieldsets_schema
+@solution_etag_condition
 class SolutionViewSet(
     SerializerPerActionMixin,
+    SparseReadQuerysetMixin,
     viewsets.ModelViewSet,
 ):
     """Crud viewset for Solution model."""
 
     queryset = Solution.objects.all()
+    read_queryset = SolutionSelector.with_creator()
     serializer_classes = {
-        "default": SolutionModelSerializer,
+        "default": SolutionDetailSerializer,
         "create": SolutionInputSerializer,
         "update": SolutionInputSerializer,
         "partial_update": SolutionInputSerializer,
@@ -2,14 +2,17 @@
 
 from rest_framework import viewsets
 
+from server.apps.trees.api.fieldsets import SparseReadQuerysetMixin
 from server.apps.trees.api.mixins import SerializerPerActionMixin
 from server.apps.trees.api.permissions import IsSuperuserOrReadOnly
+from server.apps.trees.api.schema import extend_sparse_fieldsets_schema
 from server.apps.trees.api.serializers.step import (
     StepCreateSerializer,
     StepModelSerializer,
     StepUpdateSerializer,
 )
 from server.apps.trees.models import Step
+from server.apps.trees.selectors import StepSelector
 from server.apps.trees.services.step import (
     StepCreatePayload,
     StepService,
@@ -17,13 +20,16 @@ from server.apps.trees.services.step import (
 )
 
 
+@extend_sparse_fieldsets_schema
 class StepViewSet(
     SerializerPerActionMixin,
+    SparseReadQuerysetMixin,
     viewsets.ModelViewSet,
 ):
     """Crud viewset for Step model."""
 
     queryset = Step.objects.all()
+    read_selector = StepSelector.with_nested
     serializer_classes = {
         "default": StepModelSerializer,
         "create": StepCreateSerializer,
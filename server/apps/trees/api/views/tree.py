@@ -1,19 +1,28 @@
 """Tree model related views."""
 
-
 from rest_framework import viewsets
 
+from server.apps.trees.api.cohesion import TreeCohesionMixin
+from server.apps.trees.api.fieldsets import SparseReadQuerysetMixin
+from server.apps.trees.api.filters import StableOrderingFilter
 from server.apps.trees.api.mixins import (
     SerializerPerActionMixin,
+    TraversalQuerysetMixin,
     TreeStepsMixin,
 )
 from server.apps.trees.api.permissions import IsSuperuserOrReadOnly
+from server.apps.trees.api.schema import extend_sparse_fieldsets_schema
 from server.apps.trees.api.serializers.tree import (
     TreeCreateSerializer,
     TreeModelSerializer,
     TreeUpdateSerializer,
 )
-from server.apps.trees.models import Tree
+from server.apps.trees.api.snapshot import TreeSnapshotMixin
+from server.apps.trees.selectors import (
+    STATISTICS_FIELDS,
+    TreeSelector,
+    TreeStatisticsSelector,
+)
 from server.apps.trees.services.tree import (
     TreeCreatePayload,
     TreeService,
@@ -21,14 +30,26 @@ from server.apps.trees.services.tree import (
 )
 
 
-class TreeViewSet(
+@extend_sparse_fieldsets_schema
+class TreeViewSet(  # noqa: WPS215
     SerializerPerActionMixin,
+    TraversalQuerysetMixin,
+    SparseReadQuerysetMixin,
     viewsets.ModelViewSet,
     TreeStepsMixin,
+    TreeSnapshotMixin,
+    TreeCohesionMixin,
 ):
-    """Crud viewset for Tree model."""
+    """Crud viewset for Tree model.
+
+    Trees are listed with their statistics, which they can be ordered by.
+    Traversal actions look up only the stored first step of the tree.
+    """
 
-    queryset = Tree.objects.all()
+    queryset = TreeStatisticsSelector.with_statistics()
+    read_selector = TreeSelector.with_nested
+    filter_backends = (StableOrderingFilter,)
+    ordering_fields = ("created_at", *STATISTICS_FIELDS)
     serializer_classes = {
         "default": TreeModelSerializer,
         "create": TreeCreateSerializer,
@@ -0,0 +1,54 @@
+"""Tree batch edit related views."""
+
+from django.core.exceptions import ValidationError
+from rest_framework import response, serializers, status, viewsets
+from rest_framework.request import Request
+
+from server.apps.trees.api.permissions import IsSuperuserOrReadOnly
+from server.apps.trees.api.schema import extend_batch_schema
+from server.apps.trees.api.serializers.tree_batch import (
+    TreeBatchResultSerializer,
+    TreeBatchSerializer,
+)
+from server.apps.trees.services.tree_batch import (
+    TreeBatchPayload,
+    TreeBatchService,
+)
+
+
+class TreeBatchViewSet(viewsets.GenericViewSet):
+    """Viewset for editing the paths, steps and options in batches."""
+
+    serializer_class = TreeBatchSerializer
+    permission_classes = (IsSuperuserOrReadOnly,)
+
+    @extend_batch_schema
+    def create(self, request: Request) -> response.Response:
+        """Apply the ordered operations of the batch within a transaction.
+
+        Args:
+            request (Request): incomming request.
+
+        Raises:
+            ValidationError: if any of the operations is invalid.
+
+        Returns:
+            Response: response with primary keys of the created instances,
+                keyed by their temporary ids, and of the affected trees.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        payload = TreeBatchPayload(
+            creator=request.user,
+            **serializer.validated_data,
+        )
+        try:
+            mapping, tree_pks = TreeBatchService.apply_batch(payload)
+        except ValidationError as error:
+            raise serializers.ValidationError(error.messages)
+        return response.Response(
+            status=status.HTTP_200_OK,
+            data=TreeBatchResultSerializer(
+                {"mapping": mapping, "trees": sorted(tree_pks)},
+            ).data,
+        )
@@ -0,0 +1,57 @@
+"""Tree import related views."""
+
+from django.core.exceptions import ValidationError
+from rest_framework import response, serializers, status, viewsets
+from rest_framework.request import Request
+
+from server.apps.trees.api.permissions import IsSuperuserOrReadOnly
+from server.apps.trees.api.schema import extend_import_schema
+from server.apps.trees.api.serializers.tree_import import (
+    TreeImportResultSerializer,
+    TreeImportSerializer,
+)
+from server.apps.trees.services.tree_import import (
+    TreeImportPayload,
+    TreeImportService,
+)
+
+
+class TreeImportViewSet(viewsets.GenericViewSet):
+    """Viewset for importing whole trees at once."""
+
+    serializer_class = TreeImportSerializer
+    permission_classes = (IsSuperuserOrReadOnly,)
+
+    @extend_import_schema
+    def create(self, request: Request) -> response.Response:
+        """Create the tree with all its instances from a single document.
+
+        The document is validated in memory and written within
+        a single transaction, with the instances inserted in bulk.
+
+        Args:
+            request (Request): incomming request.
+
+        Raises:
+            ValidationError: if the names are taken by the saved rows.
+
+        Returns:
+            Response: response with primary keys of the tree
+                and of the instances, keyed by their document ids.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        payload = TreeImportPayload(
+            creator=request.user,
+            **serializer.validated_data,
+        )
+        try:
+            tree, mapping = TreeImportService.import_tree(payload)
+        except ValidationError as error:
+            raise serializers.ValidationError(error.messages)
+        return response.Response(
+            status=status.HTTP_201_CREATED,
+            data=TreeImportResultSerializer(
+                {"tree": tree.pk, "mapping": mapping},
+            ).data,
+        )
@@ -0,0 +1,177 @@
+"""Cohesion validation of the tree graphs."""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+from server.apps.trees.graph import TreeGraph
+from server.apps.trees.models import Option, Step
+
+CYCLE = "cycle"
+UNREACHABLE = "unreachable"
+OUTSIDE_TREE = "outside_tree"
+DEAD_END = "dead_end"
+
+Edge = tuple[Option, Step]
+ResolvedOption = tuple[Option, Optional[Step]]
+
+
+@dataclass
+class CohesionIssue:
+    """Problem of the tree graph, found on the merged step."""
+
+    kind: str
+    message: str
+    step_name: Optional[str] = None
+    option: Optional[Option] = None
+
+
+@dataclass
+class CohesionValidator:
+    """Validate the steps and options of the tree graph fit together.
+
+    Walks lead from the first step through the options of the merged
+    steps, and end on the final steps. The graph is cohesive when every
+    step is reachable, every option leads to a step of the tree, walks
+    cannot loop and every non-final step has an option to choose.
+    Each check visits every step and option once, so the whole graph
+    is validated in linear time, O(V+E) in the steps and options.
+    """
+
+    graph: TreeGraph
+    issues: list[CohesionIssue] = field(default_factory=list)
+    resolved_edges: dict[str, list[ResolvedOption]] = field(
+        default_factory=dict,
+    )
+
+    def validate(self) -> list[CohesionIssue]:
+        """Validate the whole graph.
+
+        Change of a single step or option affects the steps its options
+        led to before, or the merged step the renamed step belonged to,
+        which the graph does not know, so no region is validated alone.
+
+        Returns:
+            list[CohesionIssue]: found issues.
+        """
+        finished: set[str] = set()
+        for node_name in sorted(self.graph.nodes):
+            self.check_step(node_name)
+        for step_name in sorted(self.graph.nodes):
+            if step_name not in finished:
+                self.search_cycles(step_name, finished)
+        self.check_reachability()
+        return self.issues
+
+    def edges(self, step_name: str, with_final: bool = False) -> Iterator[Edge]:
+        """Iterate over the options leading to the steps of the tree.
+
+        Options of each merged step are resolved once per validation.
+
+        Args:
+            step_name (str): name of the merged step.
+            with_final (bool): indicates if the options leading
+                to the final steps, which end the walk, are included.
+
+        Returns:
+            Iterator[Edge]: options and the steps they lead to.
+        """
+        if step_name not in self.resolved_edges:
+            self.resolved_edges[step_name] = [
+                (option, self.graph.steps.get(option.next_step_id))
+                for option in self.graph.nodes[step_name].options
+            ]
+        return (
+            (option, next_step)
+            for option, next_step in self.resolved_edges[step_name]
+            if next_step is not None and (with_final or not next_step.is_final)
+        )
+
+    def check_step(self, step_name: str) -> None:
+        """Check the options of the merged step lead to the tree steps.
+
+        Args:
+            step_name (str): name of the merged step.
+        """
+        node = self.graph.nodes[step_name]
+        for option in node.options:
+            if option.next_step_id is None:
+                message = f'The option "{option.name}" does not lead to a step.'
+                self.issues.append(
+                    CohesionIssue(DEAD_END, message, step_name, option),
+                )
+            elif option.next_step_id not in self.graph.steps:
+                message = f'The option "{option.name}" leads outside the tree.'
+                self.issues.append(
+                    CohesionIssue(OUTSIDE_TREE, message, step_name, option),
+                )
+        if not node.options and not node.is_final:
+            message = f'The step "{step_name}" is not final and has no options.'
+            self.issues.append(CohesionIssue(DEAD_END, message, step_name))
+
+    def search_cycles(self, root_name: str, finished: set[str]) -> None:
+        """Search the steps reachable from the root for the loops.
+
+        Steps on the current path of the search are kept in the insertion
+        order, with the iterators over their remaining options.
+
+        Args:
+            root_name (str): name of the merged step to start from.
+            finished (set[str]): names of the steps searched already,
+                extended with the steps searched from the root.
+        """
+        visiting = {root_name: self.edges(root_name)}
+        while visiting:
+            step_name = next(reversed(visiting))
+            edge = next(visiting[step_name], None)
+            if edge is None:
+                visiting.popitem()
+                finished.add(step_name)
+                continue
+            option, next_step = edge
+            if next_step.name in visiting:
+                self.issues.append(
+                    CohesionIssue(
+                        CYCLE,
+                        f'The option "{option.name}" leads back to a step.',
+                        step_name,
+                        option,
+                    ),
+                )
+            elif next_step.name not in finished:
+                visiting[next_step.name] = self.edges(  # noqa: WPS529
+                    next_step.name,
+                )
+
+    def check_reachability(self) -> None:
+        """Find the steps not reachable from the first step."""
+        if self.graph.first_step_name is None:
+            self.issues.append(
+                CohesionIssue(UNREACHABLE, "The tree has no first step."),
+            )
+            return
+        unreached = set(self.graph.nodes) - {self.graph.first_step_name}
+        self.discard_reached(unreached)
+        for step_name in sorted(unreached):
+            message = f'The step "{step_name}" cannot be reached.'
+            self.issues.append(
+                CohesionIssue(UNREACHABLE, message, step_name),
+            )
+
+    def discard_reached(self, unreached: set[str]) -> None:
+        """Walk from the first step with breadth-first search.
+
+        Search stops as soon as all the steps are reached.
+
+        Args:
+            unreached (set[str]): names of the merged steps to reach,
+                the reached ones are discarded.
+        """
+        queue = deque([self.graph.first_step_name])
+        expanded = set(queue)
+        while queue and unreached:
+            for _, next_step in self.edges(queue.popleft(), with_final=True):
+                unreached.discard(next_step.name)
+                if not next_step.is_final and next_step.name not in expanded:
+                    expanded.add(next_step.name)
+                    queue.append(next_step.name)
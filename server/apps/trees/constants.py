@@ -0,0 +1,3 @@
+"""Constants shared by the trees app models."""
+
+NAME_MAX_LENGTH = 63
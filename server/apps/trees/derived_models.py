@@ -0,0 +1,190 @@
+"""Trees app models of the data derived from the trees.
+
+Models refer to the trees, steps and options by their names,
+as the trees app models module imports them.
+"""
+
+from django.db import models
+
+from server.apps.generic.models import GenericModel
+from server.apps.trees.constants import NAME_MAX_LENGTH
+
+BROKEN_LINK = "broken_link"
+ORPHANED_STEP = "orphaned_step"
+DUPLICATE_OPTION = "duplicate_option"
+INCONSISTENCY_KINDS = (
+    (BROKEN_LINK, "Option does not lead to a step"),
+    (ORPHANED_STEP, "No option leads to the step"),
+    (DUPLICATE_OPTION, "Options lead to different steps"),
+)
+
+
+class TreeStep(GenericModel):
+    """Membership of the step in the tree, through one of the tree paths.
+
+    Lets the steps of the tree be found without joining the paths.
+    Unique index leads with the step, so it serves the lookups
+    by the step, and the membership probes by both columns.
+    Maintained by the trees signals, shouldn't be edited by hand.
+    """
+
+    tree = models.ForeignKey(
+        "Tree",
+        related_name="step_entries",
+        on_delete=models.CASCADE,
+    )
+    step = models.ForeignKey(
+        "Step",
+        related_name="tree_entries",
+        on_delete=models.CASCADE,
+        db_index=False,
+    )
+
+    def __str__(self) -> str:
+        """Return the primary keys of the tree and the step.
+
+        Returns:
+            str: tree and step primary keys.
+        """
+        return f"{self.tree_id}: {self.step_id}"
+
+    class Meta:
+        unique_together = ("step", "tree")
+
+
+class TreeOption(GenericModel):
+    """Membership of the option in the tree, through the step of the option.
+
+    Lets the options of the tree be found without joining the steps
+    and the paths. Maintained by the trees signals, shouldn't be edited
+    by hand.
+    """
+
+    tree = models.ForeignKey(
+        "Tree",
+        related_name="option_entries",
+        on_delete=models.CASCADE,
+    )
+    option = models.ForeignKey(
+        "Option",
+        related_name="tree_entries",
+        on_delete=models.CASCADE,
+    )
+
+    def __str__(self) -> str:
+        """Return the primary keys of the tree and the option.
+
+        Returns:
+            str: tree and option primary keys.
+        """
+        return f"{self.tree_id}: {self.option_id}"
+
+    class Meta:
+        unique_together = ("tree", "option")
+
+
+class TreeStatistics(GenericModel):
+    """Statistics of the tree graph, measured on every change of the tree.
+
+    Depth is the number of options chosen on the shortest walk from
+    the first step to the final step, measured for every reachable
+    final step. Maintained by the trees signals, shouldn't be edited
+    by hand.
+    """
+
+    tree = models.OneToOneField(
+        "Tree",
+        related_name="statistics",
+        on_delete=models.CASCADE,
+    )
+    paths_count = models.PositiveIntegerField(default=0)
+    steps_count = models.PositiveIntegerField(default=0)
+    options_count = models.PositiveIntegerField(default=0)
+    solutions_count = models.PositiveIntegerField(default=0)
+    max_depth = models.PositiveIntegerField(default=0)
+    average_depth = models.FloatField(default=0)
+
+    def __str__(self) -> str:
+        """Return the primary key of the tree.
+
+        Returns:
+            str: tree primary key.
+        """
+        return f"Statistics of {self.tree_id}"
+
+    class Meta:
+        verbose_name_plural = "tree statistics"
+
+
+class Inconsistency(GenericModel):
+    """Problem of the tree found by the inconsistencies scanner.
+
+    Findings of the tree are replaced on every scan of the tree,
+    shouldn't be edited by hand.
+    """
+
+    tree = models.ForeignKey(
+        "Tree",
+        related_name="inconsistencies",
+        on_delete=models.CASCADE,
+    )
+    kind = models.CharField(
+        max_length=NAME_MAX_LENGTH,
+        choices=INCONSISTENCY_KINDS,
+    )
+    step_name = models.CharField(max_length=NAME_MAX_LENGTH)
+    step = models.ForeignKey(
+        "Step",
+        related_name="inconsistencies",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+    )
+    option = models.ForeignKey(
+        "Option",
+        related_name="inconsistencies",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+    )
+    option_name = models.CharField(max_length=NAME_MAX_LENGTH, blank=True)
+
+    def __str__(self) -> str:
+        """Return the kind of the inconsistency and the name of the step.
+
+        Returns:
+            str: kind and step name.
+        """
+        return f"{self.get_kind_display()}: {self.step_name}"
+
+    class Meta:
+        indexes = (
+            models.Index(
+                fields=("created_at", "uuid"),
+                name="inconsistency_created_at_idx",
+            ),
+            models.Index(
+                fields=("tree", "created_at", "uuid"),
+                name="inconsistency_tree_idx",
+            ),
+            models.Index(
+                fields=("kind", "created_at", "uuid"),
+                name="inconsistency_kind_idx",
+            ),
+        )
+
+
+class InconsistencyScan(GenericModel):
+    """Progress of the scan of all the trees, so it can be resumed."""
+
+    last_tree = models.UUIDField(null=True, blank=True)
+    scanned_count = models.PositiveIntegerField(default=0)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self) -> str:
+        """Return the number of the scanned trees.
+
+        Returns:
+            str: scanned trees count.
+        """
+        return f"Scanned {self.scanned_count} trees"
@@ -0,0 +1,279 @@
+"""Compiled decision graph of the tree."""
+
+from dataclasses import dataclass, field
+from typing import Iterable, Optional, Union
+from uuid import UUID
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import models
+
+from server.apps.generic.routers import primary_reads
+from server.apps.trees.models import Option, Step, Tree
+
+GRAPH_CACHE_PREFIX = "tree-graph"
+GRAPH_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+@dataclass
+class GraphNode:
+    """Merged node of the graph, grouping all the steps with the same name.
+
+    Node is final when all of its steps are final.
+    """
+
+    name: str
+    first_options_count: int
+    options: list[Option] = field(default_factory=list)
+    option_names: set[str] = field(default_factory=set)
+    is_final: bool = True
+
+    def add_option(self, option: Option, from_first_step: bool) -> None:
+        """Attach the option to the node, unless its name is already there.
+
+        Args:
+            option (Option): option of one of the merged steps.
+            from_first_step (bool): indicates if the option step is first.
+        """
+        if from_first_step:
+            self.first_options_count += 1
+        if option.name not in self.option_names:
+            self.option_names.add(option.name)
+            self.options.append(option)
+
+    def find_option(self, answer: str) -> Option:
+        """Return the option matching the answer by primary key or name.
+
+        Args:
+            answer (str): primary key or name of the option.
+
+        Raises:
+            ValidationError: if the node has no such option.
+
+        Returns:
+            Option: chosen option.
+        """
+        for option in self.options:
+            if answer in {str(option.pk), option.name}:
+                return option
+        raise ValidationError(
+            f'"{answer}" is not an option of the step "{self.name}".',
+        )
+
+
+@dataclass
+class TreeGraph:
+    """Decision graph of the tree, compiled from its paths.
+
+    Steps sharing the name across the paths are merged into a single node,
+    options of the node are deduplicated by name.
+    """
+
+    tree_pk: UUID
+    first_step_name: Optional[str]
+    nodes: dict[str, GraphNode] = field(default_factory=dict)
+    steps: dict[UUID, Step] = field(default_factory=dict)
+
+    def add_steps(self, steps: Iterable[Step]) -> None:
+        """Register the steps and their merged nodes.
+
+        Args:
+            steps (Iterable[Step]): all the steps of the tree.
+        """
+        for step in steps:
+            self.steps[step.pk] = step
+            node = self.nodes.setdefault(step.name, GraphNode(step.name, 0))
+            node.is_final = node.is_final and step.is_final
+
+    def add_options(self, options: Iterable[Option]) -> None:
+        """Attach the options to the merged nodes of their steps.
+
+        Args:
+            options (Iterable[Option]): all the options of the tree,
+                ordered by name.
+        """
+        for option in options:
+            step = self.steps[option.step_id]
+            self.nodes[step.name].add_option(option, step.is_first)
+
+    def select_first_step(self) -> None:
+        """Choose the first step of the tree.
+
+        First step is considered to be 'is_first' with the most options
+        for the same name, ties are resolved by the name.
+        """
+        first_names = {
+            step.name for step in self.steps.values() if step.is_first
+        }
+        if not first_names:
+            self.first_step_name = None
+            return
+        self.first_step_name = min(
+            first_names,
+            key=lambda name: (-self.nodes[name].first_options_count, name),
+        )
+
+    def get_step(self, step_uuid: Union[UUID, str]) -> Optional[Step]:
+        """Return the step if it belongs to the tree.
+
+        Args:
+            step_uuid (Union[UUID, str]): primary key of the step.
+
+        Returns:
+            Optional[Step]: step of the tree.
+        """
+        try:
+            return self.steps.get(UUID(str(step_uuid)))
+        except ValueError:
+            return None
+
+    def first_step_data(self) -> dict:
+        """Return the data of the first step of the tree.
+
+        Returns:
+            dict: name and options of the first step,
+                empty if the tree has no first step.
+        """
+        if self.first_step_name is None:
+            return {}
+        return {
+            "name": self.first_step_name,
+            "options": self.nodes[self.first_step_name].options,
+        }
+
+    def step_data(self, step: Step) -> dict:
+        """Return the data of the step in the context of the tree.
+
+        Args:
+            step (Step): step of the tree.
+
+        Returns:
+            dict: name of the step and its merged options,
+                or solution if it's the final step.
+        """
+        step_data = {"name": step.name}
+        if step.is_final:
+            step_data["solution"] = step.solution
+        else:
+            step_data["options"] = self.nodes[step.name].options
+        return step_data
+
+    def walk(self, answers: Iterable[str]) -> tuple[dict, list[str]]:
+        """Follow the answers from the first step of the tree.
+
+        Args:
+            answers (Iterable[str]): primary keys or names of the options
+                chosen on the consecutive steps.
+
+        Raises:
+            ValidationError: if the answers do not form a valid walk.
+
+        Returns:
+            tuple[dict, list[str]]: data of the step the walk ended on
+                and names of all the visited steps.
+        """
+        step_data = self.first_step_data()
+        if not step_data:
+            raise ValidationError("The tree has no first step.")
+        visited = [step_data["name"]]
+        for answer in answers:
+            if "options" not in step_data:
+                raise ValidationError(
+                    f'The step "{step_data["name"]}" is final.',
+                )
+            option = self.nodes[step_data["name"]].find_option(answer)
+            step = self.steps.get(option.next_step_id)
+            if step is None:
+                raise ValidationError(
+                    f'The option "{option.name}" does not lead to a step.',
+                )
+            step_data = self.step_data(step)
+            visited.append(step.name)
+        return step_data, visited
+
+
+class TreeGraphCache:
+    """Handle compiling and caching of the tree graphs."""
+
+    @classmethod
+    def compile(cls, tree: Tree) -> TreeGraph:
+        """Build the graph of the tree and store it in the cache.
+
+        Graph is read from the primary database, so the lagging replica
+        does not leave the outdated graph in the cache.
+
+        Args:
+            tree (Tree): tree to compile.
+
+        Returns:
+            TreeGraph: compiled graph.
+        """
+        with primary_reads():
+            graph = cls.build(tree.pk)
+        cache.set(cls.key(tree.pk), graph, GRAPH_CACHE_TIMEOUT)
+        return graph
+
+    @classmethod
+    def build(cls, tree_pk: UUID) -> TreeGraph:
+        """Build the graph of the tree, without caching it.
+
+        Options are annotated with the names of their next steps,
+        which are not always the steps of the tree.
+
+        Args:
+            tree_pk (UUID): primary key of the tree.
+
+        Returns:
+            TreeGraph: compiled graph.
+        """
+        graph = TreeGraph(tree_pk=tree_pk, first_step_name=None)
+        graph.add_steps(
+            Step.objects.filter(trees=tree_pk)
+            .select_related("solution__creator")
+            .defer("solution__description"),
+        )
+        graph.add_options(
+            Option.objects.filter(trees=tree_pk)
+            .annotate(next_step_name=models.F("next_step__name"))
+            .order_by("name", "created_at"),
+        )
+        graph.select_first_step()
+        return graph
+
+    @classmethod
+    def get(cls, tree_pk: Union[UUID, str]) -> Optional[TreeGraph]:
+        """Return the compiled graph of the tree if it is cached.
+
+        Args:
+            tree_pk (Union[UUID, str]): primary key of the tree.
+
+        Returns:
+            Optional[TreeGraph]: cached graph.
+        """
+        return cache.get(cls.key(tree_pk))
+
+    @classmethod
+    def invalidate(cls, tree_pks: Iterable[Union[UUID, str]]) -> None:
+        """Drop the compiled graphs of the trees from the cache.
+
+        Graphs of the changed trees are dropped as soon as the change
+        is made, and compiled again once it is committed.
+
+        Args:
+            tree_pks (Iterable[Union[UUID, str]]): primary keys of the trees.
+        """
+        keys = [cls.key(tree_pk) for tree_pk in tree_pks]
+        if keys:
+            cache.delete_many(keys)
+
+    @classmethod
+    def key(cls, tree_pk: Union[UUID, str]) -> str:
+        """Return the cache key of the compiled graph for the tree.
+
+        Args:
+            tree_pk (Union[UUID, str]): primary key of the tree.
+
+        Returns:
+            str: cache key.
+        """
+        return f"{GRAPH_CACHE_PREFIX}:{tree_pk}"
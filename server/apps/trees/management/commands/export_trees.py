@@ -0,0 +1,48 @@
+"""Command exporting the trees dataset to the NDJSON files."""
+
+from argparse import ArgumentParser
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+from server.apps.trees.services.tree_transfer import TreeTransferService
+
+DEFAULT_CHUNK_SIZE = 2000
+
+
+class Command(BaseCommand):
+    """Stream the trees, paths, steps, options and solutions to the files.
+
+    Each table is written to its own NDJSON file in the directory,
+    the creators are referenced by their usernames.
+    """
+
+    help = "Export the trees dataset to the NDJSON files."
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        """Add the directory and chunk size arguments.
+
+        Args:
+            parser (ArgumentParser): command arguments parser.
+        """
+        parser.add_argument("directory", type=Path)
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Number of rows fetched from the database at once.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Export the tables.
+
+        Args:
+            args (list): command arguments.
+            options (dict): command options.
+        """
+        exported_counts = TreeTransferService.export_tables(
+            options["directory"],
+            options["chunk_size"],
+        )
+        for table_name, rows_count in exported_counts.items():
+            self.stdout.write(f"Exported {rows_count} rows of {table_name}.")
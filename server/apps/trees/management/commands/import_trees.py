@@ -0,0 +1,60 @@
+"""Command importing the trees dataset from the NDJSON files."""
+
+from argparse import ArgumentParser
+from pathlib import Path
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from server.apps.trees.services.tree_transfer import TreeTransferService
+
+DEFAULT_CHUNK_SIZE = 500
+
+
+class Command(BaseCommand):
+    """Load the files written by the 'export_trees' command with COPY.
+
+    The whole dataset is imported within a single transaction, rows
+    that exist already are skipped. Creators have to exist beforehand,
+    they are found by their usernames.
+    """
+
+    help = "Import the trees dataset from the NDJSON files."
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        """Add the directory and chunk size arguments.
+
+        Args:
+            parser (ArgumentParser): command arguments parser.
+        """
+        parser.add_argument("directory", type=Path)
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Number of imported trees refreshed at once.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Import the tables.
+
+        Args:
+            args (list): command arguments.
+            options (dict): command options.
+
+        Raises:
+            CommandError: if the database is not PostgreSQL,
+                or the dataset cannot be imported.
+        """
+        if connection.vendor != "postgresql":
+            raise CommandError("Importing requires the PostgreSQL database.")
+        try:
+            imported_counts = TreeTransferService.import_tables(
+                options["directory"],
+                options["chunk_size"],
+            )
+        except ValidationError as error:
+            raise CommandError(error.messages[0])
+        for table_name, rows_count in imported_counts.items():
+            self.stdout.write(f"Imported {rows_count} rows of {table_name}.")
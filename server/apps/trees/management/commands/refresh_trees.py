@@ -0,0 +1,57 @@
+"""Command refreshing the data derived from all the trees."""
+
+import itertools
+from argparse import ArgumentParser
+
+from django.core.management.base import BaseCommand
+
+from server.apps.trees.models import Tree
+from server.apps.trees.services.tree_refresh import TreeRefreshService
+
+DEFAULT_CHUNK_SIZE = 100
+
+
+class Command(BaseCommand):
+    """Refresh the memberships, first steps and statistics of the trees.
+
+    Derived data is refreshed on every change of the trees sending
+    the model signals. The command fills it for the trees changed
+    before it was added, or changed with ``QuerySet.update()``
+    and ``bulk_update()``, which send no signals.
+    """
+
+    help = "Refresh the data derived from the trees."
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        """Add the chunk size argument.
+
+        Args:
+            parser (ArgumentParser): command arguments parser.
+        """
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Number of trees refreshed at once.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Refresh the trees in chunks.
+
+        Args:
+            args (list): command arguments.
+            options (dict): command options.
+        """
+        chunk_size = options["chunk_size"]
+        tree_pks = (
+            Tree.objects.order_by("pk")
+            .values_list("pk", flat=True)
+            .iterator(chunk_size=chunk_size)
+        )
+        refreshed_count = 0
+        chunk = list(itertools.islice(tree_pks, chunk_size))
+        while chunk:
+            TreeRefreshService.rebuild_trees(chunk)
+            refreshed_count += len(chunk)
+            chunk = list(itertools.islice(tree_pks, chunk_size))
+        self.stdout.write(f"Refreshed {refreshed_count} trees.")
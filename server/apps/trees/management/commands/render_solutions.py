@@ -0,0 +1,44 @@
+"""Command rendering the stale solution descriptions."""
+
+from argparse import ArgumentParser
+
+from django.core.management.base import BaseCommand
+
+from server.apps.trees.services.solution import SolutionService
+
+DEFAULT_CHUNK_SIZE = 500
+
+
+class Command(BaseCommand):
+    """Render the solution descriptions after the renderer config changes.
+
+    Only the descriptions rendered with another configuration are
+    rendered again, so the command is cheap to run on every deployment.
+    """
+
+    help = "Render the stale solution descriptions."
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        """Add the chunk size argument.
+
+        Args:
+            parser (ArgumentParser): command arguments parser.
+        """
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Number of solutions fetched and updated at once.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Render the stale descriptions in chunks.
+
+        Args:
+            args (list): command arguments.
+            options (dict): command options.
+        """
+        rendered_count = SolutionService.render_stale_descriptions(
+            options["chunk_size"],
+        )
+        self.stdout.write(f"Rendered {rendered_count} solution descriptions.")
@@ -0,0 +1,59 @@
+"""Command scanning the trees for the inconsistencies."""
+
+from argparse import ArgumentParser
+
+from django.core.management.base import BaseCommand
+
+from server.apps.trees.services.inconsistency import InconsistencyService
+
+DEFAULT_CHUNK_SIZE = 100
+DEFAULT_RATE = 200
+
+
+class Command(BaseCommand):
+    """Sweep all the trees and store their inconsistencies.
+
+    Interrupted scan is resumed from the last scanned chunk. Scanning
+    is rate limited, so it can run in the background next to the
+    request traffic.
+    """
+
+    help = "Scan the trees for the inconsistencies."
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        """Add the chunk size, rate and restart arguments.
+
+        Args:
+            parser (ArgumentParser): command arguments parser.
+        """
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Number of trees scanned at once.",
+        )
+        parser.add_argument(
+            "--rate",
+            type=float,
+            default=DEFAULT_RATE,
+            help="Maximal number of trees scanned per second, 0 for no limit.",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Start a new scan instead of resuming the unfinished one.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Scan the trees in chunks.
+
+        Args:
+            args (list): command arguments.
+            options (dict): command options.
+        """
+        scan = InconsistencyService.sweep(
+            options["chunk_size"],
+            options["rate"],
+            options["restart"],
+        )
+        self.stdout.write(f"Scanned {scan.scanned_count} trees.")
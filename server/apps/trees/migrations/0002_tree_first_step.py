@@ -0,0 +1,47 @@
+# Generated by Django 3.2.25 on 2026-10-18 07:17
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+def fill_first_steps(apps, schema_editor):
+    Tree = apps.get_model('trees', 'Tree')
+    Step = apps.get_model('trees', 'Step')
+    Option = apps.get_model('trees', 'Option')
+    for tree in Tree.objects.all():
+        first_step = (
+            Step.objects.filter(path__trees=tree, is_first=True)
+            .values('name')
+            .annotate(options_count=models.Count('options'))
+            .order_by('-options_count', 'name')
+            .first()
+        )
+        if not first_step:
+            continue
+        options = (
+            Option.objects.filter(
+                step__name=first_step['name'],
+                step__path__trees=tree,
+            )
+            .distinct('name')
+            .order_by('name', 'created_at')
+            .values('pk', 'name', 'step', 'next_step')
+        )
+        tree.first_step = {'name': first_step['name'], 'options': list(options)}
+        tree.save(update_fields=['first_step'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trees', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tree',
+            name='first_step',
+            field=models.JSONField(blank=True, default=dict, editable=False, encoder=django.core.serializers.json.DjangoJSONEncoder),
+        ),
+        migrations.RunPython(fill_first_steps, migrations.RunPython.noop),
+    ]
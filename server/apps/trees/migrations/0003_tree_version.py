@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-18 07:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trees', '0002_tree_first_step'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tree',
+            name='version',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 3.2.25 on 2026-10-18 07:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trees', '0003_tree_version'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='option',
+            index=models.Index(fields=['created_at', 'uuid'], name='option_created_at_uuid_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='path',
+            index=models.Index(fields=['created_at', 'uuid'], name='path_created_at_uuid_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='solution',
+            index=models.Index(fields=['created_at', 'uuid'], name='solution_created_at_uuid_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='step',
+            index=models.Index(fields=['created_at', 'uuid'], name='step_created_at_uuid_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tree',
+            index=models.Index(fields=['created_at', 'uuid'], name='tree_created_at_uuid_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 3.2.25 on 2026-10-18 07:41
+
+from django.db import migrations, models
+from martor.utils import markdownify
+
+
+def render_descriptions(apps, schema_editor):
+    # Rendered with martor directly, so the migration does not depend
+    # on the app code. Hashes are left empty, the render_solutions
+    # command stamps them with the current renderer configuration.
+    Solution = apps.get_model('trees', 'Solution')
+    for solution in Solution.objects.all():
+        solution.description_html = markdownify(solution.description)
+        solution.save(update_fields=['description_html'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trees', '0004_created_at_uuid_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='solution',
+            name='description_hash',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='solution',
+            name='description_html',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.RunPython(render_descriptions, migrations.RunPython.noop),
+    ]
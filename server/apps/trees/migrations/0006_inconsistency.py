@@ -0,0 +1,53 @@
+# Generated by Django 3.2.25 on 2026-10-18 08:16
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trees', '0005_solution_description_html'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InconsistencyScan',
+            fields=[
+                ('uuid', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created at')),
+                ('last_tree', models.UUIDField(blank=True, null=True)),
+                ('scanned_count', models.PositiveIntegerField(default=0)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Inconsistency',
+            fields=[
+                ('uuid', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created at')),
+                ('kind', models.CharField(choices=[('broken_link', 'Option does not lead to a step'), ('orphaned_step', 'No option leads to the step'), ('duplicate_option', 'Options lead to different steps')], max_length=63)),
+                ('step_name', models.CharField(max_length=63)),
+                ('option_name', models.CharField(blank=True, max_length=63)),
+                ('option', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='inconsistencies', to='trees.option')),
+                ('step', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='inconsistencies', to='trees.step')),
+                ('tree', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='inconsistencies', to='trees.tree')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='inconsistency',
+            index=models.Index(fields=['created_at', 'uuid'], name='inconsistency_created_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='inconsistency',
+            index=models.Index(fields=['tree', 'created_at', 'uuid'], name='inconsistency_tree_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='inconsistency',
+            index=models.Index(fields=['kind', 'created_at', 'uuid'], name='inconsistency_kind_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 3.2.25 on 2026-10-18 08:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trees', '0006_inconsistency'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='step',
+            index=models.Index(condition=models.Q(('is_first', True)), fields=['path', 'name'], name='step_first_path_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='step',
+            index=models.Index(condition=models.Q(('is_final', True)), fields=['path', 'created_at'], name='step_final_path_idx'),
+        ),
+        # Trees of the path are read from the index alone, without
+        # visiting the rows of the through table. Declared on the TreePath
+        # model by the 0015 migration.
+        migrations.RunSQL(
+            sql='CREATE INDEX tree_paths_path_tree_idx ON trees_tree_paths (path_id, tree_id)',
+            reverse_sql='DROP INDEX tree_paths_path_tree_idx',
+        ),
+    ]
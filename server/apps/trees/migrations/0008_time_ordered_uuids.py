@@ -0,0 +1,49 @@
+# Generated by Django 3.2.25 on 2026-10-18 08:46
+
+from django.db import migrations, models
+import server.apps.generic.identifiers
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trees', '0007_traversal_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='inconsistency',
+            name='uuid',
+            field=models.UUIDField(default=server.apps.generic.identifiers.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='inconsistencyscan',
+            name='uuid',
+            field=models.UUIDField(default=server.apps.generic.identifiers.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='option',
+            name='uuid',
+            field=models.UUIDField(default=server.apps.generic.identifiers.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='path',
+            name='uuid',
+            field=models.UUIDField(default=server.apps.generic.identifiers.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='solution',
+            name='uuid',
+            field=models.UUIDField(default=server.apps.generic.identifiers.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='step',
+            name='uuid',
+            field=models.UUIDField(default=server.apps.generic.identifiers.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='tree',
+            name='uuid',
+            field=models.UUIDField(default=server.apps.generic.identifiers.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
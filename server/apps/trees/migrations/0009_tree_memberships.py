@@ -0,0 +1,79 @@
+# Generated by Django 3.2.25 on 2026-10-18 08:52
+
+from django.db import migrations, models
+import django.db.models.deletion
+import server.apps.generic.identifiers
+
+
+BATCH_SIZE = 1000
+
+
+def fill_memberships(apps, schema_editor):
+    """Add the steps and options of the existing trees."""
+    Step = apps.get_model("trees", "Step")
+    Option = apps.get_model("trees", "Option")
+    TreeStep = apps.get_model("trees", "TreeStep")
+    TreeOption = apps.get_model("trees", "TreeOption")
+    TreeStep.objects.bulk_create(
+        (
+            TreeStep(tree_id=tree_pk, step_id=step_pk)
+            for tree_pk, step_pk in Step.objects.filter(
+                path__trees__isnull=False,
+            ).values_list("path__trees", "pk")
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    TreeOption.objects.bulk_create(
+        (
+            TreeOption(tree_id=tree_pk, option_id=option_pk)
+            for tree_pk, option_pk in Option.objects.filter(
+                step__path__trees__isnull=False,
+            ).values_list("step__path__trees", "pk")
+        ),
+        batch_size=BATCH_SIZE,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trees', '0008_time_ordered_uuids'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TreeStep',
+            fields=[
+                ('uuid', models.UUIDField(default=server.apps.generic.identifiers.uuid7, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created at')),
+                ('step', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tree_entries', to='trees.step')),
+                ('tree', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='step_entries', to='trees.tree')),
+            ],
+            options={
+                'unique_together': {('tree', 'step')},
+            },
+        ),
+        migrations.CreateModel(
+            name='TreeOption',
+            fields=[
+                ('uuid', models.UUIDField(default=server.apps.generic.identifiers.uuid7, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created at')),
+                ('option', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tree_entries', to='trees.option')),
+                ('tree', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='option_entries', to='trees.tree')),
+            ],
+            options={
+                'unique_together': {('tree', 'option')},
+            },
+        ),
+        migrations.AddField(
+            model_name='tree',
+            name='options',
+            field=models.ManyToManyField(editable=False, related_name='trees', through='trees.TreeOption', to='trees.Option'),
+        ),
+        migrations.AddField(
+            model_name='tree',
+            name='steps',
+            field=models.ManyToManyField(editable=False, related_name='trees', through='trees.TreeStep', to='trees.Step'),
+        ),
+        migrations.RunPython(fill_memberships, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 3.2.25 on 2026-10-18 09:04
+
+from django.db import migrations, models
+import django.db.models.deletion
+import server.apps.generic.identifiers
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trees', '0009_tree_memberships'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TreeStatistics',
+            fields=[
+                ('uuid', models.UUIDField(default=server.apps.generic.identifiers.uuid7, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created at')),
+                ('paths_count', models.PositiveIntegerField(default=0)),
+                ('steps_count', models.PositiveIntegerField(default=0)),
+                ('options_count', models.PositiveIntegerField(default=0)),
+                ('solutions_count', models.PositiveIntegerField(default=0)),
+                ('max_depth', models.PositiveIntegerField(default=0)),
+                ('average_depth', models.FloatField(default=0)),
+                ('tree', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='statistics', to='trees.tree')),
+            ],
+            options={
+                'verbose_name_plural': 'tree statistics',
+            },
+        ),
+    ]
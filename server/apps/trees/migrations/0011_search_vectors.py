@@ -0,0 +1,49 @@
+# Generated by Django 3.2.25 on 2026-10-18 09:13
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+
+def fill_search_vectors(apps, schema_editor):
+    """Index the names and descriptions of the existing trees and solutions."""
+    for model_name, description_field in (
+        ("Tree", "description"),
+        ("Solution", "description_html"),
+    ):
+        apps.get_model("trees", model_name).objects.update(
+            search_vector=(
+                SearchVector("name", weight="A", config="english")
+                + SearchVector(description_field, weight="B", config="english")
+            ),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trees', '0010_tree_statistics'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='solution',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='tree',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='solution',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='solution_search_vector_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tree',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='tree_search_vector_idx'),
+        ),
+        migrations.RunPython(fill_search_vectors, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 3.2.25 on 2026-10-18 09:18
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trees', '0011_search_vectors'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='option',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='option_name_trigram_idx', opclasses=('gin_trgm_ops',)),
+        ),
+        migrations.AddIndex(
+            model_name='step',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='step_name_trigram_idx', opclasses=('gin_trgm_ops',)),
+        ),
+    ]
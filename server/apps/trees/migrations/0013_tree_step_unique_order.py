@@ -0,0 +1,23 @@
+# Generated by Django 3.2.25 on 2026-10-18 09:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trees', '0012_name_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='treestep',
+            name='step',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='tree_entries', to='trees.step'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='treestep',
+            unique_together={('step', 'tree')},
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 3.2.25 on 2026-10-18 10:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trees', '0013_tree_step_unique_order'),
+    ]
+
+    operations = [
+        # The through table and its index already exist, the latter
+        # created by the 0008 migration, so only the state is changed.
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name='TreePath',
+                    fields=[
+                        ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('path', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tree_entries', to='trees.path')),
+                        ('tree', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='path_entries', to='trees.tree')),
+                    ],
+                    options={
+                        'db_table': 'trees_tree_paths',
+                    },
+                ),
+                migrations.AlterField(
+                    model_name='tree',
+                    name='paths',
+                    field=models.ManyToManyField(blank=True, related_name='trees', through='trees.TreePath', to='trees.Path'),
+                ),
+                migrations.AddIndex(
+                    model_name='treepath',
+                    index=models.Index(fields=['path', 'tree'], name='tree_paths_path_tree_idx'),
+                ),
+                migrations.AlterUniqueTogether(
+                    name='treepath',
+                    unique_together={('tree', 'path')},
+                ),
+            ],
+        ),
+    ]
@@ -1,15 +1,19 @@
 """Trees app models."""
 
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from martor.models import MartorField
 from structlog import get_logger
 
 from server.apps.generic.models import GenericModel, GenericModelWithCreator
+from server.apps.trees.constants import NAME_MAX_LENGTH
+from server.apps.trees.derived_models import TreeOption, TreeStep
 
-NAME_MAX_LENGTH = 63
-
-# TODO: Add inconsistencies model.
+DESCRIPTION_HASH_LENGTH = 64
+SEARCH_CONFIG = "english"
 
 log = get_logger()
 
@@ -19,7 +23,32 @@ class Tree(GenericModelWithCreator):
 
     name = models.CharField(max_length=NAME_MAX_LENGTH)
     description = models.TextField()
-    paths = models.ManyToManyField("Path", related_name="trees", blank=True)
+    paths = models.ManyToManyField(
+        "Path",
+        through="TreePath",
+        related_name="trees",
+        blank=True,
+    )
+    steps = models.ManyToManyField(
+        "Step",
+        through=TreeStep,
+        related_name="trees",
+        editable=False,
+    )
+    options = models.ManyToManyField(
+        "Option",
+        through=TreeOption,
+        related_name="trees",
+        editable=False,
+    )
+    first_step = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        encoder=DjangoJSONEncoder,
+    )
+    version = models.PositiveIntegerField(default=1, editable=False)
+    search_vector = SearchVectorField(null=True, editable=False)
 
     def __str__(self) -> str:
         """Return the name of the tree.
@@ -31,6 +60,13 @@ class Tree(GenericModelWithCreator):
 
     class Meta:
         unique_together = ("name", "creator")
+        indexes = (
+            models.Index(
+                fields=("created_at", "uuid"),
+                name="tree_created_at_uuid_idx",
+            ),
+            GinIndex(fields=("search_vector",), name="tree_search_vector_idx"),
+        )
 
 
 class Path(GenericModelWithCreator):
@@ -48,6 +84,49 @@ class Path(GenericModelWithCreator):
 
     class Meta:
         unique_together = ("name", "creator")
+        indexes = (
+            models.Index(
+                fields=("created_at", "uuid"),
+                name="path_created_at_uuid_idx",
+            ),
+        )
+
+
+class TreePath(models.Model):
+    """Membership of the path in the tree.
+
+    Declared only for the index leading with the path, which lets
+    the trees of the path be read without visiting the rows.
+    """
+
+    tree = models.ForeignKey(
+        Tree,
+        related_name="path_entries",
+        on_delete=models.CASCADE,
+    )
+    path = models.ForeignKey(
+        Path,
+        related_name="tree_entries",
+        on_delete=models.CASCADE,
+    )
+
+    def __str__(self) -> str:
+        """Return the primary keys of the tree and the path.
+
+        Returns:
+            str: tree and path primary keys.
+        """
+        return f"{self.tree_id}: {self.path_id}"
+
+    class Meta:
+        db_table = "trees_tree_paths"
+        unique_together = ("tree", "path")
+        indexes = (
+            models.Index(
+                fields=("path", "tree"),
+                name="tree_paths_path_tree_idx",
+            ),
+        )
 
 
 class Step(GenericModel):
@@ -95,7 +174,7 @@ class Step(GenericModel):
                 creator=self.path.creator.email,
             )
             raise ValidationError("A step cannot be both first and final.")
-        if self.is_final == (self.solution is None):
+        if self.is_final == (self.solution_id is None):
             log.error(
                 "Solution is not on the final step.",
                 name=self.name,
@@ -108,6 +187,27 @@ class Step(GenericModel):
     class Meta:
         unique_together = ("name", "path")
         ordering = ("created_at",)
+        indexes = (
+            models.Index(
+                fields=("created_at", "uuid"),
+                name="step_created_at_uuid_idx",
+            ),
+            models.Index(
+                fields=("path", "name"),
+                condition=models.Q(is_first=True),
+                name="step_first_path_name_idx",
+            ),
+            models.Index(
+                fields=("path", "created_at"),
+                condition=models.Q(is_final=True),
+                name="step_final_path_idx",
+            ),
+            GinIndex(
+                fields=("name",),
+                opclasses=("gin_trgm_ops",),
+                name="step_name_trigram_idx",
+            ),
+        )
         constraints = (
             models.CheckConstraint(
                 check=models.Q(is_first=False) | models.Q(is_final=False),
@@ -157,7 +257,7 @@ class Option(GenericModel):
         Raises:
             ValidationError: if the steps are equal.
         """
-        if self.step == self.next_step:
+        if self.next_step_id and self.step_id == self.next_step_id:
             log.error(
                 "Steps are equal.",
                 name=self.name,
@@ -170,6 +270,17 @@ class Option(GenericModel):
     class Meta:
         unique_together = ("name", "step")
         ordering = ("created_at",)
+        indexes = (
+            models.Index(
+                fields=("created_at", "uuid"),
+                name="option_created_at_uuid_idx",
+            ),
+            GinIndex(
+                fields=("name",),
+                opclasses=("gin_trgm_ops",),
+                name="option_name_trigram_idx",
+            ),
+        )
         constraints = [
             models.CheckConstraint(
                 check=~models.Q(step=models.F("next_step")),
@@ -186,6 +297,13 @@ class Solution(GenericModelWithCreator):
 
     name = models.CharField(max_length=NAME_MAX_LENGTH)
     description = MartorField()
+    description_html = models.TextField(blank=True, editable=False)
+    description_hash = models.CharField(
+        max_length=DESCRIPTION_HASH_LENGTH,
+        blank=True,
+        editable=False,
+    )
+    search_vector = SearchVectorField(null=True, editable=False)
 
     def __str__(self) -> str:
         """Return the name of the solution.
@@ -194,3 +312,15 @@ class Solution(GenericModelWithCreator):
             str: name.
         """
         return self.name
+
+    class Meta:
+        indexes = (
+            models.Index(
+                fields=("created_at", "uuid"),
+                name="solution_created_at_uuid_idx",
+            ),
+            GinIndex(
+                fields=("search_vector",),
+                name="solution_search_vector_idx",
+            ),
+        )
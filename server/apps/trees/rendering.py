@@ -0,0 +1,61 @@
+"""Rendering of the Markdown descriptions."""
+
+import hashlib
+import json
+from importlib.metadata import version
+
+from martor import settings as martor_settings
+from martor.utils import markdownify
+
+MARTOR_VERSION = version("martor")
+
+
+class DescriptionRenderer:
+    """Render the Markdown descriptions to HTML, the same way martor does.
+
+    Rendered descriptions are identified by the content hash, taking
+    the renderer configuration into account, so that they are rendered
+    again once the configuration changes.
+    """
+
+    @classmethod
+    def render(cls, description: str) -> str:
+        """Render the Markdown description.
+
+        Args:
+            description (str): Markdown text.
+
+        Returns:
+            str: sanitized HTML.
+        """
+        return markdownify(description)
+
+    @classmethod
+    def content_hash(cls, description: str) -> str:
+        """Return the hash of the description and the renderer configuration.
+
+        Args:
+            description (str): Markdown text.
+
+        Returns:
+            str: hex digest of the content hash.
+        """
+        content = f"{cls.fingerprint()}:{description}"
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    @classmethod
+    def fingerprint(cls) -> str:
+        """Return the fingerprint of the renderer configuration.
+
+        Returns:
+            str: martor version and Markdown extensions with their configs.
+        """
+        return json.dumps(
+            [
+                MARTOR_VERSION,
+                martor_settings.MARTOR_MARKDOWN_EXTENSIONS,
+                martor_settings.MARTOR_MARKDOWN_EXTENSION_CONFIGS,
+            ],
+            sort_keys=True,
+            default=str,
+        )
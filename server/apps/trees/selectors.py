@@ -1,69 +1,342 @@
 """Selector classes for tree app models."""
 
-from typing import Optional
+from types import MappingProxyType
+from typing import Iterable, Optional, Union
+from uuid import UUID
 
-from django.db.models import Count
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import models
+from django.db.models.functions import Coalesce
 from django.db.models.query import QuerySet
 
-from server.apps.trees.models import Option, Path, Solution, Step, Tree
+from server.apps.generic.trigram import (
+    TrigramWordSimilar,
+    TrigramWordSimilarity,
+)
+from server.apps.trees.derived_models import TreeStatistics, TreeStep
+from server.apps.trees.models import (
+    SEARCH_CONFIG,
+    Option,
+    Path,
+    Solution,
+    Step,
+    Tree,
+)
 
+STATISTICS_FIELDS = (
+    "paths_count",
+    "steps_count",
+    "options_count",
+    "solutions_count",
+    "max_depth",
+    "average_depth",
+)
+NAME_SCOPES = MappingProxyType(
+    {
+        Step: MappingProxyType({"path": "path", "tree": "trees"}),
+        Option: MappingProxyType({"path": "step__path", "tree": "trees"}),
+    },
+)
 
-class StepSelector:
-    """Handle step fetching operations."""
+
+class TreeStatisticsSelector:
+    """Handle tree statistics fetching operations."""
 
     @classmethod
-    def first_name_for_tree(cls, tree: Tree) -> Optional[str]:
-        """Return name of first step for a tree.
+    def with_statistics(cls) -> QuerySet:
+        """Return trees annotated with their statistics.
 
-        First step is considered to be 'is_first' with the most options
-        for the same name.
+        Trees not measured yet have the zero statistics.
+
+        Returns:
+            QuerySet: trees with the statistics fields.
+        """
+        return Tree.objects.annotate(
+            **{
+                field_name: cls.statistic_or_default(field_name)
+                for field_name in STATISTICS_FIELDS
+            },
+        )
+
+    @classmethod
+    def statistic_or_default(cls, field_name: str) -> Coalesce:
+        """Return the statistic of the tree, or its default if not measured.
 
         Args:
-            tree (Tree): tree to get step for.
+            field_name (str): name of the statistics field.
 
         Returns:
-            str: name of the step that is first
-                and will return the most options.
+            Coalesce: expression of the statistic.
         """
-        step_name_and_count = (
-            Step.objects.filter(path__trees=tree, is_first=True)
-            .values("name")
-            .annotate(options_count=Count("options"))
-            .order_by("-options_count")
-        ).first()
+        field = TreeStatistics._meta.get_field(field_name)  # noqa: WPS437
+        return Coalesce(
+            models.F(f"statistics__{field_name}"),
+            field.get_default(),
+            output_field=field,
+        )
 
-        if step_name_and_count:
-            return step_name_and_count["name"]
-        return None
 
+class TreeSelector:
+    """Handle tree fetching operations."""
+
+    @classmethod
+    def with_nested(cls, expand: Optional[dict] = None) -> QuerySet:
+        """Return trees with the nested instances prefetched.
+
+        Args:
+            expand (Optional[dict]): nested relations to prefetch,
+                keyed by the name, all of them if not given.
+
+        Returns:
+            QuerySet: trees with creators, paths, steps, options and solutions.
+        """
+        trees = TreeStatisticsSelector.with_statistics().select_related(
+            "creator",
+        )
+        if expand is None or "paths" in expand:
+            paths = PathSelector.with_nested(expand and expand["paths"])
+            trees = trees.prefetch_related(
+                models.Prefetch("paths", queryset=paths),
+            )
+        return trees
 
-class OptionSelector:
-    """Handle option fetching operations."""
+    @classmethod
+    def for_paths(cls, paths: Iterable[Union[Path, UUID]]) -> QuerySet:
+        """Return all trees containing any of the paths.
+
+        Args:
+            paths (Iterable[Union[Path, UUID]]): paths of the trees
+                or their primary keys.
+
+        Returns:
+            QuerySet: trees containing the paths.
+        """
+        return Tree.objects.filter(paths__in=paths).distinct()
 
     @classmethod
-    def for_step_name_and_tree(cls, step_name: str, tree: Tree) -> QuerySet:
-        """Return all options for a given step name and tree.
+    def for_step(cls, step: Union[Step, UUID]) -> QuerySet:
+        """Return all trees containing the step or options leading to it.
 
         Args:
-            step_name (str): name of the step.
-            tree (Tree): tree of the path that has the step.
+            step (Union[Step, UUID]): step of the trees or its primary key.
 
         Returns:
-            QuerySet: all options with distinct name for the step and tree.
+            QuerySet: trees with the path of the step
+                or with options leading to the step.
         """
-        return (
-            Option.objects.filter(
-                step__name=step_name,
-                step__path__trees=tree,
+        return cls.for_steps((step,))
+
+    @classmethod
+    def for_steps(cls, steps: Iterable[Union[Step, UUID]]) -> QuerySet:
+        """Return all trees containing any of the steps or leading to them.
+
+        Paths of the steps and of the options leading to them are looked up
+        separately, so both lookups can use their own indexes. Trees the
+        steps were members of are included, so the trees the steps were
+        moved out of are refreshed as well.
+
+        Args:
+            steps (Iterable[Union[Step, UUID]]): steps of the trees
+                or their primary keys.
+
+        Returns:
+            QuerySet: trees with the paths of the steps
+                or with options leading to the steps.
+        """
+        step_pks = [getattr(step, "pk", step) for step in steps]
+        path_pks = (
+            Step.objects.filter(pk__in=step_pks)
+            .order_by()
+            .values("path")
+            .union(
+                Option.objects.filter(next_step__in=step_pks)
+                .order_by()
+                .values("step__path"),
             )
-            .distinct("name")
-            .order_by("name")
         )
+        member_tree_pks = TreeStep.objects.filter(step__in=step_pks).values(
+            "tree",
+        )
+        return Tree.objects.filter(
+            models.Q(paths__in=path_pks) | models.Q(pk__in=member_tree_pks),
+        ).distinct()
+
+    @classmethod
+    def for_options(cls, options: Iterable[Option]) -> QuerySet:
+        """Return all trees containing any of the options or their steps.
+
+        Trees the options were members of are included, so the trees
+        the options were moved out of are refreshed as well.
+
+        Args:
+            options (Iterable[Option]): options of the trees.
+
+        Returns:
+            QuerySet: trees of the steps of the options,
+                or with the options as members.
+        """
+        options = list(options)
+        return cls.for_steps({option.step_id for option in options}) | (
+            Tree.objects.filter(
+                options__in=[option.pk for option in options],
+            ).distinct()
+        )
+
+    @classmethod
+    def for_solutions(
+        cls,
+        solutions: Iterable[Union[Solution, UUID]],
+    ) -> QuerySet:
+        """Return all trees leading to any of the solutions.
+
+        Args:
+            solutions (Iterable[Union[Solution, UUID]]): solutions
+                of the final steps or their primary keys.
+
+        Returns:
+            QuerySet: trees with the final steps of the solutions.
+        """
+        return Tree.objects.filter(steps__solution__in=solutions).distinct()
+
+    @classmethod
+    def pks_for_instances(cls, instances: Iterable[models.Model]) -> set[UUID]:
+        """Return primary keys of all trees affected by the instances.
+
+        Trees of all the instances are looked up with a single query.
+
+        Args:
+            instances (Iterable[models.Model]): trees, paths, steps,
+                options or solutions.
+
+        Returns:
+            set[UUID]: primary keys of the affected trees.
+        """
+        instances = list(instances)
+        trees = (
+            Tree.objects.filter(
+                pk__in=[
+                    tree.pk for tree in instances if isinstance(tree, Tree)
+                ],
+            ).distinct()
+            | cls.for_paths(
+                [path for path in instances if isinstance(path, Path)],
+            )
+            | cls.for_steps(
+                [step for step in instances if isinstance(step, Step)],
+            )
+            | cls.for_options(
+                [option for option in instances if isinstance(option, Option)],
+            )
+            | cls.for_solutions(
+                [
+                    solution
+                    for solution in instances
+                    if isinstance(solution, Solution)
+                ],
+            )
+        )
+        return set(trees.values_list("pk", flat=True))
+
+
+class PathSelector:
+    """Handle path fetching operations."""
+
+    @classmethod
+    def with_nested(cls, expand: Optional[dict] = None) -> QuerySet:
+        """Return paths with the nested instances prefetched.
+
+        Args:
+            expand (Optional[dict]): nested relations to prefetch,
+                keyed by the name, all of them if not given.
+
+        Returns:
+            QuerySet: paths with steps, options and solutions.
+        """
+        paths = Path.objects.all()
+        if expand is None or "steps" in expand:
+            steps = StepSelector.with_nested(expand and expand["steps"])
+            paths = paths.prefetch_related(
+                models.Prefetch("steps", queryset=steps),
+            )
+        return paths
+
+
+class StepSelector:
+    """Handle step fetching operations."""
+
+    @classmethod
+    def with_nested(cls, expand: Optional[dict] = None) -> QuerySet:
+        """Return steps with the nested instances prefetched.
+
+        Args:
+            expand (Optional[dict]): nested relations to prefetch,
+                keyed by the name, all of them if not given.
+
+        Returns:
+            QuerySet: steps with options and solutions with their creators.
+        """
+        steps = Step.objects.all()
+        if expand is None or "solution" in expand:
+            steps = steps.select_related("solution__creator")
+        if expand is None or "options" in expand:
+            steps = steps.prefetch_related("options")
+        return steps
+
+    @classmethod
+    def is_in_tree(
+        cls,
+        step_uuid: Union[UUID, str],
+        tree: Union[Tree, UUID],
+    ) -> bool:
+        """Return True if the step belongs to the tree.
+
+        Looks up the single membership row by its unique index.
+
+        Args:
+            step_uuid (Union[UUID, str]): primary key of the step.
+            tree (Union[Tree, UUID]): tree or its primary key.
+
+        Returns:
+            bool: indicates if the step is on one of the tree paths.
+        """
+        try:
+            step_pk = UUID(str(step_uuid))
+        except ValueError:
+            return False
+        return TreeStep.objects.filter(tree=tree, step=step_pk).exists()
 
 
 class SolutionSelector:
     """Handle solution fetching operations."""
 
+    @classmethod
+    def with_creator(cls) -> QuerySet:
+        """Return solutions with their creators.
+
+        Returns:
+            QuerySet: solutions with creators.
+        """
+        return Solution.objects.select_related("creator")
+
+    @classmethod
+    def version(cls, pk: UUID) -> Optional[tuple[str, str, str]]:
+        """Return the fields the served solution changes with.
+
+        Description is identified by the hash of its rendered version.
+
+        Args:
+            pk (UUID): primary key of the solution.
+
+        Returns:
+            Optional[tuple[str, str, str]]: name, description hash
+                and the author name, None if the solution doesn't exist.
+        """
+        return (
+            Solution.objects.filter(pk=pk)
+            .values_list("name", "description_hash", "creator__username")
+            .first()
+        )
+
     @classmethod
     def for_path(cls, path: Path) -> Optional[Solution]:
         """Return solution for the path if the final step exists.
@@ -78,3 +351,66 @@ class SolutionSelector:
         if final_step:
             return final_step.solution
         return None
+
+
+class SearchSelector:
+    """Handle searching of the trees, solutions, steps and options."""
+
+    @classmethod
+    def search(cls, instances: QuerySet, text: str, limit: int) -> QuerySet:
+        """Return the best matches of the text, ranked.
+
+        Matches are found with the GIN index of the search vectors, so only
+        the matching instances are ranked.
+
+        Args:
+            instances (QuerySet): trees or solutions to search.
+            text (str): search text, in the web search engines syntax.
+            limit (int): maximal number of the matches.
+
+        Returns:
+            QuerySet: matching instances with the rank, best first.
+        """
+        query = SearchQuery(text, config=SEARCH_CONFIG, search_type="websearch")
+        return (
+            instances.filter(search_vector=query)
+            .annotate(rank=SearchRank(models.F("search_vector"), query))
+            .order_by("-rank", "pk")[:limit]
+        )
+
+    @classmethod
+    def similar_names(
+        cls,
+        model: type[models.Model],
+        scope: dict[str, UUID],
+        text: str,
+        limit: int,
+    ) -> QuerySet:
+        """Return the distinct step or option names similar to the text.
+
+        Names are matched by the word similarity of their trigrams,
+        with the trigram index, within the path or the tree.
+
+        Args:
+            model (type[models.Model]): step or option model.
+            scope (dict[str, UUID]): primary keys keyed by the scope.
+            text (str): typed text.
+            limit (int): maximal number of the names.
+
+        Returns:
+            QuerySet: names with the similarity, most similar first.
+        """
+        scope_lookups = NAME_SCOPES[model]
+        return (
+            model.objects.filter(
+                TrigramWordSimilar("name", text),
+                **{
+                    scope_lookups[scope_name]: scope_pk
+                    for scope_name, scope_pk in scope.items()
+                },
+            )
+            .values("name")
+            .annotate(similarity=TrigramWordSimilarity(text, "name"))
+            .order_by("-similarity", "name")
+            .distinct()[:limit]
+        )
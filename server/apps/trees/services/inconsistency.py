@@ -0,0 +1,235 @@
+"""Scanning services for Inconsistency model."""
+
+import itertools
+import time
+from typing import Collection
+from uuid import UUID
+
+from django.db import models, transaction
+from django.utils import timezone
+
+from server.apps.trees.derived_models import (
+    BROKEN_LINK,
+    DUPLICATE_OPTION,
+    ORPHANED_STEP,
+    Inconsistency,
+    InconsistencyScan,
+)
+from server.apps.trees.models import Option, Step, Tree
+
+
+class InconsistencyService:
+    """Handle finding and storing the inconsistencies of the trees.
+
+    Trees are scanned in chunks, with a few queries per chunk,
+    and the findings of the scanned trees replace the previous ones.
+    """
+
+    @classmethod
+    def scan_trees(cls, tree_pks: Collection[UUID]) -> int:
+        """Replace the inconsistencies of the trees with the current ones.
+
+        Args:
+            tree_pks (Collection[UUID]): primary keys of the trees.
+
+        Returns:
+            int: number of the found inconsistencies.
+        """
+        inconsistencies = [
+            *cls.find_broken_links(tree_pks),
+            *cls.find_orphaned_steps(tree_pks),
+            *cls.find_duplicate_options(tree_pks),
+        ]
+        with transaction.atomic():
+            Inconsistency.objects.filter(tree__in=tree_pks).delete()
+            Inconsistency.objects.bulk_create(inconsistencies)
+        return len(inconsistencies)
+
+    @classmethod
+    def find_broken_links(
+        cls,
+        tree_pks: Collection[UUID],
+    ) -> list[Inconsistency]:
+        """Find the options which next steps are missing.
+
+        Next steps are set to NULL when the steps are deleted.
+
+        Args:
+            tree_pks (Collection[UUID]): primary keys of the trees.
+
+        Returns:
+            list[Inconsistency]: options without the next steps.
+        """
+        options = Option.objects.filter(
+            trees__in=tree_pks,
+            next_step__isnull=True,
+        ).values(
+            "step",
+            "name",
+            option=models.F("pk"),
+            tree=models.F("trees"),
+            step_name=models.F("step__name"),
+        )
+        return [
+            Inconsistency(
+                tree_id=option["tree"],
+                kind=BROKEN_LINK,
+                step_name=option["step_name"],
+                step_id=option["step"],
+                option_id=option["option"],
+                option_name=option["name"],
+            )
+            for option in options
+        ]
+
+    @classmethod
+    def find_orphaned_steps(
+        cls,
+        tree_pks: Collection[UUID],
+    ) -> list[Inconsistency]:
+        """Find the steps no option of the tree leads to.
+
+        Steps are merged by name, so the step is orphaned when neither
+        of the steps with the same name is first or led to.
+
+        Args:
+            tree_pks (Collection[UUID]): primary keys of the trees.
+
+        Returns:
+            list[Inconsistency]: steps of the trees that cannot be reached.
+        """
+        steps = (
+            Step.objects.filter(trees__in=tree_pks)
+            .annotate(tree=models.F("trees"))
+            .exclude(
+                models.Exists(
+                    Step.objects.filter(
+                        trees=models.OuterRef("tree"),
+                        name=models.OuterRef("name"),
+                        is_first=True,
+                    ),
+                ),
+            )
+            .exclude(
+                models.Exists(
+                    Option.objects.filter(
+                        trees=models.OuterRef("tree"),
+                        next_step__name=models.OuterRef("name"),
+                    ),
+                ),
+            )
+            .values("pk", "name", "tree")
+        )
+        return [
+            Inconsistency(
+                tree_id=step["tree"],
+                kind=ORPHANED_STEP,
+                step_name=step["name"],
+                step_id=step["pk"],
+            )
+            for step in steps
+        ]
+
+    @classmethod
+    def find_duplicate_options(
+        cls,
+        tree_pks: Collection[UUID],
+    ) -> list[Inconsistency]:
+        """Find the options of the merged steps leading to different steps.
+
+        Merged step keeps only the first option with the given name,
+        so the others are silently ignored.
+
+        Args:
+            tree_pks (Collection[UUID]): primary keys of the trees.
+
+        Returns:
+            list[Inconsistency]: names of the duplicated options.
+        """
+        duplicates = (
+            Option.objects.filter(trees__in=tree_pks)
+            .values(
+                tree=models.F("trees"),
+                step_name=models.F("step__name"),
+                option_name=models.F("name"),
+            )
+            .annotate(
+                next_steps_count=models.Count(
+                    "next_step__name",
+                    distinct=True,
+                ),
+            )
+            .filter(next_steps_count__gt=1)
+            .order_by()
+        )
+        return [
+            Inconsistency(
+                tree_id=duplicate["tree"],
+                kind=DUPLICATE_OPTION,
+                step_name=duplicate["step_name"],
+                option_name=duplicate["option_name"],
+            )
+            for duplicate in duplicates
+        ]
+
+    @classmethod
+    def sweep(
+        cls,
+        chunk_size: int,
+        rate: float,
+        restart: bool = False,
+    ) -> InconsistencyScan:
+        """Scan all the trees in chunks, resuming the unfinished scan.
+
+        Trees are read with a server-side cursor, ordered by primary key,
+        and the progress is saved after every chunk.
+
+        Args:
+            chunk_size (int): number of trees scanned at once.
+            rate (float): trees scanned per second, zero for no limit.
+            restart (bool): indicates if the unfinished scan is dropped.
+
+        Returns:
+            InconsistencyScan: finished scan.
+        """
+        scan = (
+            InconsistencyScan.objects.filter(finished_at__isnull=True)
+            .order_by("created_at")
+            .last()
+        )
+        if scan is None or restart:
+            scan = InconsistencyScan.objects.create()
+        trees = Tree.objects.order_by("pk")
+        if scan.last_tree is not None:
+            trees = trees.filter(pk__gt=scan.last_tree)
+        tree_pks = trees.values_list("pk", flat=True).iterator(chunk_size)
+        chunk = list(itertools.islice(tree_pks, chunk_size))
+        while chunk:
+            cls.scan_chunk(scan, chunk, rate)
+            chunk = list(itertools.islice(tree_pks, chunk_size))
+        scan.finished_at = timezone.now()
+        scan.save()
+        return scan
+
+    @classmethod
+    def scan_chunk(
+        cls,
+        scan: InconsistencyScan,
+        tree_pks: list[UUID],
+        rate: float,
+    ) -> None:
+        """Scan the chunk of trees, save the progress and wait if needed.
+
+        Args:
+            scan (InconsistencyScan): current scan.
+            tree_pks (list[UUID]): primary keys of the trees, in order.
+            rate (float): trees scanned per second, zero for no limit.
+        """
+        started_at = time.monotonic()
+        cls.scan_trees(tree_pks)
+        scan.last_tree = tree_pks[-1]
+        scan.scanned_count += len(tree_pks)
+        scan.save()
+        if rate:
+            elapsed = time.monotonic() - started_at
+            time.sleep(max(len(tree_pks) / rate - elapsed, 0))
@@ -1,8 +1,12 @@
 """Create-update services for Option model."""
 
-from typing import TypedDict
+import copy
+from typing import Iterable, Optional, TypedDict
 
+from server.apps.generic.validation import BatchValidator
 from server.apps.trees.models import Option, Step
+from server.apps.trees.selectors import TreeSelector
+from server.apps.trees.services.tree import TreeService
 from server.apps.users.models import User
 
 
@@ -56,3 +60,92 @@ class OptionService:
         instance.name = payload["name"]
         instance.save()
         return instance
+
+    @classmethod
+    def relink_options(
+        cls,
+        options: Iterable[Option],
+        next_step: Optional[Step],
+    ) -> int:
+        """Point the options to the next step, with a single update.
+
+        Args:
+            options (Iterable[Option]): options to relink.
+            next_step (Optional[Step]): step the options lead to.
+
+        Returns:
+            int: number of the relinked options.
+        """
+        return cls.update_options(options, next_step=next_step)
+
+    @classmethod
+    def move_options(cls, options: Iterable[Option], step: Step) -> int:
+        """Move the options to the step, with a single update.
+
+        Args:
+            options (Iterable[Option]): options to move.
+            step (Step): new step of the options.
+
+        Returns:
+            int: number of the moved options.
+        """
+        return cls.update_options(options, step=step)
+
+    @classmethod
+    def update_options(cls, options: Iterable[Option], **fields) -> int:
+        """Set the fields of the options in bulk and refresh their trees.
+
+        Instead of saving the options one by one, they are validated
+        as a batch and updated with a single 'UPDATE ... WHERE uuid IN'.
+        Memberships are synced only if the options are moved to another
+        step, otherwise the trees of the options are refreshed as they are.
+
+        Args:
+            options (Iterable[Option]): options to update.
+            fields (dict): new values of the fields, keyed by the name.
+
+        Returns:
+            int: number of the updated options.
+        """
+        changed_options = cls.validate_changes(options, fields)
+        if not changed_options:
+            return 0
+        option_pks = [option.pk for option in changed_options]
+        updated_count = Option.objects.filter(pk__in=option_pks).update(
+            **fields,
+        )
+        if "step" in fields:
+            TreeService.members_changed(options=changed_options)
+        else:
+            TreeService.trees_changed(
+                TreeSelector.for_options(changed_options).values_list(
+                    "pk",
+                    flat=True,
+                ),
+            )
+        return updated_count
+
+    @classmethod
+    def validate_changes(
+        cls,
+        options: Iterable[Option],
+        fields: dict,
+    ) -> list[Option]:
+        """Validate the options with the new fields, as a batch.
+
+        Fields are set on the copies, so the given options stay
+        as they are, even if the validation fails.
+
+        Args:
+            options (Iterable[Option]): options to update.
+            fields (dict): new values of the fields, keyed by the name.
+
+        Returns:
+            list[Option]: validated copies of the options, with the fields.
+        """
+        changed_options = [copy.copy(option) for option in options]
+        for option in changed_options:
+            for field_name, field_value in fields.items():
+                setattr(option, field_name, field_value)
+        BatchValidator.validate(changed_options)
+        return changed_options
@@ -0,0 +1,48 @@
+"""Maintenance services of the search vectors."""
+
+from types import MappingProxyType
+
+from django.contrib.postgres.search import SearchVector
+from django.db.models import QuerySet
+
+from server.apps.trees.models import SEARCH_CONFIG, Solution, Tree
+
+SEARCH_VECTORS = MappingProxyType(
+    {
+        Tree: (
+            SearchVector("name", weight="A", config=SEARCH_CONFIG)
+            + SearchVector("description", weight="B", config=SEARCH_CONFIG)
+        ),
+        # PostgreSQL parser skips the tags and entities of the rendered
+        # Markdown, so only its text is indexed.
+        Solution: (
+            SearchVector("name", weight="A", config=SEARCH_CONFIG)
+            + SearchVector(
+                "description_html",
+                weight="B",
+                config=SEARCH_CONFIG,
+            )
+        ),
+    },
+)
+
+
+class SearchVectorService:
+    """Handle storing the search vectors of the trees and solutions.
+
+    Vectors are computed by the database from the stored columns,
+    with the names weighted above the descriptions, so any number
+    of instances is indexed with a single query.
+    """
+
+    @classmethod
+    def update_vectors(cls, instances: QuerySet) -> int:
+        """Store the search vectors of the trees or solutions.
+
+        Args:
+            instances (QuerySet): trees or solutions to index.
+
+        Returns:
+            int: number of the updated instances.
+        """
+        return instances.update(search_vector=SEARCH_VECTORS[instances.model])
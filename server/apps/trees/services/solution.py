@@ -3,6 +3,10 @@
 from typing import TypedDict
 
 from server.apps.trees.models import Solution
+from server.apps.trees.rendering import DescriptionRenderer
+from server.apps.trees.selectors import TreeSelector
+from server.apps.trees.services.search import SearchVectorService
+from server.apps.trees.services.tree import TreeService
 from server.apps.users.models import User
 
 
@@ -56,3 +60,77 @@ class SolutionService:
         instance.description = payload["description"]
         instance.save()
         return instance
+
+    @classmethod
+    def render_description(cls, instance: Solution) -> bool:
+        """Render the description of the solution, unless it's up to date.
+
+        Args:
+            instance (Solution): solution to render the description of.
+
+        Returns:
+            bool: indicates if the description was rendered.
+        """
+        description_hash = DescriptionRenderer.content_hash(
+            instance.description,
+        )
+        if instance.description_hash == description_hash:
+            return False
+        instance.description_html = DescriptionRenderer.render(
+            instance.description,
+        )
+        instance.description_hash = description_hash
+        return True
+
+    @classmethod
+    def render_stale_descriptions(cls, chunk_size: int) -> int:
+        """Render the descriptions rendered with another configuration.
+
+        Solutions are updated in chunks, trees leading to them
+        are refreshed after every chunk.
+
+        Args:
+            chunk_size (int): number of solutions fetched and updated at once.
+
+        Returns:
+            int: number of the rendered descriptions.
+        """
+        solutions = Solution.objects.only(
+            "description",
+            "description_hash",
+        ).order_by("pk")
+        rendered_count = 0
+        stale_solutions = []
+        for solution in solutions.iterator(chunk_size=chunk_size):
+            if cls.render_description(solution):
+                stale_solutions.append(solution)
+            if len(stale_solutions) == chunk_size:
+                rendered_count += cls.update_descriptions(stale_solutions)
+                stale_solutions = []
+        return rendered_count + cls.update_descriptions(stale_solutions)
+
+    @classmethod
+    def update_descriptions(cls, solutions: list[Solution]) -> int:
+        """Store the rendered descriptions and refresh the affected trees.
+
+        Args:
+            solutions (list[Solution]): solutions with rendered descriptions.
+
+        Returns:
+            int: number of the updated solutions.
+        """
+        if not solutions:
+            return 0
+        Solution.objects.bulk_update(
+            solutions,
+            ("description_html", "description_hash"),
+        )
+        SearchVectorService.update_vectors(
+            Solution.objects.filter(
+                pk__in=[solution.pk for solution in solutions],
+            ),
+        )
+        TreeService.trees_changed(
+            TreeSelector.for_solutions(solutions).values_list("pk", flat=True),
+        )
+        return len(solutions)
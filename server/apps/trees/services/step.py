@@ -2,7 +2,10 @@
 
 from typing import Iterable, TypedDict
 
+from django.db import transaction
+
 from server.apps.trees.models import Option, Path, Solution, Step
+from server.apps.trees.services.option import OptionService
 from server.apps.users.models import User
 
 
@@ -31,15 +34,19 @@ class StepService:
     def create_step_for_path(cls, payload: StepCreatePayload) -> Step:
         """Create the step instance with the given payload.
 
+        Preceding options are relinked with a single update,
+        and the affected trees are refreshed once, after the commit.
+
         Args:
             payload (StepCreatePayload): payload containing step data.
 
         Returns:
             Step: created step instance.
         """
-        preceding_options = payload.pop("preceding_options")
-        step = Step.objects.create(**payload)
-        step.preceding_options.set(preceding_options)
+        preceding_options = payload.pop("preceding_options", None) or ()
+        with transaction.atomic():
+            step = Step.objects.create(**payload)
+            OptionService.relink_options(preceding_options, step)
         return step
 
     @classmethod
@@ -1,8 +1,16 @@
 """Create-update services for Tree model."""
 
-from typing import Iterable, TypedDict
+from typing import Collection, Iterable, Optional, TypedDict
+from uuid import UUID
 
-from server.apps.trees.models import Path, Tree
+from django.db import transaction
+
+from server.apps.trees.cohesion import CohesionIssue, CohesionValidator
+from server.apps.trees.graph import TreeGraphCache
+from server.apps.trees.models import Option, Path, Tree, TreePath
+from server.apps.trees.selectors import TreeSelector
+from server.apps.trees.services.tree_membership import TreeMembershipService
+from server.apps.trees.services.tree_refresh import TreeRefreshService
 from server.apps.users.models import User
 
 
@@ -36,8 +44,17 @@ class TreeService:
         return Tree.objects.create(**payload)
 
     @classmethod
-    def update_tree(cls, instance: Tree, payload: TreeUpdatePayload) -> Tree:
-        """Update the tree instance with the given payload.
+    def update_tree(
+        cls,
+        instance: Tree,
+        payload: TreeUpdatePayload,
+    ) -> Tree:
+        """Update the tree instance with the given payload, atomically.
+
+        Tree is saved only if its name has changed, and only the paths
+        that differ are added or removed. Cohesion is not validated here,
+        as the trees are built a step at a time and pass through the
+        incohesive states, the issues are reported by 'check_cohesion'.
 
         Args:
             instance (Tree): current tree instance.
@@ -46,8 +63,133 @@ class TreeService:
         Returns:
             Tree: updated tree instance.
         """
-        instance.name = payload["name"]
-        instance.save()
-        instance.paths.set(payload["paths"])
-        # TODO: Add validation for steps and options cohesion.
+        with transaction.atomic():
+            if instance.name != payload["name"]:
+                instance.name = payload["name"]
+                instance.save(update_fields=["name"])
+            added_pks, removed_pks = cls.update_paths(
+                instance,
+                payload.get("paths"),
+            )
+            if added_pks or removed_pks:
+                cls.paths_changed({instance.pk}, added_pks | removed_pks)
         return instance
+
+    @classmethod
+    def update_paths(
+        cls,
+        instance: Tree,
+        paths: Optional[Iterable[Path]],
+    ) -> tuple[set[UUID], set[UUID]]:
+        """Add and remove the paths differing from the current ones.
+
+        Rows of the paths relation are written without its signals,
+        so the caller syncs the memberships of the changed paths
+        and invalidates the tree at once.
+
+        Args:
+            instance (Tree): current tree instance.
+            paths (Optional[Iterable[Path]]): new paths of the tree,
+                kept as they are if not given.
+
+        Returns:
+            tuple[set[UUID], set[UUID]]: primary keys of the added
+                and the removed paths.
+        """
+        if paths is None:
+            return set(), set()
+        path_pks = {path.pk for path in paths}
+        current_pks = set(instance.paths.values_list("pk", flat=True))
+        removed_pks = current_pks - path_pks
+        added_pks = path_pks - current_pks
+        if removed_pks:
+            TreePath.objects.filter(
+                tree=instance,
+                path__in=removed_pks,
+            ).delete()
+        if added_pks:
+            TreePath.objects.bulk_create(
+                TreePath(tree=instance, path_id=path_pk)
+                for path_pk in added_pks
+            )
+        return added_pks, removed_pks
+
+    @classmethod
+    def check_cohesion(cls, tree: Tree) -> list[CohesionIssue]:
+        """Validate the steps and options of the tree fit together.
+
+        Trees are edited gradually, so the issues are reported,
+        not raised. The whole compiled graph is validated,
+        in linear time of its steps and options.
+
+        Args:
+            tree (Tree): tree to validate.
+
+        Returns:
+            list[CohesionIssue]: found issues.
+        """
+        graph = TreeGraphCache.get(tree.pk) or TreeGraphCache.compile(tree)
+        return CohesionValidator(graph).validate()
+
+    @classmethod
+    def trees_changed(cls, tree_pks: Iterable[UUID]) -> None:
+        """Refresh the data derived from the trees, once the change commits.
+
+        Compiled graphs of the trees are dropped immediately, so they are
+        not served until the trees are refreshed. Called by the signals,
+        and by hand after the steps or options are changed in bulk.
+
+        Args:
+            tree_pks (Iterable[UUID]): primary keys of the changed trees.
+        """
+        tree_pks = set(tree_pks)
+        TreeGraphCache.invalidate(tree_pks)
+        TreeRefreshService.schedule(tree_pks)
+
+    @classmethod
+    def members_changed(
+        cls,
+        steps: Collection[UUID] = (),
+        options: Collection[Option] = (),
+        moved_steps: Collection[UUID] = (),
+    ) -> None:
+        """Sync the memberships of the saved steps and options.
+
+        Trees the steps and options are moved out of are found before
+        the memberships are synced, and refreshed along with the rest.
+
+        Args:
+            steps (Collection[UUID]): created or updated steps.
+            options (Collection[Option]): created or updated options.
+            moved_steps (Collection[UUID]): updated steps, which options
+                may have moved with them.
+        """
+        option_pks = {option.pk for option in options}
+        tree_pks = set(
+            (
+                TreeSelector.for_steps(steps)
+                | TreeSelector.for_options(options)
+            ).values_list("pk", flat=True),
+        )
+        if steps:
+            TreeMembershipService.sync_steps(steps)
+        if moved_steps:
+            TreeMembershipService.sync_step_options(moved_steps)
+        if option_pks:
+            TreeMembershipService.sync_options(option_pks)
+        cls.trees_changed(tree_pks)
+
+    @classmethod
+    def paths_changed(
+        cls,
+        tree_pks: Collection[UUID],
+        path_pks: Collection[UUID],
+    ) -> None:
+        """Sync the memberships of the paths added to or removed from trees.
+
+        Args:
+            tree_pks (Collection[UUID]): primary keys of the trees.
+            path_pks (Collection[UUID]): primary keys of the paths.
+        """
+        TreeMembershipService.sync_links(tree_pks, path_pks)
+        cls.trees_changed(tree_pks)
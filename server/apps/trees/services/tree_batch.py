@@ -0,0 +1,334 @@
+"""Atomic batch edits of the paths, steps and options."""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Iterable, Optional, TypedDict
+from uuid import UUID
+
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+
+from server.apps.generic.validation import BatchValidator
+from server.apps.trees.models import Option, Path, Solution, Step
+from server.apps.trees.services.tree import TreeService
+from server.apps.trees.services.tree_refresh import TreeRefreshService
+from server.apps.users.models import User
+
+CREATE = "create"
+UPDATE = "update"
+DELETE = "delete"
+BATCH_SIZE = 1000
+BATCH_MODELS = MappingProxyType(
+    {"path": Path, "step": Step, "option": Option},
+)
+REFERENCE_MODELS = MappingProxyType(
+    {"path": Path, "step": Step, "next_step": Step, "solution": Solution},
+)
+ChangedFields = dict[models.Model, set[str]]
+ReferredPks = dict[type[models.Model], set[Optional[UUID]]]
+
+
+class BatchOperationPayload(TypedDict, total=False):
+    """Payload of the single operation of the batch."""
+
+    op: str
+    model: str
+    id: str
+    pk: str
+    data: dict
+
+
+class TreeBatchPayload(TypedDict):
+    """Payload of the ordered operations of the batch."""
+
+    creator: User
+    operations: list[BatchOperationPayload]
+
+
+def parse_pk(reference: str) -> Optional[UUID]:
+    """Return the primary key the reference stands for, if any.
+
+    Args:
+        reference (str): temporary id or primary key.
+
+    Returns:
+        Optional[UUID]: primary key, None for the temporary ids.
+    """
+    try:
+        return UUID(reference)
+    except ValueError:
+        return None
+
+
+def collect_references(
+    operations: Iterable[BatchOperationPayload],
+) -> ReferredPks:
+    """Collect the primary keys the operations refer to, per model.
+
+    Args:
+        operations (Iterable[BatchOperationPayload]): batch operations.
+
+    Returns:
+        ReferredPks: referred primary keys, keyed by the model.
+    """
+    references = defaultdict(set)
+    for operation in operations:
+        references[BATCH_MODELS[operation["model"]]].add(
+            parse_pk(operation.get("pk", "")),
+        )
+        data = operation["data"]
+        for field_name in REFERENCE_MODELS.keys() & data.keys():
+            references[REFERENCE_MODELS[field_name]].add(
+                parse_pk(data[field_name] or ""),
+            )
+    return references
+
+
+def existing_changes(
+    model: type[models.Model],
+    changes: ChangedFields,
+) -> ChangedFields:
+    """Return the changes of the instances which rows still exist.
+
+    Args:
+        model (type[models.Model]): model of the instances.
+        changes (ChangedFields): changed fields, keyed by the instances.
+
+    Returns:
+        ChangedFields: changes of the existing instances.
+    """
+    existing_pks = set(
+        model.objects.filter(
+            pk__in=[instance.pk for instance in changes],
+        ).values_list("pk", flat=True),
+    )
+    return {
+        instance: field_names
+        for instance, field_names in changes.items()
+        if instance.pk in existing_pks
+    }
+
+
+@dataclass
+class TreeBatch:
+    """Changes of the batch, collected in memory before they are saved.
+
+    Instances created by the batch are referred to by their temporary ids,
+    the existing ones by the primary keys. Existing instances are loaded
+    with a single query per model, and the changes are saved in bulk,
+    level by level, so the instances are saved after the ones they refer to.
+    """
+
+    creator: User
+    loaded: dict[type[models.Model], dict[UUID, models.Model]] = field(
+        default_factory=lambda: defaultdict(dict),
+    )
+    temporary: dict[str, models.Model] = field(default_factory=dict)
+    created: dict[type[models.Model], list[models.Model]] = field(
+        default_factory=lambda: defaultdict(list),
+    )
+    updated: dict[type[models.Model], ChangedFields] = field(
+        default_factory=lambda: defaultdict(dict),
+    )
+    deleted: set[models.Model] = field(default_factory=set)
+
+    def load(self, operations: Iterable[BatchOperationPayload]) -> None:
+        """Load the existing instances the operations refer to.
+
+        Args:
+            operations (Iterable[BatchOperationPayload]): batch operations.
+        """
+        references = collect_references(operations)
+        for model, pks in references.items():
+            self.loaded[model] = model.objects.in_bulk(pks - {None})
+
+    def resolve(
+        self,
+        model: type[models.Model],
+        reference: str,
+        index: int,
+    ) -> models.Model:
+        """Return the instance the reference stands for.
+
+        Args:
+            model (type[models.Model]): expected model of the instance.
+            reference (str): temporary id or primary key.
+            index (int): index of the operation.
+
+        Raises:
+            ValidationError: if there is no such instance,
+                or it is deleted by one of the previous operations.
+
+        Returns:
+            models.Model: created or loaded instance.
+        """
+        instance = self.temporary.get(reference)
+        pk = parse_pk(reference)
+        if instance is None and pk is not None:
+            instance = self.loaded[model].get(pk)
+        if not isinstance(instance, model) or instance in self.deleted:
+            model_name = model._meta.model_name  # noqa: WPS437
+            raise ValidationError(
+                f"Operation {index}: unknown {model_name} {reference}.",
+            )
+        return instance
+
+    def apply(self, index: int, operation: BatchOperationPayload) -> None:
+        """Apply the operation to the instances in memory.
+
+        Args:
+            index (int): index of the operation.
+            operation (BatchOperationPayload): operation to apply.
+        """
+        model = BATCH_MODELS[operation["model"]]
+        data = {
+            field_name: (
+                self.resolve(REFERENCE_MODELS[field_name], field_value, index)
+                if field_name in REFERENCE_MODELS and field_value
+                else field_value
+            )
+            for field_name, field_value in operation["data"].items()
+        }
+        if operation["op"] == CREATE:
+            self.create(model, data, operation.get("id"))
+            return
+        instance = self.resolve(model, operation["pk"], index)
+        if operation["op"] == DELETE:
+            self.deleted.add(instance)
+            self.updated[model].pop(instance, None)
+            if instance._state.adding:  # noqa: WPS437
+                self.created[model].remove(instance)
+            return
+        for field_name, field_value in data.items():
+            setattr(instance, field_name, field_value)
+        if not instance._state.adding:  # noqa: WPS437
+            self.updated[model].setdefault(instance, set()).update(data)
+
+    def create(
+        self,
+        model: type[models.Model],
+        data: dict,
+        temporary_id: Optional[str],
+    ) -> None:
+        """Build the new instance, to be inserted with its level.
+
+        Args:
+            model (type[models.Model]): model of the instance.
+            data (dict): fields of the instance.
+            temporary_id (Optional[str]): id the batch refers to it with.
+        """
+        if model is Path:
+            data["creator"] = self.creator
+        instance = model(**data)
+        self.created[model].append(instance)
+        if temporary_id is not None:
+            self.temporary[temporary_id] = instance
+
+    def save(self) -> None:
+        """Delete, update and insert the instances in bulk.
+
+        Deletes go first, and on each level updates go before inserts,
+        so the names freed by the batch can be taken again.
+        """
+        self.delete_instances()
+        for model in BATCH_MODELS.values():
+            updated = self.updated[model]
+            update_fields = {
+                name for fields in updated.values() for name in fields
+            }
+            BatchValidator.validate(list(updated))
+            if updated:
+                model.objects.bulk_update(
+                    updated,
+                    sorted(update_fields),
+                    batch_size=BATCH_SIZE,
+                )
+            BatchValidator.validate(self.created[model])
+            model.objects.bulk_create(
+                self.created[model],
+                batch_size=BATCH_SIZE,
+            )
+
+    def delete_instances(self) -> None:
+        """Delete the instances in bulk, before the rest is saved.
+
+        Trees of the deleted instances are refreshed at once,
+        instead of by the signals of every deleted instance.
+        Updates of the rows deleted by the cascades are dropped.
+        Deleted instances are marked as not saved, so the instances
+        referring to them are validated against the database.
+        """
+        with TreeRefreshService.mute_signals(
+            deleted
+            for deleted in self.deleted
+            if not deleted._state.adding  # noqa: WPS437
+        ) as tree_pks:
+            for deleted_model in reversed(BATCH_MODELS.values()):
+                deleted_model.objects.filter(
+                    pk__in=[
+                        deleted.pk
+                        for deleted in self.deleted
+                        if isinstance(deleted, deleted_model)
+                        and not deleted._state.adding  # noqa: WPS437
+                    ],
+                ).delete()
+            TreeService.trees_changed(tree_pks)
+        for instance in self.deleted:
+            instance._state.adding = True  # noqa: WPS437
+        if self.deleted:
+            for model, updated in self.updated.items():
+                self.updated[model] = existing_changes(model, updated)
+
+    @property
+    def mapping(self) -> dict[str, UUID]:
+        """Return the primary keys of the created instances.
+
+        Returns:
+            dict[str, UUID]: primary keys keyed by the temporary ids.
+        """
+        return {
+            temporary_id: instance.pk
+            for temporary_id, instance in self.temporary.items()
+            if instance not in self.deleted
+        }
+
+
+class TreeBatchService:
+    """Handle applying the batches of edits to the trees.
+
+    Operations are applied in memory, in order, and saved in bulk within
+    a single transaction. Each affected tree is refreshed exactly once.
+    """
+
+    @classmethod
+    def apply_batch(
+        cls,
+        payload: TreeBatchPayload,
+    ) -> tuple[dict[str, UUID], set[UUID]]:
+        """Create, update and delete the instances of the batch.
+
+        Args:
+            payload (TreeBatchPayload): validated batch operations.
+
+        Returns:
+            tuple[dict[str, UUID], set[UUID]]: primary keys of the created
+                instances keyed by their temporary ids, and primary keys
+                of the affected trees.
+        """
+        batch = TreeBatch(payload["creator"])
+        batch.load(payload["operations"])
+        for index, operation in enumerate(payload["operations"]):
+            batch.apply(index, operation)
+        with transaction.atomic():
+            with TreeRefreshService.track_changes() as tree_pks:
+                batch.save()
+                TreeService.members_changed(
+                    steps={
+                        step.pk
+                        for step in (*batch.created[Step], *batch.updated[Step])
+                    },
+                    options=[*batch.created[Option], *batch.updated[Option]],
+                    moved_steps=[step.pk for step in batch.updated[Step]],
+                )
+                return batch.mapping, tree_pks
@@ -0,0 +1,222 @@
+"""Bulk import service for whole trees."""
+
+from dataclasses import dataclass, field
+from typing import Optional, TypedDict
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import Model
+
+from server.apps.generic.validation import BatchValidator
+from server.apps.trees.models import Option, Path, Solution, Step, Tree
+from server.apps.trees.services.search import SearchVectorService
+from server.apps.trees.services.solution import SolutionService
+from server.apps.trees.services.tree import TreeService
+from server.apps.trees.services.tree_membership import TreeMembershipService
+from server.apps.users.models import User
+
+IMPORT_BATCH_SIZE = 1000
+GENERATED_FIELDS = ("uuid",)
+
+
+class SolutionImportPayload(TypedDict):
+    """Payload of the imported solution."""
+
+    id: str
+    name: str
+    description: str
+
+
+class OptionImportPayload(TypedDict, total=False):
+    """Payload of the imported option."""
+
+    id: str
+    name: str
+    next_step: Optional[str]
+
+
+class StepImportPayload(TypedDict, total=False):
+    """Payload of the imported step."""
+
+    id: str
+    name: str
+    is_first: bool
+    is_final: bool
+    solution: Optional[str]
+    options: list[OptionImportPayload]
+
+
+class PathImportPayload(TypedDict, total=False):
+    """Payload of the imported path."""
+
+    id: str
+    name: str
+    steps: list[StepImportPayload]
+
+
+class TreeImportPayload(TypedDict):
+    """Payload of the imported tree document."""
+
+    name: str
+    description: str
+    creator: User
+    solutions: list[SolutionImportPayload]
+    paths: list[PathImportPayload]
+
+
+@dataclass
+class TreeDocument:
+    """Instances of the imported tree document, built in memory.
+
+    Primary keys are generated upfront, so the instances can refer
+    to each other before they are inserted.
+    """
+
+    tree: Tree
+    solutions: dict[str, Solution] = field(default_factory=dict)
+    paths: list[Path] = field(default_factory=list)
+    steps: dict[str, Step] = field(default_factory=dict)
+    options: list[Option] = field(default_factory=list)
+    mapping: dict[str, UUID] = field(default_factory=dict)
+
+    def add_solution(self, solution_data: SolutionImportPayload) -> None:
+        """Build the solution with its description rendered.
+
+        Args:
+            solution_data (SolutionImportPayload): imported solution.
+        """
+        solution = Solution(
+            name=solution_data["name"],
+            description=solution_data["description"],
+            creator=self.tree.creator,
+        )
+        SolutionService.render_description(solution)
+        self.solutions[solution_data["id"]] = solution
+        self.register(solution_data["id"], solution)
+
+    def add_path(self, path_data: PathImportPayload) -> None:
+        """Build the path with its steps.
+
+        Args:
+            path_data (PathImportPayload): imported path.
+        """
+        path = Path(name=path_data["name"], creator=self.tree.creator)
+        self.paths.append(path)
+        self.register(path_data.get("id"), path)
+        for step_data in path_data["steps"]:
+            solution_id = step_data.get("solution")
+            step = Step(
+                name=step_data["name"],
+                path=path,
+                is_first=step_data.get("is_first", False),
+                is_final=step_data.get("is_final", False),
+                solution=self.solutions[solution_id] if solution_id else None,
+            )
+            self.steps[step_data["id"]] = step
+            self.register(step_data["id"], step)
+
+    def add_options(self, path_data: PathImportPayload) -> None:
+        """Build the options of the path steps, once all the steps are built.
+
+        Args:
+            path_data (PathImportPayload): imported path.
+        """
+        for step_data in path_data["steps"]:
+            for option_data in step_data.get("options", []):
+                next_id = option_data.get("next_step")
+                option = Option(
+                    name=option_data["name"],
+                    step=self.steps[step_data["id"]],
+                    next_step=self.steps[next_id] if next_id else None,
+                )
+                self.options.append(option)
+                self.register(option_data.get("id"), option)
+
+    def register(self, local_id: Optional[str], instance: Model) -> None:
+        """Map the document id to the primary key of the instance.
+
+        Args:
+            local_id (Optional[str]): document id, if given.
+            instance (Model): built instance.
+        """
+        if local_id is not None:
+            self.mapping[local_id] = instance.pk
+
+    def save(self) -> None:
+        """Validate and insert the instances in bulk, level by level.
+
+        Each level is validated as a batch once the instances it refers to
+        are inserted, with a single query per unique constraint. Primary
+        keys generated for the document are not checked against the rows.
+        Solutions are indexed for the search at once.
+        """
+        BatchValidator.validate([self.tree], exclude=GENERATED_FIELDS)
+        self.tree.save(validate=False)
+        levels = (
+            (Solution, list(self.solutions.values())),
+            (Path, self.paths),
+            (Step, list(self.steps.values())),
+            (Option, self.options),
+        )
+        for model, instances in levels:
+            BatchValidator.validate(instances, exclude=GENERATED_FIELDS)
+            model.objects.bulk_create(instances, batch_size=IMPORT_BATCH_SIZE)
+        SearchVectorService.update_vectors(
+            Solution.objects.filter(
+                pk__in=[solution.pk for solution in self.solutions.values()],
+            ),
+        )
+        Tree.paths.through.objects.bulk_create(
+            [
+                Tree.paths.through(tree=self.tree, path=path)
+                for path in self.paths
+            ],
+            batch_size=IMPORT_BATCH_SIZE,
+        )
+
+
+class TreeImportService:
+    """Handle importing the whole tree documents.
+
+    Document refers to its solutions and steps by the ids local
+    to the document. It is expected to be validated already,
+    so all the instances are validated and inserted in bulk
+    within a single transaction.
+    """
+
+    @classmethod
+    def import_tree(
+        cls,
+        payload: TreeImportPayload,
+    ) -> tuple[Tree, dict[str, UUID]]:
+        """Create the tree with all its paths, steps, options and solutions.
+
+        Args:
+            payload (TreeImportPayload): validated tree document.
+
+        Returns:
+            tuple[Tree, dict[str, UUID]]: created tree and primary keys
+                of the instances, keyed by their document ids.
+        """
+        document = TreeDocument(
+            Tree(
+                name=payload["name"],
+                description=payload["description"],
+                creator=payload["creator"],
+            ),
+        )
+        for solution_data in payload["solutions"]:
+            document.add_solution(solution_data)
+        for path_data in payload["paths"]:
+            document.add_path(path_data)
+        for imported_path_data in payload["paths"]:
+            document.add_options(imported_path_data)
+        with transaction.atomic():
+            document.save()
+            TreeMembershipService.add_tree_members(
+                document.tree.pk,
+                document.steps.values(),
+                document.options,
+            )
+            TreeService.trees_changed({document.tree.pk})
+        return document.tree, document.mapping
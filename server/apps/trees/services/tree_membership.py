@@ -0,0 +1,172 @@
+"""Maintenance services for TreeStep and TreeOption models."""
+
+from types import MappingProxyType
+from typing import Collection, Iterable
+from uuid import UUID
+
+from django.db import models
+
+from server.apps.trees.derived_models import TreeOption, TreeStep
+from server.apps.trees.models import Option, Step, Tree
+
+BATCH_SIZE = 1000
+MEMBER_PATHS = MappingProxyType(
+    {TreeStep: ("step", "path"), TreeOption: ("option", "step__path")},
+)
+
+
+class TreeMembershipService:
+    """Handle syncing of the steps and options memberships in the trees.
+
+    Steps belong to the trees of their paths, and options to the trees
+    of their steps. Only the rows of the changed instances and paths
+    are synced, stale rows are deleted and the missing ones inserted,
+    so the concurrent syncs do not conflict.
+    """
+
+    @classmethod
+    def sync_steps(cls, step_pks: Collection[UUID]) -> None:
+        """Sync the memberships of the created or moved steps.
+
+        Args:
+            step_pks (Collection[UUID]): primary keys of the steps.
+        """
+        cls.sync(
+            TreeStep,
+            Step.objects.filter(pk__in=step_pks),
+            TreeStep.objects.filter(step__in=step_pks),
+        )
+
+    @classmethod
+    def sync_options(cls, option_pks: Collection[UUID]) -> None:
+        """Sync the memberships of the created or moved options.
+
+        Args:
+            option_pks (Collection[UUID]): primary keys of the options.
+        """
+        cls.sync(
+            TreeOption,
+            Option.objects.filter(pk__in=option_pks),
+            TreeOption.objects.filter(option__in=option_pks),
+        )
+
+    @classmethod
+    def sync_step_options(cls, step_pks: Collection[UUID]) -> None:
+        """Sync the memberships of the options of the moved steps.
+
+        Args:
+            step_pks (Collection[UUID]): primary keys of the steps.
+        """
+        cls.sync(
+            TreeOption,
+            Option.objects.filter(step__in=step_pks),
+            TreeOption.objects.filter(option__step__in=step_pks),
+        )
+
+    @classmethod
+    def sync_links(
+        cls,
+        tree_pks: Collection[UUID],
+        path_pks: Collection[UUID],
+    ) -> None:
+        """Sync the memberships, after the paths are added to the trees.
+
+        Paths removed from the trees are synced the same way.
+
+        Args:
+            tree_pks (Collection[UUID]): primary keys of the trees.
+            path_pks (Collection[UUID]): primary keys of the paths.
+        """
+        cls.sync(
+            TreeStep,
+            Step.objects.filter(path__in=path_pks, path__trees__in=tree_pks),
+            TreeStep.objects.filter(tree__in=tree_pks, step__path__in=path_pks),
+        )
+        cls.sync(
+            TreeOption,
+            Option.objects.filter(
+                step__path__in=path_pks,
+                step__path__trees__in=tree_pks,
+            ),
+            TreeOption.objects.filter(
+                tree__in=tree_pks,
+                option__step__path__in=path_pks,
+            ),
+        )
+
+    @classmethod
+    def sync_trees(cls, tree_pks: Collection[UUID]) -> None:
+        """Sync all the memberships of the trees.
+
+        Args:
+            tree_pks (Collection[UUID]): primary keys of the trees.
+        """
+        cls.sync(
+            TreeStep,
+            Step.objects.filter(path__trees__in=tree_pks),
+            TreeStep.objects.filter(tree__in=tree_pks),
+        )
+        cls.sync(
+            TreeOption,
+            Option.objects.filter(step__path__trees__in=tree_pks),
+            TreeOption.objects.filter(tree__in=tree_pks),
+        )
+
+    @classmethod
+    def add_tree_members(
+        cls,
+        tree_pk: UUID,
+        steps: Iterable[Step],
+        options: Iterable[Option],
+    ) -> None:
+        """Insert the memberships of all the steps and options of new tree.
+
+        Args:
+            tree_pk (UUID): primary key of the tree.
+            steps (Iterable[Step]): steps of the tree paths.
+            options (Iterable[Option]): options of the steps.
+        """
+        TreeStep.objects.bulk_create(
+            [TreeStep(tree_id=tree_pk, step=step) for step in steps],
+            batch_size=BATCH_SIZE,
+        )
+        TreeOption.objects.bulk_create(
+            [TreeOption(tree_id=tree_pk, option=option) for option in options],
+            batch_size=BATCH_SIZE,
+        )
+
+    @classmethod
+    def sync(
+        cls,
+        model: type[models.Model],
+        members: models.QuerySet,
+        entries: models.QuerySet,
+    ) -> None:
+        """Delete the stale entries and insert the missing ones.
+
+        Trees of the members are limited by the lookups of their query.
+
+        Args:
+            model (type[models.Model]): membership model.
+            members (models.QuerySet): steps or options to sync.
+            entries (models.QuerySet): memberships of the members.
+        """
+        member_name, path_lookup = MEMBER_PATHS[model]
+        entries.exclude(
+            models.Exists(
+                Tree.paths.through.objects.filter(
+                    tree=models.OuterRef("tree"),
+                    path=models.OuterRef(f"{member_name}__{path_lookup}"),
+                ),
+            ),
+        ).delete()
+        tree_members = members.values_list(f"{path_lookup}__trees", "pk")
+        model.objects.bulk_create(
+            [
+                model(tree_id=tree_pk, **{f"{member_name}_id": member_pk})
+                for tree_pk, member_pk in tree_members
+                if tree_pk is not None
+            ],
+            batch_size=BATCH_SIZE,
+            ignore_conflicts=True,
+        )
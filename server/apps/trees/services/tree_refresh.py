@@ -0,0 +1,158 @@
+"""Refreshing of the data derived from the trees."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Collection, Iterable, Iterator, Optional
+from uuid import UUID
+
+from django.db import models, transaction
+
+from server.apps.trees.graph import TreeGraph, TreeGraphCache
+from server.apps.trees.models import Tree
+from server.apps.trees.selectors import TreeSelector
+from server.apps.trees.services.tree_membership import TreeMembershipService
+from server.apps.trees.services.tree_statistics import TreeStatisticsService
+
+TreePks = set[UUID]
+PENDING_TREE_PKS: ContextVar[Optional[TreePks]] = ContextVar(
+    "pending_tree_pks",
+    default=None,
+)
+TRACKED_TREE_PKS: ContextVar[Optional[TreePks]] = ContextVar(
+    "tracked_tree_pks",
+    default=None,
+)
+SIGNALS_MUTED: ContextVar[bool] = ContextVar("signals_muted", default=False)
+
+
+class TreeRefreshService:
+    """Handle refreshing of the data derived from the changed trees."""
+
+    @classmethod
+    def schedule(cls, tree_pks: TreePks) -> None:
+        """Refresh the changed trees, once the transaction commits.
+
+        Trees are merged with the ones pending for the commit, so each
+        changed tree is refreshed once per transaction. Outside of the
+        transaction, the trees are refreshed immediately. Trees of the
+        rolled back transaction are refreshed with the next commit.
+
+        Args:
+            tree_pks (TreePks): primary keys of the trees to refresh.
+        """
+        tracked_tree_pks = TRACKED_TREE_PKS.get()
+        if tracked_tree_pks is not None:
+            tracked_tree_pks.update(tree_pks)
+        pending_tree_pks = PENDING_TREE_PKS.get()
+        if pending_tree_pks is None:
+            PENDING_TREE_PKS.set(set(tree_pks))
+        else:
+            pending_tree_pks.update(tree_pks)
+        transaction.on_commit(cls.refresh_pending)
+
+    @classmethod
+    @contextmanager
+    def track_changes(cls) -> Iterator[TreePks]:
+        """Collect the trees changed within the block.
+
+        Yields:
+            TreePks: primary keys of the changed trees,
+                extended with the trees changed within the block.
+        """
+        tree_pks: TreePks = set()
+        token = TRACKED_TREE_PKS.set(tree_pks)
+        try:
+            yield tree_pks
+        finally:
+            TRACKED_TREE_PKS.reset(token)
+
+    @classmethod
+    @contextmanager
+    def mute_signals(cls, deleted: Iterable[models.Model]) -> Iterator[TreePks]:
+        """Find the trees of the instances deleted in bulk within the block.
+
+        Trees are looked up with a single query before the delete,
+        and the delete signals skip the lookup and the refresh
+        of every instance, so the caller refreshes the trees at once.
+
+        Args:
+            deleted (Iterable[models.Model]): instances to be deleted.
+
+        Yields:
+            TreePks: primary keys of the trees of the deleted instances.
+        """
+        tree_pks = TreeSelector.pks_for_instances(deleted)
+        token = SIGNALS_MUTED.set(True)
+        try:
+            yield tree_pks
+        finally:
+            SIGNALS_MUTED.reset(token)
+
+    @classmethod
+    def refresh_pending(cls) -> None:
+        """Refresh the pending trees, by the first hook of the commit.
+
+        Hooks registered by the following changes of the same transaction
+        find nothing to refresh.
+        """
+        tree_pks = PENDING_TREE_PKS.get()
+        PENDING_TREE_PKS.set(None)
+        if tree_pks:
+            cls.refresh_trees(tree_pks)
+
+    @classmethod
+    def rebuild_trees(cls, tree_pks: Collection[UUID]) -> None:
+        """Sync the memberships and refresh the trees.
+
+        Args:
+            tree_pks (Collection[UUID]): primary keys of the trees.
+        """
+        TreeMembershipService.sync_trees(tree_pks)
+        cls.refresh_trees(tree_pks)
+
+    @classmethod
+    def refresh_trees(cls, tree_pks: Collection[UUID]) -> None:
+        """Compile the graphs of the trees and derive the data from them.
+
+        Graph of every tree is compiled and cached once, and the version,
+        the first step and the statistics are taken from it.
+
+        Args:
+            tree_pks (Collection[UUID]): primary keys of the trees.
+        """
+        TreeGraphCache.invalidate(tree_pks)
+        trees = list(
+            Tree.objects.filter(pk__in=tree_pks)
+            .only("pk")
+            .annotate(paths_count=models.Count("paths")),
+        )
+        graphs = [TreeGraphCache.compile(tree) for tree in trees]
+        for tree, graph in zip(trees, graphs):
+            tree.version = models.F("version") + 1
+            tree.first_step = cls.first_step_data(graph)
+        Tree.objects.bulk_update(trees, ("version", "first_step"))
+        TreeStatisticsService.refresh_for_trees(trees, graphs)
+
+    @classmethod
+    def first_step_data(cls, graph: TreeGraph) -> dict:
+        """Return the first step data of the graph, as stored on the tree.
+
+        Args:
+            graph (TreeGraph): compiled graph of the tree.
+
+        Returns:
+            dict: name of the first step and the fields of its options,
+                empty if the tree has no first step.
+        """
+        first_step = graph.first_step_data()
+        if first_step:
+            first_step["options"] = [
+                {
+                    "pk": option.pk,
+                    "name": option.name,
+                    "step": option.step_id,
+                    "next_step": option.next_step_id,
+                }
+                for option in first_step["options"]
+            ]
+        return first_step
@@ -0,0 +1,43 @@
+"""Maintenance services for TreeStatistics model."""
+
+from typing import Iterable
+
+from server.apps.generic.upsert import bulk_upsert
+from server.apps.trees.derived_models import TreeStatistics
+from server.apps.trees.graph import TreeGraph
+from server.apps.trees.models import Tree
+from server.apps.trees.selectors import STATISTICS_FIELDS
+from server.apps.trees.statistics import measure_graph
+
+
+class TreeStatisticsService:
+    """Handle measuring of the tree statistics.
+
+    Statistics of the changed trees are measured from the graphs
+    compiled for the cache, and upserted over the previous ones.
+    """
+
+    @classmethod
+    def refresh_for_trees(
+        cls,
+        trees: Iterable[Tree],
+        graphs: Iterable[TreeGraph],
+    ) -> None:
+        """Measure the statistics of the trees from their graphs.
+
+        Args:
+            trees (Iterable[Tree]): trees annotated with 'paths_count'.
+            graphs (Iterable[TreeGraph]): compiled graphs of the trees.
+        """
+        bulk_upsert(
+            [
+                TreeStatistics(
+                    tree=tree,
+                    paths_count=tree.paths_count,
+                    **measure_graph(graph),
+                )
+                for tree, graph in zip(trees, graphs)
+            ],
+            unique_fields=("tree",),
+            update_fields=STATISTICS_FIELDS,
+        )
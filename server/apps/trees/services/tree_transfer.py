@@ -0,0 +1,441 @@
+"""Streaming export and import of the whole trees dataset."""
+
+import itertools
+import json
+from dataclasses import dataclass
+from pathlib import Path as FilePath
+from typing import Iterable, Iterator
+
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, connection, models, transaction
+from django.db.models.expressions import RawSQL
+
+from server.apps.trees.models import Option, Path, Solution, Step, Tree
+from server.apps.trees.services.search import SearchVectorService
+from server.apps.trees.services.tree_refresh import TreeRefreshService
+
+CREATOR_KEY = "creator_username"
+TransferCounts = dict[str, int]
+MISSING_CREATORS_QUERY = """
+    SELECT DISTINCT dump.doc ->> '{creator_key}' FROM {load_table} AS dump
+    WHERE NOT EXISTS (
+        SELECT 1 FROM users_user AS creator
+        WHERE creator.username = dump.doc ->> '{creator_key}'
+    )
+"""
+CONFLICTS_QUERY = """
+    SELECT {conflict_columns} FROM {loaded_records}
+    WHERE NOT EXISTS (
+        SELECT 1 FROM {table} AS existing WHERE {conflict_matches}
+    ) AND EXISTS (
+        SELECT 1 FROM {table} AS existing WHERE {unique_matches}
+    )
+"""
+
+
+def select_column(column: str) -> str:
+    """Return the expression selecting the column of the loaded row.
+
+    Args:
+        column (str): column name.
+
+    Returns:
+        str: column of the JSON record, or the primary key
+            of the creator found by the username.
+    """
+    if column == "creator_id":
+        return "creator.uuid"
+    return "record.{0}".format(connection.ops.quote_name(column))
+
+
+@dataclass(frozen=True)
+class TransferTable:
+    """Table of the dataset, dumped to its own NDJSON file.
+
+    Rows are dumped with their column names, except for the creators,
+    which are referenced by the username, as the users are not moved.
+    """
+
+    model: type[models.Model]
+    conflict_columns: tuple[str, ...] = ("uuid",)
+
+    @property
+    def name(self) -> str:
+        """Return the name of the database table.
+
+        Returns:
+            str: table name.
+        """
+        return self.model._meta.db_table  # noqa: WPS437
+
+    @property
+    def load_name(self) -> str:
+        """Return the name of the temporary table the file is copied to.
+
+        Returns:
+            str: temporary table name.
+        """
+        return f"load_{self.name}"
+
+    @property
+    def columns(self) -> list[str]:
+        """Return the columns of the table, apart from the generated ones.
+
+        Returns:
+            list[str]: column names.
+        """
+        return [
+            field.column
+            for field in self.model._meta.concrete_fields  # noqa: WPS437
+            if not isinstance(field, models.AutoField)
+        ]
+
+    @property
+    def has_creator(self) -> bool:
+        """Return True if the rows refer to their creators.
+
+        Returns:
+            bool: indicates if the table has the creator column.
+        """
+        return "creator_id" in self.columns
+
+    def file_path(self, directory: FilePath) -> FilePath:
+        """Return the path of the table file.
+
+        Args:
+            directory (FilePath): directory of the dump.
+
+        Returns:
+            FilePath: path of the NDJSON file.
+        """
+        return directory / f"{self.name}.ndjson"
+
+    def rows(self, chunk_size: int) -> Iterator[dict]:
+        """Iterate over the rows with a server-side cursor.
+
+        Args:
+            chunk_size (int): number of rows fetched at once.
+
+        Returns:
+            Iterator[dict]: rows keyed by the column names.
+        """
+        rows = self.model._base_manager.order_by()  # noqa: WPS437
+        if self.has_creator:
+            rows = rows.annotate(
+                **{CREATOR_KEY: models.F("creator__username")},
+            )
+            columns = [*self.columns, CREATOR_KEY]
+            columns.remove("creator_id")
+            return rows.values(*columns).iterator(chunk_size=chunk_size)
+        return rows.values(*self.columns).iterator(chunk_size=chunk_size)
+
+    def insert_sql(self) -> str:
+        """Return the query inserting the rows of the temporary table.
+
+        Rows with the primary keys already taken are skipped,
+        so the dataset can be imported again.
+
+        Returns:
+            str: insert query.
+        """
+        table_name = connection.ops.quote_name(self.name)
+        columns = ", ".join(map(connection.ops.quote_name, self.columns))
+        selected = ", ".join(map(select_column, self.columns))
+        loaded_records = loaded_records_sql(self)
+        conflict_columns = ", ".join(
+            map(connection.ops.quote_name, self.conflict_columns),
+        )
+        return (
+            f"INSERT INTO {table_name} ({columns}) "
+            + f"SELECT {selected} FROM {loaded_records} "
+            + f"ON CONFLICT ({conflict_columns}) DO NOTHING"
+        )
+
+
+def loaded_records_sql(table: TransferTable) -> str:
+    """Return the records of the temporary table, joined with the creators.
+
+    Args:
+        table (TransferTable): loaded table.
+
+    Returns:
+        str: source of the 'record' and 'creator' columns.
+    """
+    table_name = connection.ops.quote_name(table.name)
+    creator_join = ""
+    if table.has_creator:
+        creator_join = (
+            "JOIN users_user AS creator "
+            + f"ON creator.username = dump.doc ->> '{CREATOR_KEY}'"
+        )
+    return (
+        f"{table.load_name} AS dump "
+        + "CROSS JOIN LATERAL jsonb_populate_record("
+        + f"NULL::{table_name}, dump.doc) AS record "
+        + creator_join
+    )
+
+
+def conflicts_sql(table: TransferTable, unique_columns: Iterable[str]) -> str:
+    """Return the query of the new rows taking the unique values.
+
+    Rows with the conflict columns taken already are skipped
+    by the import, so they are left out.
+
+    Args:
+        table (TransferTable): loaded table.
+        unique_columns (Iterable[str]): columns of the unique constraint.
+
+    Returns:
+        str: query selecting the conflict columns of the rows.
+    """
+    quote = connection.ops.quote_name
+    return CONFLICTS_QUERY.format(
+        conflict_columns=", ".join(
+            "record.{0}".format(quote(column))
+            for column in table.conflict_columns
+        ),
+        loaded_records=loaded_records_sql(table),
+        table=quote(table.name),
+        conflict_matches=" AND ".join(
+            "existing.{0} = record.{0}".format(quote(column))
+            for column in table.conflict_columns
+        ),
+        unique_matches=" AND ".join(
+            "existing.{0} = {1}".format(quote(column), select_column(column))
+            for column in unique_columns
+        ),
+    )
+
+
+TRANSFER_TABLES = (
+    TransferTable(Solution),
+    TransferTable(Path),
+    TransferTable(Tree),
+    TransferTable(Tree.paths.through, ("tree_id", "path_id")),
+    TransferTable(Step),
+    TransferTable(Option),
+)
+
+
+class TreeTransferService:
+    """Handle moving the whole trees dataset between the databases.
+
+    Each table is streamed to its own NDJSON file, ordered so that
+    the rows are imported after the rows they refer to. Neither export
+    nor import holds more than a chunk of rows in memory: rows are read
+    with the server-side cursors and the files are loaded with COPY.
+    """
+
+    @classmethod
+    def export_tables(
+        cls,
+        directory: FilePath,
+        chunk_size: int,
+    ) -> TransferCounts:
+        """Write the tables to the directory, from a single snapshot.
+
+        Args:
+            directory (FilePath): directory of the dump.
+            chunk_size (int): number of rows fetched at once.
+
+        Returns:
+            TransferCounts: numbers of exported rows keyed by the table.
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        is_snapshot_needed = not connection.in_atomic_block
+        with transaction.atomic():
+            if is_snapshot_needed:
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SET TRANSACTION ISOLATION LEVEL "
+                        + "REPEATABLE READ READ ONLY",
+                    )
+            return {
+                table.name: cls.export_table(table, directory, chunk_size)
+                for table in TRANSFER_TABLES
+            }
+
+    @classmethod
+    def export_table(
+        cls,
+        table: TransferTable,
+        directory: FilePath,
+        chunk_size: int,
+    ) -> int:
+        """Write the rows of the table as NDJSON.
+
+        Args:
+            table (TransferTable): table to export.
+            directory (FilePath): directory of the dump.
+            chunk_size (int): number of rows fetched at once.
+
+        Returns:
+            int: number of exported rows.
+        """
+        rows_count = 0
+        with table.file_path(directory).open("w") as table_file:
+            for row in table.rows(chunk_size):
+                table_file.write(json.dumps(row, default=str))
+                table_file.write("\n")
+                rows_count += 1
+        return rows_count
+
+    @classmethod
+    def import_tables(
+        cls,
+        directory: FilePath,
+        chunk_size: int,
+    ) -> TransferCounts:
+        """Load the tables from the directory within a single transaction.
+
+        Trees and solutions dumped without the search vectors are indexed.
+
+        Args:
+            directory (FilePath): directory of the dump.
+            chunk_size (int): number of trees refreshed at once.
+
+        Raises:
+            ValidationError: if any of the table files is missing,
+                or the rows cannot be imported.
+
+        Returns:
+            TransferCounts: numbers of imported rows keyed by the table,
+                rows that exist already are not counted.
+        """
+        missing_files = [
+            table.file_path(directory).name
+            for table in TRANSFER_TABLES
+            if not table.file_path(directory).is_file()
+        ]
+        if missing_files:
+            listed_files = ", ".join(missing_files)
+            raise ValidationError(f"Missing table files: {listed_files}.")
+        with transaction.atomic():
+            imported_counts = {
+                table.name: cls.import_table(table, directory)
+                for table in TRANSFER_TABLES
+            }
+            cls.refresh_imported_trees(chunk_size)
+            for model in (Tree, Solution):
+                SearchVectorService.update_vectors(
+                    model.objects.filter(search_vector__isnull=True),
+                )
+        return imported_counts
+
+    @classmethod
+    def import_table(cls, table: TransferTable, directory: FilePath) -> int:
+        """Copy the table file to the temporary table and insert its rows.
+
+        Args:
+            table (TransferTable): table to import.
+            directory (FilePath): directory of the dump.
+
+        Raises:
+            IntegrityError: if the rows violate the constraints
+                other than the unique ones.
+
+        Returns:
+            int: number of inserted rows.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TEMPORARY TABLE {table.load_name} (doc jsonb) "
+                + "ON COMMIT DROP",
+            )
+            with table.file_path(directory).open() as table_file:
+                # Quote and delimiter characters never occur in the JSON
+                # lines, so each line is copied as it is.
+                cursor.copy_expert(
+                    f"COPY {table.load_name} (doc) FROM STDIN "
+                    + r"WITH (FORMAT csv, QUOTE E'\x01', DELIMITER E'\x02')",
+                    table_file,
+                )
+            if table.has_creator:
+                cls.check_creators(cursor, table)
+            try:
+                with transaction.atomic():
+                    cursor.execute(table.insert_sql())
+            except IntegrityError:
+                cls.check_conflicts(cursor, table)
+                raise
+            return cursor.rowcount
+
+    @classmethod
+    def check_creators(cls, cursor, table: TransferTable) -> None:
+        """Check the creators of the loaded rows exist.
+
+        Args:
+            cursor (CursorWrapper): database cursor.
+            table (TransferTable): loaded table.
+
+        Raises:
+            ValidationError: if any of the creators does not exist.
+        """
+        cursor.execute(
+            MISSING_CREATORS_QUERY.format(
+                load_table=table.load_name,
+                creator_key=CREATOR_KEY,
+            ),
+        )
+        missing_creators = sorted(str(row[0]) for row in cursor.fetchall())
+        if missing_creators:
+            listed_creators = ", ".join(missing_creators)
+            raise ValidationError(f"Unknown creators: {listed_creators}.")
+
+    @classmethod
+    def check_conflicts(cls, cursor, table: TransferTable) -> None:
+        """Check the new rows do not take the unique values of other rows.
+
+        Args:
+            cursor (CursorWrapper): database cursor.
+            table (TransferTable): loaded table.
+
+        Raises:
+            ValidationError: if any of the rows takes the unique values.
+        """
+        opts = table.model._meta  # noqa: WPS437
+        conflicting_rows = set()
+        for unique_fields in opts.unique_together:
+            unique_columns = [
+                opts.get_field(field_name).column
+                for field_name in unique_fields
+            ]
+            if set(unique_columns) != set(table.conflict_columns):
+                cursor.execute(conflicts_sql(table, unique_columns))
+                conflicting_rows.update(cursor.fetchall())
+        if conflicting_rows:
+            listed_rows = ", ".join(
+                sorted(", ".join(map(str, row)) for row in conflicting_rows),
+            )
+            raise ValidationError(
+                f"Rows of {table.name} conflict with the existing rows: "
+                + f"{listed_rows}.",
+            )
+
+    @classmethod
+    def refresh_imported_trees(cls, chunk_size: int) -> None:
+        """Refresh the data derived from the imported trees, in chunks.
+
+        Args:
+            chunk_size (int): number of trees refreshed at once.
+        """
+        trees_table = TransferTable(Tree)
+        tree_paths_table = TransferTable(Tree.paths.through)
+        tree_pks = (
+            Tree.objects.filter(
+                pk__in=RawSQL(  # noqa: S611
+                    "SELECT (doc ->> 'uuid')::uuid "
+                    + f"FROM {trees_table.load_name} "
+                    + "UNION SELECT (doc ->> 'tree_id')::uuid "
+                    + f"FROM {tree_paths_table.load_name}",
+                    (),
+                ),
+            )
+            .values_list("pk", flat=True)
+            .iterator(chunk_size=chunk_size)
+        )
+        chunk = list(itertools.islice(tree_pks, chunk_size))
+        while chunk:
+            TreeRefreshService.rebuild_trees(chunk)
+            chunk = list(itertools.islice(tree_pks, chunk_size))
@@ -1 +1,152 @@
-"""Signals for the trees app models."""
+"""Signals for the trees app models.
+
+Memberships of the steps and options in the trees are synced with
+every change, the rest of the data derived from the trees is refreshed
+once the change is committed.
+"""
+
+from typing import Optional
+
+from django.db.models import Model
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+
+from server.apps.trees.models import Option, Path, Solution, Step, Tree
+from server.apps.trees.selectors import TreeSelector
+from server.apps.trees.services.search import SearchVectorService
+from server.apps.trees.services.solution import SolutionService
+from server.apps.trees.services.tree import TreeService
+from server.apps.trees.services.tree_refresh import SIGNALS_MUTED
+
+
+@receiver(pre_save, sender=Solution)
+def solution_saving(sender: type[Model], instance: Solution, **kwargs) -> None:
+    """Render the description of the solution, if it has changed.
+
+    Args:
+        sender (type[Model]): model of the instance.
+        instance (Solution): solution being saved.
+        kwargs (dict): signal keyword arguments.
+    """
+    SolutionService.render_description(instance)
+
+
+@receiver(post_save, sender=Step)
+@receiver(post_save, sender=Option)
+@receiver(post_save, sender=Solution)
+def instance_saved(
+    sender: type[Model],
+    instance: Model,
+    created: bool,
+    **kwargs,
+) -> None:
+    """Sync the memberships of the saved instance and refresh its trees.
+
+    Options of the created step have no memberships yet.
+
+    Args:
+        sender (type[Model]): model of the instance.
+        instance (Model): saved step, option or solution.
+        created (bool): indicates if the instance is created.
+        kwargs (dict): signal keyword arguments.
+    """
+    if sender is Step:
+        TreeService.members_changed(
+            steps={instance.pk},
+            moved_steps=() if created else {instance.pk},
+        )
+    elif sender is Option:
+        TreeService.members_changed(options=(instance,))
+    else:
+        TreeService.trees_changed(TreeSelector.pks_for_instances((instance,)))
+
+
+@receiver(post_save, sender=Tree)
+@receiver(post_save, sender=Solution)
+def searchable_saved(sender: type[Model], instance: Model, **kwargs) -> None:
+    """Index the name and the description of the saved instance.
+
+    Args:
+        sender (type[Model]): model of the instance.
+        instance (Model): saved tree or solution.
+        kwargs (dict): signal keyword arguments.
+    """
+    SearchVectorService.update_vectors(sender.objects.filter(pk=instance.pk))
+
+
+@receiver(pre_delete, sender=Tree)
+@receiver(pre_delete, sender=Path)
+@receiver(pre_delete, sender=Step)
+@receiver(pre_delete, sender=Option)
+def instance_deleting(sender: type[Model], instance: Model, **kwargs) -> None:
+    """Remember trees affected by the instance, before it's deleted.
+
+    Deleted solutions are handled by the cascade of their final steps.
+    Bulk deletes muting the signals look up the trees by themselves.
+
+    Args:
+        sender (type[Model]): model of the instance.
+        instance (Model): tree, path, step or option to be deleted.
+        kwargs (dict): signal keyword arguments.
+    """
+    if not SIGNALS_MUTED.get():
+        instance.affected_tree_pks = TreeSelector.pks_for_instances((instance,))
+
+
+@receiver(post_delete, sender=Tree)
+@receiver(post_delete, sender=Path)
+@receiver(post_delete, sender=Step)
+@receiver(post_delete, sender=Option)
+def instance_deleted(sender: type[Model], instance: Model, **kwargs) -> None:
+    """Refresh trees affected by the instance.
+
+    Memberships of the deleted instances are deleted with them.
+    Bulk deletes muting the signals refresh the trees by themselves.
+
+    Args:
+        sender (type[Model]): model of the instance.
+        instance (Model): deleted tree, path, step or option.
+        kwargs (dict): signal keyword arguments.
+    """
+    if not SIGNALS_MUTED.get():
+        TreeService.trees_changed(instance.affected_tree_pks)
+
+
+@receiver(m2m_changed, sender=Tree.paths.through)
+def tree_paths_changed(
+    sender: type,
+    instance: Model,
+    action: str,
+    pk_set: Optional[set],
+    **kwargs,
+) -> None:
+    """Sync the memberships and refresh trees which paths have changed.
+
+    The instance is a path, when the relation is changed from the path side.
+    Cleared relations are remembered before they are cleared.
+
+    Args:
+        sender (type): tree paths through model.
+        instance (Model): tree or path with changed relation.
+        action (str): type of the update.
+        pk_set (Optional[set]): primary keys of the other side.
+        kwargs (dict): signal keyword arguments.
+    """
+    reverse = kwargs["reverse"]
+    if action == "pre_clear":
+        related = instance.trees if reverse else instance.paths
+        instance.cleared_pks = set(related.values_list("pk", flat=True))
+    elif action == "post_clear":
+        pk_set = instance.cleared_pks
+    if not pk_set or action not in {"post_add", "post_remove", "post_clear"}:
+        return
+    if reverse:
+        TreeService.paths_changed(pk_set, {instance.pk})
+    else:
+        TreeService.paths_changed({instance.pk}, pk_set)
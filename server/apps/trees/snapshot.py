@@ -0,0 +1,151 @@
+"""Versioned snapshots of the compiled tree graphs."""
+
+import gzip
+import json
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.http import parse_etags
+
+from server.apps.generic.routers import primary_reads
+from server.apps.trees.graph import TreeGraph, TreeGraphCache
+from server.apps.trees.models import Tree
+
+SNAPSHOT_CACHE_PREFIX = "tree-snapshot"
+SNAPSHOT_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+class TreeSnapshot:
+    """Handle building and caching of the tree snapshots.
+
+    Snapshot is a single gzipped json document with the whole graph
+    of the tree, generated once per version of the tree.
+    """
+
+    @classmethod
+    def content(cls, tree: Tree, gzipped: bool) -> bytes:
+        """Return the snapshot of the current version of the tree.
+
+        Args:
+            tree (Tree): tree to take the snapshot of.
+            gzipped (bool): indicates if the snapshot should stay gzipped.
+
+        Returns:
+            bytes: json document, gzipped if requested.
+        """
+        snapshot = cls.compressed(tree)
+        return snapshot if gzipped else gzip.decompress(snapshot)
+
+    @classmethod
+    def compressed(cls, tree: Tree) -> bytes:
+        """Return the gzipped snapshot of the current version of the tree.
+
+        Snapshot outlives the request, so before it is built, the version
+        of the tree is read again from the primary database, the same
+        as the graph is. Otherwise the version read from the lagging
+        replica could be cached with the newer graph. The tree is updated
+        with the version the snapshot is built for.
+
+        Args:
+            tree (Tree): tree to take the snapshot of.
+
+        Returns:
+            bytes: gzipped json document.
+        """
+        snapshot = cache.get(cls.key(tree))
+        if snapshot is None:
+            with primary_reads():
+                versions = Tree.objects.values_list("version", flat=True)
+                tree.version = versions.get(pk=tree.pk)
+                graph = TreeGraphCache.get(tree.pk)
+            graph = graph or TreeGraphCache.compile(tree)
+            document = json.dumps(
+                cls.build(graph, tree.version),
+                cls=DjangoJSONEncoder,
+                separators=(",", ":"),
+            )
+            snapshot = gzip.compress(document.encode())
+            cache.set(cls.key(tree), snapshot, SNAPSHOT_CACHE_TIMEOUT)
+        return snapshot
+
+    @classmethod
+    def key(cls, tree: Tree) -> str:
+        """Return the cache key of the current version of the tree snapshot.
+
+        Args:
+            tree (Tree): tree to take the snapshot of.
+
+        Returns:
+            str: cache key.
+        """
+        return f"{SNAPSHOT_CACHE_PREFIX}:{tree.pk}:{tree.version}"
+
+    @classmethod
+    def etag(cls, tree: Tree) -> str:
+        """Return the entity tag of the current version of the tree.
+
+        Args:
+            tree (Tree): tree to take the snapshot of.
+
+        Returns:
+            str: quoted entity tag.
+        """
+        return f'"{tree.pk}-{tree.version}"'
+
+    @classmethod
+    def is_current(cls, tree: Tree, if_none_match: str) -> bool:
+        """Return True if the client holds the current version of the tree.
+
+        Entity tags of the header are compared weakly, as 'If-None-Match'
+        requires, and '*' matches any version.
+
+        Args:
+            tree (Tree): tree to take the snapshot of.
+            if_none_match (str): value of the 'If-None-Match' header.
+
+        Returns:
+            bool: indicates if the snapshot is not modified.
+        """
+        etags = {etag.removeprefix("W/") for etag in parse_etags(if_none_match)}
+        return "*" in etags or cls.etag(tree) in etags
+
+    @classmethod
+    def build(cls, graph: TreeGraph, version: int) -> dict:
+        """Build the snapshot document from the compiled graph.
+
+        Merged steps are keyed by the name, options lead to the steps
+        keyed by the primary key, and final steps refer to the solutions.
+
+        Args:
+            graph (TreeGraph): compiled graph of the tree.
+            version (int): version of the tree.
+
+        Returns:
+            dict: snapshot document.
+        """
+        solutions = {
+            str(step.solution_id): {
+                "name": step.solution.name,
+                "description_html": step.solution.description_html,
+                "author": step.solution.creator.username,
+            }
+            for step in graph.steps.values()
+            if step.is_final
+        }
+        return {
+            "tree": graph.tree_pk,
+            "version": version,
+            "first_step": graph.first_step_name,
+            "nodes": {
+                name: [
+                    [option.pk, option.name, option.next_step_id]
+                    for option in node.options
+                ]
+                for name, node in graph.nodes.items()
+            },
+            "steps": {
+                str(step.pk): [step.name, step.solution_id]
+                for step in graph.steps.values()
+            },
+            "solutions": solutions,
+        }
@@ -0,0 +1,89 @@
+"""Statistics of the tree graphs."""
+
+from collections import deque
+from typing import Iterator, TypedDict
+from uuid import UUID
+
+from server.apps.trees.graph import TreeGraph
+from server.apps.trees.models import Step
+
+
+class GraphStatistics(TypedDict):
+    """Sizes of the merged graph and depths of its final steps."""
+
+    steps_count: int
+    options_count: int
+    solutions_count: int
+    max_depth: int
+    average_depth: float
+
+
+def next_steps(graph: TreeGraph, step_name: str) -> Iterator[Step]:
+    """Iterate over the steps of the tree the merged step leads to.
+
+    Args:
+        graph (TreeGraph): compiled graph of the tree.
+        step_name (str): name of the merged step.
+
+    Yields:
+        Step: steps the options of the merged step lead to.
+    """
+    for option in graph.nodes[step_name].options:
+        next_step = graph.steps.get(option.next_step_id)
+        if next_step is not None:
+            yield next_step
+
+
+def measure_final_depths(graph: TreeGraph) -> dict[UUID, int]:
+    """Walk the graph from the first step with breadth-first search.
+
+    Walks end on the final steps, so these are not expanded.
+
+    Args:
+        graph (TreeGraph): compiled graph of the tree.
+
+    Returns:
+        dict[UUID, int]: depths of the reachable final steps,
+            keyed by their primary keys.
+    """
+    final_depths: dict[UUID, int] = {}
+    if graph.first_step_name is None:
+        return final_depths
+    step_depths = {graph.first_step_name: 0}
+    queue = deque(step_depths)
+    while queue:
+        step_name = queue.popleft()
+        for next_step in next_steps(graph, step_name):
+            if next_step.is_final:
+                final_depths.setdefault(
+                    next_step.pk,
+                    step_depths[step_name] + 1,
+                )
+            elif next_step.name not in step_depths:
+                step_depths[next_step.name] = step_depths[step_name] + 1
+                queue.append(next_step.name)
+    return final_depths
+
+
+def measure_graph(graph: TreeGraph) -> GraphStatistics:
+    """Measure the merged steps, options and the walks of the graph.
+
+    Args:
+        graph (TreeGraph): compiled graph of the tree.
+
+    Returns:
+        GraphStatistics: statistics of the graph.
+    """
+    depths = measure_final_depths(graph)
+    solution_pks = {
+        graph.steps[step_pk].solution_id
+        for step_pk in depths
+        if graph.steps[step_pk].solution_id is not None
+    }
+    return GraphStatistics(
+        steps_count=len(graph.nodes),
+        options_count=sum(len(node.options) for node in graph.nodes.values()),
+        solutions_count=len(solution_pks),
+        max_depth=max(depths.values(), default=0),
+        average_depth=sum(depths.values()) / len(depths) if depths else 0,
+    )
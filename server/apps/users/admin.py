@@ -1,6 +1,7 @@
 """Admin site config for the users app."""
 from django.contrib import admin
 
+from server.apps.generic.admin import GenericModelAdmin
 from server.apps.users.models import User
 
-admin.site.register(User)
+admin.site.register(User, GenericModelAdmin)
@@ -0,0 +1,19 @@
+# Generated by Django 3.2.25 on 2026-10-18 08:46
+
+from django.db import migrations, models
+import server.apps.generic.identifiers
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='uuid',
+            field=models.UUIDField(default=server.apps.generic.identifiers.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -2,6 +2,7 @@
 import os
 from datetime import timedelta
 from pathlib import Path
+from typing import Any
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -27,6 +28,7 @@ DJANGO_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
 ]
 
 EXTERNAL_APPS = [
@@ -44,6 +46,7 @@ INSTALLED_APPS = DJANGO_APPS + EXTERNAL_APPS + LOCAL_APPS
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "server.apps.generic.middleware.ReplicaRoutingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -77,7 +80,7 @@ WSGI_APPLICATION = "server.config.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/3.2/ref/settings/#databases
 
-DATABASES = {
+DATABASES: dict[str, dict[str, Any]] = {
     "default": {
         "ENGINE": os.getenv("ENGINE"),
         "NAME": os.getenv("POSTGRES_DB"),
@@ -88,6 +91,43 @@ DATABASES = {
     },
 }
 
+# Read replicas, given as the comma separated hosts, share the credentials
+# of the primary database. Safe requests read from them until they write,
+# and the writing clients stay on the primary for REPLICA_PIN_SECONDS.
+
+REPLICA_HOSTS = [
+    replica_host
+    for replica_host in os.getenv("POSTGRES_REPLICA_HOSTS", "").split(",")
+    if replica_host
+]
+DATABASES.update(
+    {
+        f"replica_{index}": {
+            **DATABASES["default"],
+            "HOST": replica_host,
+            "TEST": {"MIRROR": "default"},
+        }
+        for index, replica_host in enumerate(REPLICA_HOSTS, start=1)
+    },
+)
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != "default"]
+DATABASE_ROUTERS = ["server.apps.generic.routers.ReplicaRouter"]
+REPLICA_PIN_SECONDS = int(os.getenv("REPLICA_PIN_SECONDS", "10"))
+
+
+# Cache
+# https://docs.djangoproject.com/en/3.2/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "CACHE_BACKEND",
+            "django.core.cache.backends.locmem.LocMemCache",
+        ),
+        "LOCATION": os.getenv("CACHE_LOCATION", ""),
+    },
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
@@ -150,6 +190,10 @@ REST_FRAMEWORK = {
         "rest_framework.permissions.IsAuthenticated",
     ),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    "DEFAULT_PAGINATION_CLASS": (
+        "server.apps.trees.api.pagination.CreatedAtCursorPagination"
+    ),
+    "PAGE_SIZE": int(os.getenv("PAGE_SIZE", "100")),
 }
 
 # Drf Spectacular
@@ -1,12 +1,20 @@
 """Common test fixtures."""
 
+from typing import Iterator
+
 import pytest
+from django.conf import settings
+from django.db import connections
+from django.db.models.signals import pre_migrate
+from django.dispatch import receiver
 from rest_framework.test import APIClient
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from server.apps.trees.services.tree_refresh import PENDING_TREE_PKS
 from server.apps.users.models import User
 from server.tests.factories import *  # noqa: F401, F403, WPS347
 
+REPLICA_ALIAS = "replica"
 TEST_USER_CREDENTIALS = frozenset(
     {
         "username": "test_user",
@@ -32,3 +40,48 @@ def api_client() -> APIClient:
     client.credentials(HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}")
 
     return client
+
+
+@pytest.fixture(autouse=True)
+def pending_trees() -> Iterator[None]:
+    """Drop the trees left pending by the test.
+
+    Tests run in the transaction that is never committed, so the trees
+    changed outside of the captured commit hooks are never refreshed.
+
+    Yields:
+        None: nothing, the pending trees are dropped after the test.
+    """
+    yield
+    PENDING_TREE_PKS.set(None)
+
+
+@pytest.fixture(scope="session")
+def django_db_modify_db_settings(
+    django_db_modify_db_settings_parallel_suffix: None,
+) -> None:
+    """Add the replica database, a test mirror of the default one.
+
+    Replica is not routed to, unless the test lists it in the replicas.
+
+    Args:
+        django_db_modify_db_settings_parallel_suffix (None): suffix
+            of the test databases for the parallel runs.
+    """
+    settings.DATABASES[REPLICA_ALIAS] = {
+        **settings.DATABASES["default"],
+        "TEST": {"MIRROR": "default"},
+    }
+
+
+@receiver(pre_migrate)
+def create_extensions(sender: object, using: str, **kwargs) -> None:
+    """Create the extensions, as the test databases skip the migrations.
+
+    Args:
+        sender (object): config of the migrated app.
+        using (str): alias of the migrated database.
+        kwargs (dict): signal keyword arguments.
+    """
+    with connections[using].cursor() as cursor:
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
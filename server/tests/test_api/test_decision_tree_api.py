@@ -1,16 +1,40 @@
 """Tests for decision tree api."""
 
+import gzip
+import json
+from unittest.mock import Mock
+
 import pytest
 from django.urls import reverse
-from rest_framework.status import HTTP_200_OK
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.status import (
+    HTTP_200_OK,
+    HTTP_304_NOT_MODIFIED,
+    HTTP_400_BAD_REQUEST,
+    HTTP_403_FORBIDDEN,
+    HTTP_404_NOT_FOUND,
+)
 from rest_framework.test import APIClient
 
+from server.apps.trees.api.views.tree import TreeViewSet
 from server.apps.trees.models import Option, Step
-from server.tests.factories import OptionFactory, SolutionFactory, TreeFactory
+from server.tests.factories import (
+    OptionFactory,
+    SolutionFactory,
+    StepFactory,
+    TreeFactory,
+)
 from server.tests.test_helpers import create_path_step_options_for_tree
 
 pytestmark = [pytest.mark.django_db]
 
+IF_NONE_MATCH = (
+    ('"other", W/{etag}', HTTP_304_NOT_MODIFIED),
+    ("*", HTTP_304_NOT_MODIFIED),
+    ("{etag}1", HTTP_200_OK),
+    ('"other"', HTTP_200_OK),
+)
+
 
 def test_tree_first_step_no_data(
     api_client: APIClient,
@@ -182,3 +206,352 @@ def test_tree_first_step_same_options(
     assert response.status_code == HTTP_200_OK
     assert response.data["name"] == "First Step"
     assert len(response.data["options"]) == 1
+
+
+def test_tree_next_step_not_in_tree(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+    step_factory: StepFactory,
+):
+    """Test retrieving step data for a step from outside of the tree."""
+    tree = tree_factory()
+    create_path_step_options_for_tree("First Step", tree)
+    response = api_client.get(
+        reverse(
+            "trees:trees-change-step",
+            kwargs={"pk": tree.pk, "step_uuid": step_factory().pk},
+        ),
+    )
+
+    assert response.status_code == HTTP_404_NOT_FOUND
+
+
+def test_tree_cached_steps_check_permissions(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test the steps of the cached graph are served to the permitted only."""
+    tree = tree_factory()
+    create_path_step_options_for_tree("First Step", tree, next_step=True)
+    step = Step.objects.get(name="Second Step")
+    url = reverse(
+        "trees:trees-change-step",
+        kwargs={"pk": tree.pk, "step_uuid": step.pk},
+    )
+    api_client.get(url)
+    monkeypatch.setattr(
+        TreeViewSet,
+        "check_object_permissions",
+        Mock(side_effect=PermissionDenied),
+    )
+
+    responses = [
+        api_client.get(url),
+        api_client.get(
+            reverse("trees:trees-resolve", kwargs={"pk": tree.pk}),
+        ),
+    ]
+
+    assert [response.status_code for response in responses] == [
+        HTTP_403_FORBIDDEN,
+        HTTP_403_FORBIDDEN,
+    ]
+
+
+def test_tree_steps_served_without_tree_queries(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+    django_assert_num_queries,
+    django_capture_on_commit_callbacks,
+):
+    """Test if the traversal does not query the tree data once compiled.
+
+    The authenticated user and the tree are fetched on each request,
+    the first step is stored on the tree and needs no other lookup.
+    """
+    tree = tree_factory()
+    with django_capture_on_commit_callbacks(execute=True):
+        create_path_step_options_for_tree("First Step", tree, next_step=True)
+    step = Step.objects.get(name="Second Step")
+
+    with django_assert_num_queries(2):
+        first_response = api_client.get(
+            reverse("trees:trees-first-step", kwargs={"pk": tree.pk}),
+        )
+    api_client.get(
+        reverse(
+            "trees:trees-change-step",
+            kwargs={"pk": tree.pk, "step_uuid": step.pk},
+        ),
+    )
+    with django_assert_num_queries(2):
+        next_response = api_client.get(
+            reverse(
+                "trees:trees-change-step",
+                kwargs={"pk": tree.pk, "step_uuid": step.pk},
+            ),
+        )
+
+    assert first_response.data["name"] == "First Step"
+    assert next_response.data["name"] == "Second Step"
+
+
+def test_tree_resolve_answers(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+    solution_factory: SolutionFactory,
+):
+    """Test walking the tree with option names and primary keys at once."""
+    tree = tree_factory()
+    create_path_step_options_for_tree("First Step", tree, next_step=True)
+    second_step = Step.objects.get(name="Second Step")
+    final_step = second_step.path.steps.create(
+        name="Final Step",
+        is_final=True,
+        solution=solution_factory(),
+    )
+    option = second_step.options.create(name="Finish", next_step=final_step)
+    first_option = Option.objects.get(step__name="First Step")
+    response = api_client.get(
+        reverse("trees:trees-resolve", kwargs={"pk": tree.pk}),
+        data={"answers": [first_option.name, str(option.pk)]},
+    )
+
+    assert response.status_code == HTTP_200_OK
+    assert response.data["visited_steps"] == [
+        "First Step",
+        "Second Step",
+        "Final Step",
+    ]
+    assert response.data["step"]["solution"]["pk"] == str(
+        final_step.solution.pk,
+    )
+
+
+def test_tree_resolve_no_answers(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+):
+    """Test walking the tree without answers returns the first step."""
+    tree = tree_factory()
+    create_path_step_options_for_tree("First Step", tree, 2)
+    response = api_client.get(
+        reverse("trees:trees-resolve", kwargs={"pk": tree.pk}),
+    )
+
+    assert response.status_code == HTTP_200_OK
+    assert response.data["visited_steps"] == ["First Step"]
+    assert len(response.data["step"]["options"]) == 2
+
+
+@pytest.mark.parametrize("answers", [["Unknown"], ["Any", "Any"]])
+def test_tree_resolve_invalid_answers(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+    answers: list[str],
+):
+    """Test walking the tree with answers not matching the options."""
+    tree = tree_factory()
+    create_path_step_options_for_tree("First Step", tree)
+    Option.objects.update(name="Any")
+    response = api_client.get(
+        reverse("trees:trees-resolve", kwargs={"pk": tree.pk}),
+        data={"answers": answers},
+    )
+
+    assert response.status_code == HTTP_400_BAD_REQUEST
+
+
+def test_tree_resolve_past_final_step(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+    solution_factory: SolutionFactory,
+):
+    """Test walking the tree further than the final step."""
+    tree = tree_factory()
+    create_path_step_options_for_tree("First Step", tree, next_step=True)
+    Step.objects.filter(name="Second Step").update(
+        is_final=True,
+        solution=solution_factory(),
+    )
+    response = api_client.get(
+        reverse("trees:trees-resolve", kwargs={"pk": tree.pk}),
+        data={"answers": [Option.objects.get().name, "Any"]},
+    )
+
+    assert response.status_code == HTTP_400_BAD_REQUEST
+
+
+def test_tree_resolve_empty_tree(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+):
+    """Test walking the tree without any steps."""
+    response = api_client.get(
+        reverse("trees:trees-resolve", kwargs={"pk": tree_factory().pk}),
+    )
+
+    assert response.status_code == HTTP_400_BAD_REQUEST
+
+
+def test_tree_first_step_with_depth(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+    solution_factory: SolutionFactory,
+    django_assert_max_num_queries,
+):
+    """Test retrieving first step with the next steps embedded."""
+    tree = tree_factory()
+    create_path_step_options_for_tree("First Step", tree, next_step=True)
+    second_step = Step.objects.get(name="Second Step")
+    final_step = second_step.path.steps.create(
+        name="Final Step",
+        is_final=True,
+        solution=solution_factory(),
+    )
+    second_step.options.create(name="Finish", next_step=final_step)
+
+    with django_assert_max_num_queries(4):
+        response = api_client.get(
+            reverse("trees:trees-first-step", kwargs={"pk": tree.pk}),
+            data={"depth": 2},
+        )
+
+    next_step = response.data["options"][0]["next"]
+    final_step_data = next_step["options"][0]["next"]
+    assert response.status_code == HTTP_200_OK
+    assert next_step["name"] == "Second Step"
+    assert final_step_data["solution"]["pk"] == str(final_step.solution.pk)
+
+
+def test_tree_next_step_with_depth(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+):
+    """Test retrieving next step with the depth not reaching any step."""
+    tree = tree_factory()
+    create_path_step_options_for_tree("First Step", tree, next_step=True)
+    step = Step.objects.get(name="First Step")
+    response = api_client.get(
+        reverse(
+            "trees:trees-change-step",
+            kwargs={"pk": tree.pk, "step_uuid": step.pk},
+        ),
+        data={"depth": 1},
+    )
+
+    next_step = response.data["options"][0]["next"]
+    assert response.status_code == HTTP_200_OK
+    assert next_step["name"] == "Second Step"
+    assert not next_step["options"]
+
+
+def test_tree_first_step_invalid_depth(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+):
+    """Test retrieving first step with too big depth."""
+    tree = tree_factory()
+    create_path_step_options_for_tree("First Step", tree)
+    response = api_client.get(
+        reverse("trees:trees-first-step", kwargs={"pk": tree.pk}),
+        data={"depth": 100},
+    )
+
+    assert response.status_code == HTTP_400_BAD_REQUEST
+
+
+def test_tree_snapshot(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+    solution_factory: SolutionFactory,
+):
+    """Test retrieving the whole tree graph at once."""
+    tree = tree_factory()
+    create_path_step_options_for_tree("First Step", tree, next_step=True)
+    step = Step.objects.get(name="Second Step")
+    step.is_final = True
+    step.solution = solution_factory()
+    step.save()
+    response = api_client.get(
+        reverse("trees:trees-snapshot", kwargs={"pk": tree.pk}),
+    )
+    snapshot = json.loads(response.content)
+    option = Option.objects.get()
+
+    assert response.status_code == HTTP_200_OK
+    assert snapshot["first_step"] == "First Step"
+    assert snapshot["nodes"]["First Step"] == [
+        [str(option.pk), option.name, str(step.pk)],
+    ]
+    assert snapshot["steps"][str(step.pk)] == [
+        "Second Step",
+        str(step.solution.pk),
+    ]
+    assert snapshot["solutions"][str(step.solution.pk)] == {
+        "name": step.solution.name,
+        "description_html": step.solution.description_html,
+        "author": step.solution.creator.username,
+    }
+
+
+def test_tree_snapshot_gzipped(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+):
+    """Test retrieving the gzipped snapshot."""
+    tree = tree_factory()
+    create_path_step_options_for_tree("First Step", tree)
+    response = api_client.get(
+        reverse("trees:trees-snapshot", kwargs={"pk": tree.pk}),
+        HTTP_ACCEPT_ENCODING="gzip, deflate",
+    )
+    snapshot = json.loads(gzip.decompress(response.content))
+
+    assert response["Content-Encoding"] == "gzip"
+    assert snapshot["first_step"] == "First Step"
+
+
+def test_tree_snapshot_etag(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+    option_factory: OptionFactory,
+    django_capture_on_commit_callbacks,
+):
+    """Test if the snapshot is versioned with the entity tag."""
+    tree = tree_factory()
+    with django_capture_on_commit_callbacks(execute=True):
+        create_path_step_options_for_tree("First Step", tree)
+    url = reverse("trees:trees-snapshot", kwargs={"pk": tree.pk})
+    etag = api_client.get(url)["ETag"]
+    not_modified_response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    with django_capture_on_commit_callbacks(execute=True):
+        option_factory(step=Step.objects.get())
+    modified_response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert not_modified_response.status_code == HTTP_304_NOT_MODIFIED
+    assert modified_response.status_code == HTTP_200_OK
+    assert modified_response["ETag"] != etag
+    snapshot = json.loads(modified_response.content)
+    assert len(snapshot["nodes"]["First Step"]) == 2
+
+
+@pytest.mark.parametrize(("if_none_match", "status_code"), IF_NONE_MATCH)
+def test_tree_snapshot_if_none_match(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+    if_none_match: str,
+    status_code: int,
+):
+    """Test the entity tags are parsed from the header, not searched in it."""
+    tree = tree_factory()
+    url = reverse("trees:trees-snapshot", kwargs={"pk": tree.pk})
+    etag = api_client.get(url)["ETag"]
+
+    response = api_client.get(
+        url,
+        HTTP_IF_NONE_MATCH=if_none_match.format(etag=etag),
+    )
+
+    assert response.status_code == status_code
@@ -0,0 +1,50 @@
+"""Tests for the inconsistencies API."""
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from server.apps.trees.derived_models import (
+    BROKEN_LINK,
+    ORPHANED_STEP,
+    Inconsistency,
+)
+from server.tests.factories import TreeFactory
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_inconsistencies_api_filter(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+):
+    """Test the inconsistencies are filtered by the tree and the kind."""
+    tree = tree_factory()
+    broken_link = Inconsistency.objects.create(
+        tree=tree,
+        kind=BROKEN_LINK,
+        step_name="Step",
+    )
+    Inconsistency.objects.create(
+        tree=tree,
+        kind=ORPHANED_STEP,
+        step_name="Step",
+    )
+    Inconsistency.objects.create(
+        tree=tree_factory(),
+        kind=BROKEN_LINK,
+        step_name="Step",
+    )
+    url = reverse("trees:inconsistencies-list")
+
+    response = api_client.get(url, {"tree": tree.pk, "kind": BROKEN_LINK})
+    all_response = api_client.get(url)
+    invalid_response = api_client.get(url, {"kind": "unknown"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [row["pk"] for row in response.data["results"]] == [
+        str(broken_link.pk),
+    ]
+    assert len(all_response.data["results"]) == 3
+    assert invalid_response.status_code == status.HTTP_400_BAD_REQUEST
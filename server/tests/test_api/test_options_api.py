@@ -90,3 +90,21 @@ def test_option_update_api(
 
     assert response.status_code == HTTP_200_OK
     assert option.name == "Test Option Updated"
+
+
+def test_option_list_api_queries(
+    api_client: APIClient,
+    option_factory: OptionFactory,
+    django_assert_num_queries,
+):
+    """Test listing options in constant queries.
+
+    User and options.
+    """
+    option_factory.create_batch(3)
+
+    with django_assert_num_queries(2):
+        response = api_client.get(reverse("trees:options-list"))
+
+    assert response.status_code == HTTP_200_OK
+    assert len(response.data["results"]) == 3
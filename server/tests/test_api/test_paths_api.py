@@ -11,6 +11,7 @@ from rest_framework.test import APIClient
 
 from server.apps.trees.models import Path, Step
 from server.tests.factories import PathFactory, StepFactory
+from server.tests.test_helpers import create_nested_path_steps
 
 pytestmark = [pytest.mark.django_db]
 
@@ -54,3 +55,22 @@ def test_path_delete_api(
     assert response.status_code == HTTP_204_NO_CONTENT
     assert Path.objects.count() == 0
     assert Step.objects.count() == 0
+
+
+def test_path_list_api_queries(
+    api_client: APIClient,
+    path_factory: PathFactory,
+    django_assert_num_queries,
+):
+    """Test listing paths with nested instances in constant queries.
+
+    User, paths, steps with solutions and options.
+    """
+    for _ in range(3):
+        create_nested_path_steps(path_factory())
+
+    with django_assert_num_queries(4):
+        response = api_client.get(reverse("trees:paths-list"))
+
+    assert response.status_code == HTTP_200_OK
+    assert len(response.data["results"]) == 3
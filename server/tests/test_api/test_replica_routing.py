@@ -0,0 +1,120 @@
+"""Tests for routing the reads of the safe requests to the replicas."""
+
+from unittest.mock import Mock
+
+import pytest
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.status import HTTP_200_OK, HTTP_201_CREATED
+from rest_framework.test import APIClient
+
+from server.apps.generic.middleware import (
+    PRIMARY_COOKIE,
+    ReplicaRoutingMiddleware,
+)
+from server.apps.generic.routers import (
+    REPLICA_ROUTING,
+    ReplicaRouter,
+    primary_reads,
+)
+from server.apps.trees.models import Tree
+from server.tests.conftest import REPLICA_ALIAS
+from server.tests.factories import TreeFactory
+
+pytestmark = [
+    pytest.mark.django_db(
+        transaction=True,
+        databases=[DEFAULT_DB_ALIAS, REPLICA_ALIAS],
+    ),
+]
+
+
+@pytest.fixture(autouse=True)
+def replicas(settings) -> None:
+    """Route the reads of the safe requests to the replica.
+
+    Args:
+        settings (SettingsWrapper): overridable django settings.
+    """
+    settings.DATABASE_REPLICAS = [REPLICA_ALIAS]
+
+
+def test_safe_request_reads_replica(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+):
+    """Test the list of trees is read from the replica."""
+    tree = tree_factory()
+
+    replica_queries = CaptureQueriesContext(connections[REPLICA_ALIAS])
+    queries = CaptureQueriesContext(connections[DEFAULT_DB_ALIAS])
+    with replica_queries:
+        with queries:
+            response = api_client.get(reverse("trees:trees-list"))
+
+    assert response.status_code == HTTP_200_OK
+    assert response.data["results"][0]["pk"] == str(tree.pk)
+    assert replica_queries.captured_queries
+    assert not queries.captured_queries
+    assert PRIMARY_COOKIE not in response.cookies
+
+
+def test_write_pins_client_to_primary(api_client: APIClient):
+    """Test the client reads its writes from the primary database."""
+    response = api_client.post(
+        reverse("trees:trees-list"),
+        data={"name": "Test Tree", "description": "Test Description"},
+    )
+
+    replica_queries = CaptureQueriesContext(connections[REPLICA_ALIAS])
+    with replica_queries:
+        list_response = api_client.get(reverse("trees:trees-list"))
+
+    assert response.status_code == HTTP_201_CREATED
+    assert response.cookies[PRIMARY_COOKIE].value == "1"
+    assert len(list_response.data["results"]) == 1
+    assert not replica_queries.captured_queries
+
+
+def test_router_outside_requests():
+    """Test the reads outside the requests and migrations use the primary."""
+    router = ReplicaRouter()
+
+    with primary_reads():
+        assert router.db_for_read(Tree) == DEFAULT_DB_ALIAS
+    assert router.db_for_read(Tree) == DEFAULT_DB_ALIAS
+    assert router.db_for_write(Tree) == DEFAULT_DB_ALIAS
+    assert router.allow_migrate(REPLICA_ALIAS, "trees") is False
+    assert router.allow_relation(Tree(), Tree()) is True
+
+
+def test_snapshot_version_reads_primary(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+):
+    """Test the snapshot is built for the version read from the primary."""
+    tree = tree_factory()
+
+    queries = CaptureQueriesContext(connections[DEFAULT_DB_ALIAS])
+    with queries:
+        response = api_client.get(
+            reverse("trees:trees-snapshot", kwargs={"pk": tree.pk}),
+        )
+
+    assert response.status_code == HTTP_200_OK
+    assert any(
+        'SELECT "trees_tree"."version"' in query["sql"]
+        for query in queries.captured_queries
+    )
+
+
+def test_middleware_resets_routing_on_error():
+    """Test the routing does not leak out of the failed request."""
+    request = Mock(method="GET", COOKIES={})
+    failing_view = Mock(side_effect=RuntimeError)
+
+    with pytest.raises(RuntimeError):
+        ReplicaRoutingMiddleware(failing_view)(request)
+
+    assert REPLICA_ROUTING.get() is None
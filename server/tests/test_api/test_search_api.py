@@ -0,0 +1,79 @@
+"""Tests for the full-text search API."""
+
+import pytest
+from django.urls import reverse
+from rest_framework.status import HTTP_200_OK, HTTP_400_BAD_REQUEST
+from rest_framework.test import APIClient
+
+from server.apps.trees.api.serializers.search import MAX_SEARCH_LIMIT
+from server.tests.factories import SolutionFactory, TreeFactory
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_search_api_ranks_names_first(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+    solution_factory: SolutionFactory,
+):
+    """Test the matching names are ranked above the descriptions."""
+    described_tree = tree_factory(description="Observers of the events.")
+    named_tree = tree_factory(name="Observer", description="Notifications.")
+    tree_factory(name="Factory", description="Creating the objects.")
+    solution = solution_factory(
+        name="Publisher",
+        description="Use the **observer** pattern.",
+    )
+    solution_factory(name="Strategy", description="Swap the algorithms.")
+
+    response = api_client.get(
+        reverse("trees:search-list"),
+        {"query": "observer"},
+    )
+
+    assert response.status_code == HTTP_200_OK
+    assert [match["pk"] for match in response.data["trees"]] == [
+        str(named_tree.pk),
+        str(described_tree.pk),
+    ]
+    assert [match["name"] for match in response.data["solutions"]] == [
+        solution.name,
+    ]
+
+
+def test_search_api_follows_edits(
+    api_client: APIClient,
+    solution_factory: SolutionFactory,
+):
+    """Test the solutions are indexed by the text of their descriptions."""
+    solution = solution_factory(description="Wrap the *adaptee* object.")
+    solution.description = "Wrap the **decorated** object."
+    solution.save()
+
+    responses = [
+        api_client.get(reverse("trees:search-list"), {"query": search_text})
+        for search_text in ("adaptee", "decorated", "strong")
+    ]
+
+    assert [len(response.data["solutions"]) for response in responses] == [
+        0,
+        1,
+        0,
+    ]
+
+
+def test_search_api_limits(api_client: APIClient, tree_factory: TreeFactory):
+    """Test the number of the matches is limited."""
+    tree_factory.create_batch(3, description="Shared description.")
+
+    response = api_client.get(
+        reverse("trees:search-list"),
+        {"query": "shared", "limit": 2},
+    )
+    too_many_response = api_client.get(
+        reverse("trees:search-list"),
+        {"query": "shared", "limit": MAX_SEARCH_LIMIT + 1},
+    )
+
+    assert len(response.data["trees"]) == 2
+    assert too_many_response.status_code == HTTP_400_BAD_REQUEST
@@ -2,7 +2,11 @@
 
 import pytest
 from django.urls import reverse
-from rest_framework.status import HTTP_200_OK, HTTP_201_CREATED
+from rest_framework.status import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_304_NOT_MODIFIED,
+)
 from rest_framework.test import APIClient
 
 from server.apps.trees.models import Solution
@@ -42,3 +46,67 @@ def test_solution_update_api(
     assert Solution.objects.count() == 1
     assert solution.name == "Test Solution Updated"
     assert solution.description == "Test Description Updated"
+
+
+def test_solution_list_api_queries(
+    api_client: APIClient,
+    solution_factory: SolutionFactory,
+    django_assert_num_queries,
+):
+    """Test listing solutions in constant queries.
+
+    User and solutions with creators.
+    """
+    solution_factory.create_batch(3)
+
+    with django_assert_num_queries(2):
+        response = api_client.get(reverse("trees:solutions-list"))
+
+    assert response.status_code == HTTP_200_OK
+    assert len(response.data["results"]) == 3
+    assert "ETag" not in response
+
+
+def test_solution_retrieve_api_not_modified(
+    api_client: APIClient,
+    solution_factory: SolutionFactory,
+):
+    """Test serving the rendered description, not transferred again."""
+    solution = solution_factory(description="# Title")
+    url = reverse("trees:solutions-detail", kwargs={"pk": solution.pk})
+
+    response = api_client.get(url)
+    cached_response = api_client.get(
+        url,
+        HTTP_IF_NONE_MATCH=response["ETag"],
+    )
+
+    assert response.status_code == HTTP_200_OK
+    assert response.data["description"] == "# Title"
+    assert response.data["description_html"].startswith("<h1")
+    assert cached_response.status_code == HTTP_304_NOT_MODIFIED
+    assert not cached_response.content
+
+
+def test_solution_retrieve_api_modified(
+    api_client: APIClient,
+    solution_factory: SolutionFactory,
+):
+    """Test the changed solution is transferred again."""
+    solution = solution_factory(description="# Title")
+    url = reverse("trees:solutions-detail", kwargs={"pk": solution.pk})
+    etag = api_client.get(url)["ETag"]
+
+    solution.description = "# Changed Title"
+    solution.save()
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    fields_response = api_client.get(
+        url,
+        {"fields": "name"},
+        HTTP_IF_NONE_MATCH=response["ETag"],
+    )
+
+    assert response.status_code == HTTP_200_OK
+    assert response.data["description"] == "# Changed Title"
+    assert fields_response.status_code == HTTP_200_OK
+    assert fields_response.data == {"name": solution.name}
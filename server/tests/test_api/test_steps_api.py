@@ -1,5 +1,7 @@
 """Tests for steps model API."""
 
+import uuid
+
 import pytest
 from django.urls import reverse
 from rest_framework.status import (
@@ -15,10 +17,15 @@ from server.tests.factories import (
     PathFactory,
     SolutionFactory,
     StepFactory,
+    TreeFactory,
 )
+from server.tests.test_helpers import create_nested_path_steps
 
 pytestmark = [pytest.mark.django_db]
 
+RELINKED_COUNT = 30
+RELINK_MAX_QUERIES = 25
+
 
 def test_step_create_api(api_client: APIClient, path_factory: PathFactory):
     """Test creating step instance using step api."""
@@ -62,6 +69,66 @@ def test_step_create_api_with_options(
     )
 
 
+def test_step_create_api_relinks_options_in_bulk(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+    option_factory: OptionFactory,
+    django_assert_max_num_queries,
+    django_capture_on_commit_callbacks,
+):
+    """Test the preceding options are relinked with the constant queries.
+
+    Trees of the relinked options are refreshed, though the new step
+    is created in the path outside of them.
+    """
+    options = option_factory.create_batch(RELINKED_COUNT)
+    preceding_options = [option.pk for option in options]
+    tree = tree_factory()
+    tree.paths.add(options[0].step.path)
+    path = options[-1].step.path
+    tree.refresh_from_db()
+
+    with django_assert_max_num_queries(RELINK_MAX_QUERIES):
+        with django_capture_on_commit_callbacks(execute=True):
+            response = api_client.post(
+                reverse("trees:steps-list"),
+                data={
+                    "name": "Merge Step",
+                    "path": path.pk,
+                    "preceding_options": preceding_options,
+                },
+            )
+    tree_version = tree.version
+    tree.refresh_from_db()
+    merge_step = Step.objects.get(name="Merge Step")
+    linked_options = merge_step.preceding_options.values_list("pk", flat=True)
+
+    assert response.status_code == HTTP_201_CREATED
+    assert set(linked_options) == set(preceding_options)
+    assert tree.version == tree_version + 1
+
+
+def test_step_create_api_unknown_options(
+    api_client: APIClient,
+    path_factory: PathFactory,
+):
+    """Test creating step with missing preceding options is rejected."""
+    missing_pk = uuid.uuid4()
+    response = api_client.post(
+        reverse("trees:steps-list"),
+        data={
+            "name": "Test Step",
+            "path": path_factory().pk,
+            "preceding_options": [missing_pk],
+        },
+    )
+
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.data["preceding_options"] == [
+        f"Unknown options: {missing_pk}.",
+    ]
+
+
 def test_step_create_api_with_solution(
     api_client: APIClient,
     path_factory: PathFactory,
@@ -146,3 +213,38 @@ def test_step_update_api(api_client: APIClient, step_factory: StepFactory):
 
     assert response.status_code == HTTP_200_OK
     assert step.name == "Test Step Updated"
+
+
+def test_step_list_api_queries(
+    api_client: APIClient,
+    path_factory: PathFactory,
+    django_assert_num_queries,
+):
+    """Test listing steps with nested instances in constant queries.
+
+    User, steps with solutions and options.
+    """
+    for _ in range(3):
+        create_nested_path_steps(path_factory())
+
+    with django_assert_num_queries(3):
+        response = api_client.get(reverse("trees:steps-list"))
+
+    assert response.status_code == HTTP_200_OK
+    assert len(response.data["results"]) == 6
+
+
+def test_step_retrieve_api_plain_fields(
+    api_client: APIClient,
+    step_factory: StepFactory,
+):
+    """Test retrieving plain fields of the step."""
+    step = step_factory()
+
+    response = api_client.get(
+        reverse("trees:steps-detail", kwargs={"pk": step.pk}),
+        data={"fields": "name,is_final"},
+    )
+
+    assert response.status_code == HTTP_200_OK
+    assert response.data == {"name": step.name, "is_final": step.is_final}
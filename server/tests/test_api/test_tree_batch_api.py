@@ -0,0 +1,272 @@
+"""Tests for tree batch edit API."""
+
+from unittest.mock import Mock
+
+import pytest
+from django.urls import reverse
+from rest_framework.status import HTTP_200_OK, HTTP_400_BAD_REQUEST
+from rest_framework.test import APIClient
+
+from server.apps.trees.api.serializers.tree_batch import MAX_BATCH_OPERATIONS
+from server.apps.trees.graph import TreeGraphCache
+from server.apps.trees.models import Option, Path, Step
+from server.apps.trees.selectors import TreeSelector
+from server.tests.factories import OptionFactory, StepFactory, TreeFactory
+
+pytestmark = [pytest.mark.django_db]
+
+INVALID_OPERATIONS = (
+    (
+        {"op": "update", "model": "step", "pk": "step", "data": {"path": "x"}},
+        "Only these fields can be updated: name.",
+    ),
+    (
+        {"op": "create", "model": "path", "pk": "path", "data": {}},
+        "Only the updated and deleted instances have primary keys.",
+    ),
+    (
+        {"op": "delete", "model": "option", "pk": "missing"},
+        "Operation 0: unknown option missing.",
+    ),
+)
+
+
+def test_tree_batch_api(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+    step_factory: StepFactory,
+    option_factory: OptionFactory,
+    django_capture_on_commit_callbacks,
+):
+    """Test applying the operations with the single refresh of the tree."""
+    first_step = step_factory(is_first=True)
+    deleted_option = option_factory(step=first_step)
+    tree = tree_factory()
+    tree.paths.add(first_step.path)
+    tree.refresh_from_db()
+    TreeGraphCache.compile(tree)
+    operations = [
+        {"op": "create", "model": "path", "id": "path", "data": {"name": "P"}},
+        {
+            "op": "create",
+            "model": "step",
+            "id": "next",
+            "data": {"name": "Next", "path": str(first_step.path.pk)},
+        },
+        {
+            "op": "create",
+            "model": "step",
+            "id": "other",
+            "data": {"name": "Other", "path": "path"},
+        },
+        {
+            "op": "create",
+            "model": "option",
+            "id": "option",
+            "data": {"name": "Go", "step": "next", "next_step": "other"},
+        },
+        {
+            "op": "create",
+            "model": "option",
+            "id": "removed",
+            "data": {"name": "Back", "step": "other", "next_step": "next"},
+        },
+        {"op": "delete", "model": "option", "pk": "removed"},
+        {"op": "delete", "model": "option", "pk": str(deleted_option.pk)},
+        {
+            "op": "create",
+            "model": "option",
+            "id": "first-option",
+            "data": {
+                "name": deleted_option.name,
+                "step": str(first_step.pk),
+                "next_step": "next",
+            },
+        },
+        {
+            "op": "update",
+            "model": "step",
+            "pk": str(first_step.pk),
+            "data": {"name": "First"},
+        },
+        {"op": "update", "model": "step", "pk": "next", "data": {"name": "N"}},
+    ]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = api_client.post(
+            reverse("trees:batch-list"),
+            data={"operations": operations},
+            format="json",
+        )
+    mapping = response.data["mapping"]
+    tree_version = tree.version
+    tree.refresh_from_db()
+    step_names = set(Step.objects.values_list("name", flat=True))
+    options = dict(Option.objects.values_list("name", "next_step__name"))
+
+    assert response.status_code == HTTP_200_OK
+    assert set(mapping) == {"path", "next", "other", "option", "first-option"}
+    assert response.data["trees"] == [str(tree.pk)]
+    assert (tree.version, tree.first_step["name"]) == (
+        tree_version + 1,
+        "First",
+    )
+    assert (step_names, options) == (
+        {"First", "N", "Other"},
+        {deleted_option.name: "N", "Go": "Other"},
+    )
+
+
+@pytest.mark.parametrize(("operation", "message"), INVALID_OPERATIONS)
+def test_tree_batch_api_invalid(
+    api_client: APIClient,
+    operation: dict,
+    message: str,
+):
+    """Test the invalid operations are rejected."""
+    response = api_client.post(
+        reverse("trees:batch-list"),
+        data={"operations": [operation]},
+        format="json",
+    )
+
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert message in str(response.data)
+
+
+def test_tree_batch_api_too_many_operations(api_client: APIClient):
+    """Test the batches over the size limit are rejected."""
+    operations = [
+        {"op": "delete", "model": "path", "pk": f"path-{index}"}
+        for index in range(MAX_BATCH_OPERATIONS + 1)
+    ]
+    response = api_client.post(
+        reverse("trees:batch-list"),
+        data={"operations": operations},
+        format="json",
+    )
+
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert "at most" in str(response.data)
+
+
+def test_tree_batch_api_rollback(
+    api_client: APIClient,
+    step_factory: StepFactory,
+):
+    """Test nothing is saved when the batch fails on the constraints."""
+    step = step_factory()
+    operations = [
+        {"op": "create", "model": "path", "data": {"name": "New Path"}},
+        {
+            "op": "create",
+            "model": "step",
+            "data": {"name": step.name, "path": str(step.path.pk)},
+        },
+    ]
+
+    response = api_client.post(
+        reverse("trees:batch-list"),
+        data={"operations": operations},
+        format="json",
+    )
+
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert not Path.objects.filter(name="New Path").exists()
+
+
+def test_tree_batch_api_rename_deleted(
+    api_client: APIClient,
+    step_factory: StepFactory,
+):
+    """Test the deleted instances are not updated, after they're renamed."""
+    step, other_step = step_factory.create_batch(2)
+    operations = [
+        {
+            "op": "update",
+            "model": "step",
+            "pk": str(step.pk),
+            "data": {"name": "Renamed"},
+        },
+        {"op": "delete", "model": "step", "pk": str(step.pk)},
+        {
+            "op": "create",
+            "model": "step",
+            "data": {"name": "Renamed", "path": str(step.path.pk)},
+        },
+        {
+            "op": "update",
+            "model": "step",
+            "pk": str(other_step.pk),
+            "data": {"name": "Renamed"},
+        },
+        {"op": "delete", "model": "path", "pk": str(other_step.path.pk)},
+    ]
+
+    response = api_client.post(
+        reverse("trees:batch-list"),
+        data={"operations": operations},
+        format="json",
+    )
+
+    assert response.status_code == HTTP_200_OK
+    assert list(Step.objects.values_list("name", "path")) == [
+        ("Renamed", step.path.pk),
+    ]
+
+
+def test_tree_batch_api_delete_at_once(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+    option_factory: OptionFactory,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test the trees of the deleted instances are looked up at once."""
+    options = option_factory.create_batch(3)
+    trees = tree_factory.create_batch(3)
+    for each_tree, option in zip(trees, options):
+        each_tree.paths.add(option.step.path)
+    tree_pks = {str(tree.pk) for tree in trees}
+    pks_for_instances = Mock(wraps=TreeSelector.pks_for_instances)
+    monkeypatch.setattr(TreeSelector, "pks_for_instances", pks_for_instances)
+    operations = [
+        {"op": "delete", "model": "path", "pk": str(options[0].step.path.pk)},
+        {"op": "delete", "model": "step", "pk": str(options[1].step.pk)},
+        {"op": "delete", "model": "option", "pk": str(options[2].pk)},
+    ]
+
+    response = api_client.post(
+        reverse("trees:batch-list"),
+        data={"operations": operations},
+        format="json",
+    )
+
+    assert response.status_code == HTTP_200_OK
+    assert set(response.data["trees"]) == tree_pks
+    assert pks_for_instances.call_count == 1
+    assert not Option.objects.exists()
+
+
+def test_tree_batch_api_refers_deleted(
+    api_client: APIClient,
+    step_factory: StepFactory,
+):
+    """Test the instances cannot refer to the instances deleted later."""
+    path = step_factory().path
+    operations = [
+        {
+            "op": "create",
+            "model": "step",
+            "data": {"name": "Created", "path": str(path.pk)},
+        },
+        {"op": "delete", "model": "path", "pk": str(path.pk)},
+    ]
+
+    response = api_client.post(
+        reverse("trees:batch-list"),
+        data={"operations": operations},
+        format="json",
+    )
+
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert Path.objects.filter(pk=path.pk).exists()
@@ -0,0 +1,65 @@
+"""Tests for the tree cohesion API action."""
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from server.tests.factories import OptionFactory, StepFactory, TreeFactory
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_tree_cohesion_api(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+    step_factory: StepFactory,
+    option_factory: OptionFactory,
+):
+    """Test the issues of the whole tree are reported."""
+    first_step = step_factory(is_first=True)
+    option = option_factory(step=first_step)
+    unreachable_step = step_factory(path=first_step.path)
+    tree = tree_factory()
+    tree.paths.add(first_step.path)
+    url = reverse("trees:trees-cohesion", kwargs={"pk": tree.pk})
+
+    response = api_client.get(url)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert not response.data["is_cohesive"]
+    assert {
+        (issue["kind"], issue["step_name"], issue["option"])
+        for issue in response.data["issues"]
+    } == {
+        ("dead_end", first_step.name, str(option.pk)),
+        ("dead_end", unreachable_step.name, None),
+        ("unreachable", unreachable_step.name, None),
+    }
+
+
+def test_tree_cohesion_api_deleted_option(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+    step_factory: StepFactory,
+    option_factory: OptionFactory,
+):
+    """Test the steps the deleted option led to are validated."""
+    first_step = step_factory(is_first=True)
+    next_step = step_factory(path=first_step.path)
+    option = option_factory(step=first_step, next_step=next_step)
+    tree = tree_factory()
+    tree.paths.add(first_step.path)
+    option.delete()
+
+    response = api_client.get(
+        reverse("trees:trees-cohesion", kwargs={"pk": tree.pk}),
+    )
+
+    assert {
+        (issue["kind"], issue["step_name"]) for issue in response.data["issues"]
+    } == {
+        ("dead_end", first_step.name),
+        ("dead_end", next_step.name),
+        ("unreachable", next_step.name),
+    }
@@ -0,0 +1,166 @@
+"""Tests for tree import API."""
+
+import pytest
+from django.urls import reverse
+from rest_framework.status import HTTP_201_CREATED, HTTP_400_BAD_REQUEST
+from rest_framework.test import APIClient
+
+from server.apps.trees.models import Option, Step, Tree
+from server.apps.users.models import User
+from server.tests.factories import PathFactory, TreeFactory
+
+pytestmark = [pytest.mark.django_db]
+
+LARGE_TREE_STEPS_COUNT = 500
+LARGE_TREE_MAX_QUERIES = 25
+INVALID_FINAL_STEP_CHANGES = (
+    ({"id": "solution"}, "Duplicated ids: solution."),
+    ({"solution": "step-0"}, "Unknown ids: step-0."),
+    ({"is_first": True}, "A step cannot be both first and final."),
+)
+
+
+def create_tree_document(steps_count: int) -> dict:
+    """Prepare the tree document with a chain of steps ending with solution.
+
+    Args:
+        steps_count (int): number of the steps in the chain.
+
+    Returns:
+        dict: tree document.
+    """
+    steps = [
+        {
+            "id": f"step-{index}",
+            "name": f"Step {index}",
+            "is_first": index == 0,
+            "options": [
+                {
+                    "id": f"option-{index}",
+                    "name": "Next",
+                    "next_step": f"step-{next_index}",
+                },
+            ],
+        }
+        for index, next_index in enumerate(range(1, steps_count + 1))
+    ]
+    steps.append(
+        {
+            "id": f"step-{steps_count}",
+            "name": "Final Step",
+            "is_final": True,
+            "solution": "solution",
+        },
+    )
+    return {
+        "name": "Imported Tree",
+        "description": "Imported Description",
+        "solutions": [
+            {"id": "solution", "name": "Solution", "description": "# Title"},
+        ],
+        "paths": [{"id": "path", "name": "Imported Path", "steps": steps}],
+    }
+
+
+def test_tree_import_api(
+    api_client: APIClient,
+    django_capture_on_commit_callbacks,
+):
+    """Test importing the whole tree document with the id mapping."""
+    with django_capture_on_commit_callbacks(execute=True):
+        response = api_client.post(
+            reverse("trees:import-list"),
+            data=create_tree_document(3),
+            format="json",
+        )
+    tree = Tree.objects.get(pk=response.data["tree"])
+    mapping = response.data["mapping"]
+    option = Option.objects.get(pk=mapping["option-0"])
+    final_step = Step.objects.get(pk=mapping["step-3"])
+    path = tree.paths.get()
+
+    assert response.status_code == HTTP_201_CREATED
+    assert str(path.pk) == mapping["path"]
+    assert str(option.next_step_id) == mapping["step-1"]
+    assert final_step.solution.description_html == "<h1>Title</h1>"
+    assert tree.first_step["name"] == "Step 0"
+
+
+def test_tree_import_api_queries(
+    api_client: APIClient,
+    django_assert_max_num_queries,
+):
+    """Test importing the large tree in constant number of queries."""
+    with django_assert_max_num_queries(LARGE_TREE_MAX_QUERIES):
+        response = api_client.post(
+            reverse("trees:import-list"),
+            data=create_tree_document(LARGE_TREE_STEPS_COUNT),
+            format="json",
+        )
+
+    assert response.status_code == HTTP_201_CREATED
+    assert Step.objects.count() == LARGE_TREE_STEPS_COUNT + 1
+
+
+@pytest.mark.parametrize(("change", "error"), INVALID_FINAL_STEP_CHANGES)
+def test_tree_import_api_invalid_document(
+    api_client: APIClient,
+    change: dict,
+    error: str,
+):
+    """Test rejecting the invalid document without writing anything."""
+    tree_document = create_tree_document(1)
+    final_step = tree_document["paths"][0]["steps"][-1]
+    final_step.update(change)
+
+    response = api_client.post(
+        reverse("trees:import-list"),
+        data=tree_document,
+        format="json",
+    )
+
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert error in str(response.data)
+    assert not Tree.objects.exists()
+
+
+def test_tree_import_api_taken_path_name(
+    api_client: APIClient,
+    path_factory: PathFactory,
+):
+    """Test rejecting the document with path name taken by the user."""
+    path_factory(
+        name="Imported Path",
+        creator=User.objects.get(username="test_user"),
+    )
+
+    response = api_client.post(
+        reverse("trees:import-list"),
+        data=create_tree_document(1),
+        format="json",
+    )
+
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.data == ["Path with this Name and Creator already exists."]
+    assert not Tree.objects.exists()
+
+
+def test_tree_import_api_taken_tree_name(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+):
+    """Test rejecting the document with tree name taken by the user."""
+    tree_factory(
+        name="Imported Tree",
+        creator=User.objects.get(username="test_user"),
+    )
+
+    response = api_client.post(
+        reverse("trees:import-list"),
+        data=create_tree_document(1),
+        format="json",
+    )
+
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.data == ["Tree with this Name and Creator already exists."]
+    assert Tree.objects.count() == 1
@@ -2,11 +2,17 @@
 
 import pytest
 from django.urls import reverse
-from rest_framework.status import HTTP_200_OK, HTTP_201_CREATED
+from rest_framework.status import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_404_NOT_FOUND,
+)
 from rest_framework.test import APIClient
 
 from server.apps.trees.models import Tree
-from server.tests.factories import TreeFactory
+from server.apps.trees.selectors import STATISTICS_FIELDS
+from server.tests.factories import PathFactory, TreeFactory
+from server.tests.test_helpers import create_nested_path_steps
 
 pytestmark = [pytest.mark.django_db]
 
@@ -33,3 +39,168 @@ def test_tree_update_api(api_client: APIClient, tree_factory: TreeFactory):
 
     assert response.status_code == HTTP_200_OK
     assert tree.name == "New Name"
+
+
+def test_tree_list_api_queries(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+    path_factory: PathFactory,
+    django_assert_num_queries,
+):
+    """Test listing trees with nested instances in constant queries.
+
+    User, trees with creators, paths, steps with solutions and options.
+    """
+    for _ in range(3):
+        path = path_factory()
+        create_nested_path_steps(path)
+        tree_factory().paths.add(path, path_factory())
+
+    with django_assert_num_queries(5):
+        response = api_client.get(reverse("trees:trees-list"))
+
+    assert response.status_code == HTTP_200_OK
+    assert len(response.data["results"]) == 3
+
+
+def test_tree_list_api_cursor_pages(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+):
+    """Test following the cursor through pages of trees.
+
+    Trees created after the first page are not shifting the next pages.
+    """
+    tree_factory.create_batch(5)
+    trees = list(Tree.objects.order_by("created_at", "uuid"))
+    response = api_client.get(
+        reverse("trees:trees-list"),
+        data={"page_size": 2},
+    )
+    tree_factory.create_batch(2)
+    next_response = api_client.get(response.data["next"])
+
+    assert response.status_code == HTTP_200_OK
+    assert response.data["previous"] is None
+    assert [tree["pk"] for tree in response.data["results"]] == [
+        str(tree.pk) for tree in trees[:2]
+    ]
+    assert [tree["pk"] for tree in next_response.data["results"]] == [
+        str(tree.pk) for tree in trees[2:4]
+    ]
+
+
+def test_tree_list_api_cursor_back(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+):
+    """Test following the previous cursor back to the first page."""
+    tree_factory.create_batch(5)
+    trees = [
+        str(tree.pk) for tree in Tree.objects.order_by("created_at", "uuid")
+    ]
+    response = api_client.get(
+        reverse("trees:trees-list"),
+        data={"page_size": 2},
+    )
+    forward_pks = [tree["pk"] for tree in response.data["results"]]
+    while response.data["next"]:
+        response = api_client.get(response.data["next"])
+        forward_pks.extend(tree["pk"] for tree in response.data["results"])
+    backward_pks: list[str] = []
+    while response.data["previous"]:
+        response = api_client.get(response.data["previous"])
+        backward_pks.extend(tree["pk"] for tree in response.data["results"])
+
+    assert forward_pks == trees
+    assert backward_pks == trees[2:4] + trees[:2]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "invalid",
+        "cD0lNUI=",  # p=[
+        "cD1bMV0=",  # p=[1]
+        "cD0lNUIlMjJ4JTIyJTJDKyUyMnklMjIlNUQ=",  # p=["x", "y"]
+    ],
+)
+def test_tree_list_api_invalid_cursor(api_client: APIClient, cursor: str):
+    """Test the cursors with malformed positions are not found."""
+    response = api_client.get(
+        reverse("trees:trees-list"),
+        data={"cursor": cursor},
+    )
+
+    assert response.status_code == HTTP_404_NOT_FOUND
+
+
+def test_tree_list_api_plain_fields(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+    path_factory: PathFactory,
+    django_assert_num_queries,
+):
+    """Test listing plain fields of trees with a single narrow query."""
+    tree_factory().paths.add(path_factory())
+
+    with django_assert_num_queries(2):
+        response = api_client.get(
+            reverse("trees:trees-list"),
+            data={"fields": "pk,name"},
+        )
+
+    assert response.status_code == HTTP_200_OK
+    assert list(response.data["results"][0]) == ["pk", "name"]
+
+
+def test_tree_list_api_expand(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+    path_factory: PathFactory,
+    django_assert_num_queries,
+):
+    """Test prefetching and serializing expanded relations only.
+
+    User, trees with creators, paths and steps.
+    """
+    path = path_factory()
+    create_nested_path_steps(path)
+    tree_factory().paths.add(path)
+
+    with django_assert_num_queries(4):
+        response = api_client.get(
+            reverse("trees:trees-list"),
+            data={"fields": "pk,author,paths", "expand": "paths.steps"},
+        )
+    tree_data = response.data["results"][0]
+    step_data = tree_data["paths"][0]["steps"][0]
+
+    assert response.status_code == HTTP_200_OK
+    assert set(tree_data) == {"pk", "author", "paths"}
+    assert "options" not in step_data
+    assert "solution" not in step_data
+
+
+def test_tree_retrieve_api_expand_without_fields(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+    path_factory: PathFactory,
+):
+    """Test leaving out relations that are not expanded."""
+    tree = tree_factory()
+    tree.paths.add(path_factory())
+
+    response = api_client.get(
+        reverse("trees:trees-detail", kwargs={"pk": tree.pk}),
+        data={"expand": ""},
+    )
+
+    assert response.status_code == HTTP_200_OK
+    assert set(response.data) == {
+        "pk",
+        "name",
+        "description",
+        "author",
+        *STATISTICS_FIELDS,
+    }
@@ -0,0 +1,88 @@
+"""Tests for the step and option names typeahead API."""
+
+import pytest
+from django.urls import reverse
+from rest_framework.status import HTTP_200_OK, HTTP_400_BAD_REQUEST
+from rest_framework.test import APIClient
+
+from server.tests.factories import (
+    OptionFactory,
+    PathFactory,
+    StepFactory,
+    TreeFactory,
+)
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_typeahead_api_step_names(
+    api_client: APIClient,
+    path_factory: PathFactory,
+    step_factory: StepFactory,
+):
+    """Test the similar step names of the path are found, most similar first."""
+    path = path_factory()
+    step_factory(path=path, name="Database")
+    step_factory(path=path, name="Database replication")
+    step_factory(path=path, name="Caching")
+    step_factory(name="Database sharding")
+
+    response = api_client.get(
+        reverse("trees:typeahead-list"),
+        {"query": "databse", "model": "step", "path": path.pk},
+    )
+
+    assert response.status_code == HTTP_200_OK
+    assert [match["name"] for match in response.data] == [
+        "Database",
+        "Database replication",
+    ]
+
+
+def test_typeahead_api_option_names(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+    path_factory: PathFactory,
+    step_factory: StepFactory,
+    option_factory: OptionFactory,
+):
+    """Test the option names of the tree are distinct and limited."""
+    tree = tree_factory()
+    path, other_path = path_factory.create_batch(2)
+    tree.paths.add(path, other_path)
+    for step_path in (path, other_path):
+        option_factory(step=step_factory(path=step_path), name="Yes, always")
+    option_factory(step=step_factory(path=path), name="Yes, sometimes")
+
+    response = api_client.get(
+        reverse("trees:typeahead-list"),
+        {"query": "yes", "model": "option", "tree": tree.pk, "limit": 1},
+    )
+
+    assert response.status_code == HTTP_200_OK
+    assert [match["name"] for match in response.data] == ["Yes, always"]
+
+
+def test_typeahead_api_needs_scope(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+    path_factory: PathFactory,
+):
+    """Test the lookup is scoped to exactly one of the path and the tree."""
+    responses = [
+        api_client.get(reverse("trees:typeahead-list"), query)
+        for query in (
+            {"query": "yes", "model": "step"},
+            {
+                "query": "yes",
+                "model": "step",
+                "path": path_factory().pk,
+                "tree": tree_factory().pk,
+            },
+        )
+    ]
+
+    assert [response.status_code for response in responses] == [
+        HTTP_400_BAD_REQUEST,
+        HTTP_400_BAD_REQUEST,
+    ]
@@ -0,0 +1,29 @@
+"""Tests for the benchmark primary keys command."""
+
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+
+pytestmark = [pytest.mark.django_db]
+
+ROWS_COUNT = 50
+BATCH_SIZE = 20
+
+
+def test_benchmark_primary_keys():
+    """Test both generators are measured and the tables are dropped."""
+    output = StringIO()
+    call_command(
+        "benchmark_primary_keys",
+        rows=ROWS_COUNT,
+        batch_size=BATCH_SIZE,
+        stdout=output,
+    )
+    lines = output.getvalue().splitlines()
+    assert [line.split(":")[0] for line in lines] == ["uuid4", "uuid7"]
+    assert all("primary key index" in line for line in lines)
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass('benchmark_uuid7')")
+        assert cursor.fetchone() == (None,)
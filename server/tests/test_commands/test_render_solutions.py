@@ -0,0 +1,45 @@
+"""Tests for the render solutions command."""
+
+import pytest
+from django.core.management import call_command
+
+from server.apps.trees.graph import TreeGraphCache
+from server.apps.trees.models import Solution
+from server.apps.trees.rendering import DescriptionRenderer
+from server.tests.factories import SolutionFactory, StepFactory, TreeFactory
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_render_solutions_after_config_change(
+    tree_factory: TreeFactory,
+    step_factory: StepFactory,
+    solution_factory: SolutionFactory,
+    monkeypatch: pytest.MonkeyPatch,
+    django_capture_on_commit_callbacks,
+):
+    """Test rendering the stale descriptions and refreshing their trees."""
+    solutions = solution_factory.create_batch(3)
+    step = step_factory(is_final=True, solution=solutions[0])
+    tree = tree_factory()
+    tree.paths.add(step.path)
+    tree.refresh_from_db()
+    TreeGraphCache.compile(tree)
+
+    call_command("render_solutions")
+    monkeypatch.setattr(DescriptionRenderer, "fingerprint", lambda: "new")
+    with django_capture_on_commit_callbacks(execute=True):
+        call_command("render_solutions", chunk_size=2)
+    tree_version = tree.version
+    tree.refresh_from_db()
+
+    assert all(
+        solution.description_hash
+        == DescriptionRenderer.content_hash(solution.description)
+        for solution in Solution.objects.all()
+    )
+    assert tree.version == tree_version + 1
+    assert [
+        step.solution.description_hash
+        for step in TreeGraphCache.get(tree.pk).steps.values()
+    ] == [Solution.objects.get(pk=solutions[0].pk).description_hash]
@@ -0,0 +1,90 @@
+"""Tests for the scan inconsistencies command."""
+
+import pytest
+from django.core.management import call_command
+
+from server.apps.trees.derived_models import (
+    BROKEN_LINK,
+    DUPLICATE_OPTION,
+    ORPHANED_STEP,
+    Inconsistency,
+    InconsistencyScan,
+)
+from server.apps.trees.services import inconsistency
+from server.tests.factories import (
+    OptionFactory,
+    PathFactory,
+    StepFactory,
+    TreeFactory,
+)
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_scan_inconsistencies(
+    tree_factory: TreeFactory,
+    path_factory: PathFactory,
+    step_factory: StepFactory,
+    option_factory: OptionFactory,
+):
+    """Test each kind of the inconsistencies is found and stored."""
+    first_step = step_factory(is_first=True)
+    merged_step = step_factory(name=first_step.name)
+    broken_option = option_factory(step=first_step, name="broken")
+    option_factory(
+        step=first_step,
+        name="go",
+        next_step=step_factory(path=first_step.path),
+    )
+    option_factory(
+        step=merged_step,
+        name="go",
+        next_step=step_factory(path=merged_step.path),
+    )
+    orphaned_step = step_factory(path=first_step.path)
+    tree = tree_factory()
+    tree.paths.add(first_step.path, merged_step.path)
+    tree_factory().paths.add(first_step.path)
+    Inconsistency.objects.create(tree=tree, kind=BROKEN_LINK, step_name="Old")
+
+    call_command("scan_inconsistencies", rate=0)
+
+    found = Inconsistency.objects.filter(tree=tree)
+    assert InconsistencyScan.objects.get().scanned_count == 2
+    assert set(found.values_list("kind", "step_name", "option_name")) == {
+        (BROKEN_LINK, first_step.name, "broken"),
+        (ORPHANED_STEP, orphaned_step.name, ""),
+        (DUPLICATE_OPTION, first_step.name, "go"),
+    }
+    assert found.get(kind=BROKEN_LINK).option == broken_option
+    assert found.get(kind=ORPHANED_STEP).step == orphaned_step
+
+
+def test_scan_inconsistencies_resume(
+    tree_factory: TreeFactory,
+    step_factory: StepFactory,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test the unfinished scan is resumed after the last scanned tree."""
+    trees = sorted(tree_factory.create_batch(3), key=lambda each: each.pk)
+    for each_tree in trees:
+        each_tree.paths.add(step_factory().path)
+    scan = InconsistencyScan.objects.create(
+        last_tree=trees[0].pk,
+        scanned_count=1,
+    )
+    delays: list[float] = []
+    monkeypatch.setattr(inconsistency.time, "sleep", delays.append)
+
+    call_command("scan_inconsistencies", chunk_size=1, rate=1000)
+    scanned_tree_pks = set(
+        Inconsistency.objects.values_list("tree", flat=True),
+    )
+    call_command("scan_inconsistencies", rate=1000)
+    scan.refresh_from_db()
+
+    assert scan.scanned_count == 3
+    assert scan.finished_at is not None
+    assert InconsistencyScan.objects.latest("created_at").scanned_count == 3
+    assert len(delays) == 3
+    assert scanned_tree_pks == {tree.pk for tree in trees[1:]}
@@ -0,0 +1,129 @@
+"""Tests for the export and import trees commands."""
+
+from pathlib import Path as FilePath
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from server.apps.trees.models import Option, Path, Solution, Step, Tree
+from server.apps.users.models import User
+from server.tests.factories import (
+    OptionFactory,
+    SolutionFactory,
+    StepFactory,
+    TreeFactory,
+)
+
+pytestmark = [pytest.mark.django_db]
+
+TRANSFERRED_MODELS = (Tree, Path, Step, Option, Solution)
+
+
+def snapshot_rows() -> dict:
+    """Return the rows of the transferred tables.
+
+    Versions of the trees are left out, as the imported trees
+    are refreshed.
+
+    Returns:
+        dict: rows keyed by the model name.
+    """
+    tree_paths = Tree.paths.through.objects.values_list("tree", "path")
+    rows = {
+        model.__name__: list(model.objects.order_by("pk").values())
+        for model in TRANSFERRED_MODELS
+    }
+    for tree_row in rows["Tree"]:
+        tree_row.pop("version")
+    return {**rows, "TreePath": set(tree_paths)}
+
+
+@pytest.fixture(name="dataset")
+def dataset_fixture(
+    tree_factory: TreeFactory,
+    step_factory: StepFactory,
+    option_factory: OptionFactory,
+    solution_factory: SolutionFactory,
+    django_capture_on_commit_callbacks,
+) -> Tree:
+    """Create the tree with the path of the first and final steps.
+
+    Args:
+        tree_factory (TreeFactory): tree factory.
+        step_factory (StepFactory): step factory.
+        option_factory (OptionFactory): option factory.
+        solution_factory (SolutionFactory): solution factory.
+        django_capture_on_commit_callbacks (Callable): runs the commit
+            hooks refreshing the tree.
+
+    Returns:
+        Tree: created tree.
+    """
+    first_step = step_factory(is_first=True)
+    path = first_step.path
+    final_step = step_factory(
+        path=path,
+        is_final=True,
+        solution=solution_factory(description=r'**"Quoted"** \ text'),
+    )
+    option_factory(step=first_step, next_step=final_step)
+    tree = tree_factory(creator=path.creator)
+    with django_capture_on_commit_callbacks(execute=True):
+        tree.paths.add(path)
+    return tree
+
+
+def test_transfer_trees(dataset: Tree, tmp_path: FilePath):
+    """Test the exported dataset is imported back as it was."""
+    dataset.refresh_from_db()
+    rows = snapshot_rows()
+    memberships = set(Option.objects.values_list("pk", "trees"))
+
+    call_command("export_trees", tmp_path, chunk_size=1)
+    for model in (Tree, Path, Solution):
+        model.objects.all().delete()
+    call_command("import_trees", tmp_path)
+
+    assert snapshot_rows() == rows
+    assert set(Option.objects.values_list("pk", "trees")) == memberships
+    assert Tree.objects.get().version == dataset.version + 1
+
+
+def test_import_trees_again(dataset: Tree, tmp_path: FilePath):
+    """Test importing the existing rows again skips them."""
+    rows = snapshot_rows()
+    call_command("export_trees", tmp_path)
+    call_command("import_trees", tmp_path)
+
+    assert snapshot_rows() == rows
+
+
+def test_import_trees_unknown_creator(dataset: Tree, tmp_path: FilePath):
+    """Test the creators have to exist in the target database."""
+    call_command("export_trees", tmp_path)
+    User.objects.all().delete()
+
+    with pytest.raises(CommandError, match="Unknown creators"):
+        call_command("import_trees", tmp_path)
+    assert not Tree.objects.exists()
+
+
+def test_import_trees_conflicting_rows(
+    dataset: Tree,
+    tmp_path: FilePath,
+    tree_factory: TreeFactory,
+):
+    """Test the rows taking the unique values of other rows are reported."""
+    call_command("export_trees", tmp_path)
+    Tree.objects.all().delete()
+    tree = tree_factory(name=dataset.name, creator=dataset.creator)
+
+    with pytest.raises(CommandError, match=str(dataset.pk)):
+        call_command("import_trees", tmp_path)
+    assert Tree.objects.get() == tree
+
+
+def test_import_trees_missing_files(tmp_path: FilePath):
+    """Test all the table files are required."""
+    with pytest.raises(CommandError, match="Missing table files"):
+        call_command("import_trees", tmp_path)
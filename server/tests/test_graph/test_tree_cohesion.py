@@ -0,0 +1,164 @@
+"""Tests for the cohesion validation of the tree graph."""
+
+from uuid import uuid4
+
+import pytest
+
+from server.apps.trees.cohesion import (
+    CYCLE,
+    DEAD_END,
+    OUTSIDE_TREE,
+    UNREACHABLE,
+    CohesionValidator,
+)
+from server.apps.trees.graph import TreeGraph, TreeGraphCache
+from server.apps.trees.models import Option, Step
+from server.apps.trees.services.tree import TreeService
+from server.tests.factories import (
+    OptionFactory,
+    PathFactory,
+    SolutionFactory,
+    StepFactory,
+    TreeFactory,
+)
+from server.tests.test_helpers import create_nested_path_steps
+
+pytestmark = [pytest.mark.django_db]
+
+CHAIN_LENGTH = 5000
+
+
+@pytest.fixture(name="incohesive_tree_graph")
+def incohesive_tree_graph_fixture(
+    tree_factory: TreeFactory,
+    path_factory: PathFactory,
+    step_factory: StepFactory,
+    option_factory: OptionFactory,
+    solution_factory: SolutionFactory,
+) -> TreeGraph:
+    """Create the tree with all kinds of the cohesion issues.
+
+    Args:
+        tree_factory (TreeFactory): tree factory.
+        path_factory (PathFactory): path factory.
+        step_factory (StepFactory): step factory.
+        option_factory (OptionFactory): option factory.
+        solution_factory (SolutionFactory): solution factory.
+
+    Returns:
+        TreeGraph: compiled graph of the tree.
+    """
+    path = path_factory()
+    steps = {
+        name: step_factory(name=name, path=path, is_first=name == "A")
+        for name in ("A", "B", "C", "D")
+    }
+    final_step = step_factory(
+        name="F",
+        path=path,
+        is_final=True,
+        solution=solution_factory(),
+    )
+    option_factory(name="To B", step=steps["A"], next_step=steps["B"])
+    option_factory(name="To F", step=steps["B"], next_step=final_step)
+    option_factory(name="Back", step=steps["B"], next_step=steps["A"])
+    option_factory(name="Outside", step=steps["C"], next_step=step_factory())
+    option_factory(name="Nowhere", step=steps["C"])
+    tree = tree_factory()
+    tree.paths.add(path)
+    return TreeGraphCache.compile(tree)
+
+
+def test_cohesive_tree(tree_factory: TreeFactory, path_factory: PathFactory):
+    """Check the tree leading from the first to the final step is cohesive."""
+    path = path_factory()
+    create_nested_path_steps(path)
+    tree = tree_factory()
+    tree.paths.add(path)
+
+    assert not CohesionValidator(TreeGraphCache.compile(tree)).validate()
+
+
+def test_incohesive_tree(incohesive_tree_graph: TreeGraph):
+    """Check all the issues of the tree are found."""
+    issues = CohesionValidator(incohesive_tree_graph).validate()
+
+    assert {
+        (issue.kind, issue.step_name, issue.option and issue.option.name)
+        for issue in issues
+    } == {
+        (CYCLE, "B", "Back"),
+        (OUTSIDE_TREE, "C", "Outside"),
+        (DEAD_END, "C", "Nowhere"),
+        (DEAD_END, "D", None),
+        (UNREACHABLE, "C", None),
+        (UNREACHABLE, "D", None),
+    }
+
+
+def test_repointed_option_region(
+    tree_factory: TreeFactory,
+    path_factory: PathFactory,
+    step_factory: StepFactory,
+    option_factory: OptionFactory,
+    solution_factory: SolutionFactory,
+):
+    """Check the step the repointed option led to before is checked."""
+    path = path_factory()
+    first_step = step_factory(name="A", path=path, is_first=True)
+    final_step = step_factory(
+        name="F",
+        path=path,
+        is_final=True,
+        solution=solution_factory(),
+    )
+    previous_step, next_step = (
+        step_factory(name=name, path=path) for name in ("B", "C")
+    )
+    option = option_factory(step=first_step, next_step=previous_step)
+    for step in (previous_step, next_step):
+        option_factory(step=step, next_step=final_step)
+    tree = tree_factory()
+    tree.paths.add(path)
+    TreeGraphCache.compile(tree)
+
+    option.next_step = next_step
+    option.save()
+    issues = TreeService.check_cohesion(tree)
+
+    assert [(issue.kind, issue.step_name) for issue in issues] == [
+        (UNREACHABLE, "B"),
+    ]
+
+
+def test_tree_without_first_step(tree_factory: TreeFactory):
+    """Check the tree without the first step is reported."""
+    graph = TreeGraphCache.compile(tree_factory())
+    issues = CohesionValidator(graph).validate()
+
+    assert [issue.kind for issue in issues] == [UNREACHABLE]
+
+
+def test_long_chain_validated_iteratively():
+    """Check the long graphs are validated without the recursion."""
+    steps = [
+        Step(name=f"Step {index}", is_first=index == 0)
+        for index in range(CHAIN_LENGTH)
+    ]
+    steps[-1].is_final = True
+    options = [
+        Option(name="Next", step=step, next_step=next_step)
+        for step, next_step in zip(steps, steps[1:])
+    ]
+    last_step = steps[-2]
+    options.append(Option(name="Back", step=last_step, next_step=steps[0]))
+    graph = TreeGraph(tree_pk=uuid4(), first_step_name=None)
+    graph.add_steps(steps)
+    graph.add_options(options)
+    graph.select_first_step()
+
+    issues = CohesionValidator(graph).validate()
+
+    assert [(issue.kind, issue.option.name) for issue in issues] == [
+        (CYCLE, "Back"),
+    ]
@@ -0,0 +1,88 @@
+"""Tests for the first step stored on the tree."""
+
+import json
+
+import pytest
+from django.core.serializers.json import DjangoJSONEncoder
+
+from server.apps.trees.api.serializers.step import TreeStepModelSerializer
+from server.apps.trees.graph import TreeGraphCache
+from server.apps.trees.models import Option, Step, Tree
+from server.tests.factories import TreeFactory
+from server.tests.test_helpers import create_path_step_options_for_tree
+
+pytestmark = [pytest.mark.django_db]
+
+
+def compiled_first_step(tree: Tree) -> dict:
+    """Serialize the first step of the tree chosen by its compiled graph.
+
+    Args:
+        tree (Tree): tree to select the first step for.
+
+    Returns:
+        dict: first step data, as rendered to json.
+    """
+    graph = TreeGraphCache.build(tree.pk)
+    step_data = TreeStepModelSerializer(graph.first_step_data()).data
+    return json.loads(json.dumps(step_data, cls=DjangoJSONEncoder))
+
+
+def test_first_step_stored(
+    tree_factory: TreeFactory,
+    django_capture_on_commit_callbacks,
+):
+    """Check if the stored first step matches the compiled graph."""
+    tree = tree_factory()
+    with django_capture_on_commit_callbacks(execute=True):
+        for _ in range(2):
+            create_path_step_options_for_tree(
+                "First Step",
+                tree,
+                next_step=True,
+            )
+            create_path_step_options_for_tree("Another First Step", tree, 2)
+    tree.refresh_from_db()
+
+    assert tree.first_step == compiled_first_step(tree)
+    assert tree.first_step["name"] == "Another First Step"
+
+
+def test_first_step_refreshed_on_delete(
+    tree_factory: TreeFactory,
+    django_capture_on_commit_callbacks,
+):
+    """Check if the stored first step is refreshed after deletions."""
+    tree = tree_factory()
+    with django_capture_on_commit_callbacks(execute=True):
+        create_path_step_options_for_tree("First Step", tree, 3)
+    with django_capture_on_commit_callbacks(execute=True):
+        Option.objects.first().delete()
+    tree.refresh_from_db()
+
+    assert len(tree.first_step["options"]) == 2
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Step.objects.get(name="First Step").delete()
+    tree.refresh_from_db()
+
+    assert not tree.first_step
+
+
+def test_first_step_refreshed_on_paths_clear(
+    tree_factory: TreeFactory,
+    django_capture_on_commit_callbacks,
+):
+    """Check if the stored first step is refreshed after clearing paths."""
+    tree = tree_factory()
+    with django_capture_on_commit_callbacks(execute=True):
+        create_path_step_options_for_tree("First Step", tree)
+    tree.refresh_from_db()
+
+    assert tree.first_step
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Step.objects.get().path.trees.clear()
+    tree.refresh_from_db()
+
+    assert not tree.first_step
@@ -0,0 +1,246 @@
+"""Tests for the compiled tree graph."""
+
+import pytest
+
+from server.apps.trees.graph import TreeGraphCache
+from server.apps.trees.models import Option, Step
+from server.tests.factories import (
+    OptionFactory,
+    PathFactory,
+    SolutionFactory,
+    StepFactory,
+    TreeFactory,
+)
+from server.tests.test_helpers import create_path_step_options_for_tree
+
+pytestmark = [pytest.mark.django_db]
+
+FIRST_STEP_COUNTS = (
+    (3, 0, "First Step"),
+    (3, 1, "First Step"),
+    (3, 4, "Another First Step"),
+)
+
+
+@pytest.mark.parametrize(("paths", "options", "name"), FIRST_STEP_COUNTS)
+def test_graph_first_step(
+    tree_factory: TreeFactory,
+    paths: int,
+    options: int,
+    name: str,
+):
+    """Check if the first step has the most options for the same name."""
+    tree = tree_factory()
+    for _ in range(paths):
+        create_path_step_options_for_tree("First Step", tree)
+    if options:
+        create_path_step_options_for_tree("Another First Step", tree, options)
+    graph = TreeGraphCache.build(tree.pk)
+
+    assert graph.first_step_name == name
+
+
+def test_graph_first_step_tie(tree_factory: TreeFactory):
+    """Check if the first step ties are resolved by the name."""
+    tree = tree_factory()
+    create_path_step_options_for_tree("B Step", tree)
+    create_path_step_options_for_tree("A Step", tree)
+    graph = TreeGraphCache.compile(tree)
+
+    assert graph.first_step_name == "A Step"
+
+
+def test_graph_first_step_options(tree_factory: TreeFactory):
+    """Check if the first step has the options of all its steps."""
+    tree = tree_factory()
+    for _ in range(2):
+        create_path_step_options_for_tree("First Step", tree, next_step=True)
+        create_path_step_options_for_tree("Another First Step", tree, 2)
+    graph = TreeGraphCache.compile(tree)
+    options = Option.objects.filter(step__name="Another First Step")
+
+    assert graph.first_step_name == "Another First Step"
+    assert graph.first_step_data()["options"] == list(
+        options.order_by("name"),
+    )
+    assert not graph.nodes["Second Step"].options
+
+
+def test_graph_options_merged(
+    tree_factory: TreeFactory,
+    option_factory: OptionFactory,
+    path_factory: PathFactory,
+):
+    """Check if options with the same name are merged across the paths."""
+    tree = tree_factory()
+    first_option = None
+    for _ in range(3):
+        path = path_factory()
+        tree.paths.add(path)
+        option = option_factory(
+            name="Same Option",
+            step__name="Some Step",
+            step__path=path,
+        )
+        first_option = first_option or option
+    graph = TreeGraphCache.build(tree.pk)
+
+    assert graph.nodes["Some Step"].options == [first_option]
+
+
+def test_graph_no_first_step(tree_factory: TreeFactory):
+    """Check if the graph of an empty tree has no first step."""
+    graph = TreeGraphCache.compile(tree_factory())
+
+    assert graph.first_step_name is None
+    assert not graph.first_step_data()
+
+
+def test_graph_get_step(tree_factory: TreeFactory, step_factory: StepFactory):
+    """Check if only the steps of the tree are returned."""
+    tree = tree_factory()
+    create_path_step_options_for_tree("First Step", tree)
+    graph = TreeGraphCache.compile(tree)
+    tree_step = Step.objects.get(name="First Step")
+
+    assert graph.get_step(tree_step.pk) == tree_step
+    assert graph.get_step(str(tree_step.pk)) == tree_step
+    assert graph.get_step(step_factory().pk) is None
+    assert graph.get_step("not-an-uuid") is None
+
+
+def test_graph_cached(
+    tree_factory: TreeFactory,
+    django_assert_num_queries,
+):
+    """Check if the cached graph is served without queries."""
+    tree = tree_factory()
+    create_path_step_options_for_tree("First Step", tree)
+    TreeGraphCache.compile(tree)
+
+    with django_assert_num_queries(0):
+        graph = TreeGraphCache.get(tree.pk)
+        assert graph.first_step_name == "First Step"
+
+
+def test_graph_recompiled_on_option_change(
+    tree_factory: TreeFactory,
+    option_factory: OptionFactory,
+    django_capture_on_commit_callbacks,
+):
+    """Check if the graph is compiled again when an option is changed."""
+    tree = tree_factory()
+    create_path_step_options_for_tree("First Step", tree)
+    TreeGraphCache.compile(tree)
+    with django_capture_on_commit_callbacks(execute=True):
+        option = option_factory(step=Step.objects.get(name="First Step"))
+
+    assert (
+        option.name
+        in TreeGraphCache.get(tree.pk).nodes["First Step"].option_names
+    )
+
+    with django_capture_on_commit_callbacks(execute=True):
+        option.delete()
+
+    assert (
+        option.name
+        not in TreeGraphCache.get(tree.pk).nodes["First Step"].option_names
+    )
+
+
+def test_graph_recompiled_on_step_change(
+    tree_factory: TreeFactory,
+    django_capture_on_commit_callbacks,
+):
+    """Check if the graph is compiled again when a step is changed."""
+    tree = tree_factory()
+    create_path_step_options_for_tree("First Step", tree, next_step=True)
+    TreeGraphCache.compile(tree)
+    step = Step.objects.get(name="Second Step")
+    step.name = "Renamed Step"
+    with django_capture_on_commit_callbacks(execute=True):
+        step.save()
+
+    assert set(TreeGraphCache.get(tree.pk).nodes) == {
+        "First Step",
+        "Renamed Step",
+    }
+
+    with django_capture_on_commit_callbacks(execute=True):
+        step.delete()
+
+    assert set(TreeGraphCache.get(tree.pk).nodes) == {"First Step"}
+
+
+def test_graph_recompiled_on_solution_change(
+    tree_factory: TreeFactory,
+    step_factory: StepFactory,
+    solution_factory: SolutionFactory,
+    django_capture_on_commit_callbacks,
+):
+    """Check if the graph is compiled again when the solution is changed."""
+    tree = tree_factory()
+    solution = solution_factory()
+    step = step_factory(is_final=True, solution=solution)
+    tree.paths.add(step.path)
+    TreeGraphCache.compile(tree)
+    solution.name = "New Name"
+    with django_capture_on_commit_callbacks(execute=True):
+        solution.save()
+
+    graph = TreeGraphCache.get(tree.pk)
+
+    assert graph.get_step(step.pk).solution.name == "New Name"
+
+
+def test_graph_recompiled_on_paths_change(
+    tree_factory: TreeFactory,
+    step_factory: StepFactory,
+    django_capture_on_commit_callbacks,
+):
+    """Check if the graph is compiled again when the tree paths change."""
+    tree = tree_factory()
+    step = step_factory()
+    TreeGraphCache.compile(tree)
+    with django_capture_on_commit_callbacks(execute=True):
+        tree.paths.add(step.path)
+
+    assert TreeGraphCache.get(tree.pk).get_step(step.pk) == step
+
+    with django_capture_on_commit_callbacks(execute=True):
+        step.path.trees.remove(tree)
+
+    assert TreeGraphCache.get(tree.pk).get_step(step.pk) is None
+
+
+def test_graph_recompiled_on_path_clear(
+    tree_factory: TreeFactory,
+    step_factory: StepFactory,
+    django_capture_on_commit_callbacks,
+):
+    """Check if the graph is compiled again when the path is cleared."""
+    tree = tree_factory()
+    step = step_factory()
+    step.path.trees.add(tree)
+    TreeGraphCache.compile(tree)
+    with django_capture_on_commit_callbacks(execute=True):
+        step.path.trees.clear()
+
+    assert TreeGraphCache.get(tree.pk).get_step(step.pk) is None
+
+    step.path.trees.add(tree)
+    with django_capture_on_commit_callbacks(execute=True):
+        step.path.delete()
+
+    assert TreeGraphCache.get(tree.pk).get_step(step.pk) is None
+
+
+def test_graph_invalidated_on_tree_delete(tree_factory: TreeFactory):
+    """Check if the graph is invalidated when the tree is deleted."""
+    tree = tree_factory()
+    TreeGraphCache.compile(tree)
+    tree_pk = tree.pk
+    tree.delete()
+
+    assert TreeGraphCache.get(tree_pk) is None
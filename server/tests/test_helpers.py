@@ -1,8 +1,8 @@
 """Helper functions and classes for app tests."""
 
 
-from server.apps.trees.models import Tree
-from server.tests.factories import OptionFactory, StepFactory
+from server.apps.trees.models import Path, Tree
+from server.tests.factories import OptionFactory, SolutionFactory, StepFactory
 
 
 def create_path_step_options_for_tree(
@@ -32,3 +32,18 @@ def create_path_step_options_for_tree(
         next_step=option_next_step,
     )
     tree.paths.add(step.path)
+
+
+def create_nested_path_steps(path: Path) -> None:
+    """Create the first step with options leading to the final step.
+
+    Args:
+        path (Path): path for which the steps are created.
+    """
+    first_step = StepFactory(path=path, is_first=True)
+    final_step = StepFactory(
+        path=path,
+        is_final=True,
+        solution=SolutionFactory(),
+    )
+    OptionFactory.create_batch(2, step=first_step, next_step=final_step)
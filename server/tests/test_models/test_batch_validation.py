@@ -0,0 +1,157 @@
+"""Tests for the batched validation of the model instances."""
+from uuid import uuid4
+
+import pytest
+from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
+
+from server.apps.generic.validation import BatchValidator
+from server.apps.trees.models import Option, Path, Step
+from server.tests.factories import PathFactory, StepFactory
+
+pytestmark = [pytest.mark.django_db]
+
+BATCH_SIZE = 50
+BATCH_QUERIES = 3
+ERRORS_PER_INSTANCE = f"'name'.*'{NON_FIELD_ERRORS}'.*'path'"
+
+
+def test_batch_validation_queries(
+    path_factory: PathFactory,
+    django_assert_num_queries,
+):
+    """Check there is a single query per foreign key and unique constraint."""
+    path = path_factory()
+    steps = [
+        Step(name=f"Step {index}", path_id=path.pk)
+        for index in range(BATCH_SIZE)
+    ]
+    with django_assert_num_queries(BATCH_QUERIES):
+        BatchValidator.validate(steps)
+
+
+def test_batch_validation_saved_relations(
+    path_factory: PathFactory,
+    django_assert_num_queries,
+):
+    """Check the saved related instances set on the batch are not queried."""
+    path = path_factory()
+    steps = [
+        Step(name=f"Step {index}", path=path) for index in range(BATCH_SIZE)
+    ]
+    with django_assert_num_queries(BATCH_QUERIES - 1):
+        BatchValidator.validate(steps)
+
+
+def test_batch_validation_excluded_fields(
+    path_factory: PathFactory,
+    django_assert_num_queries,
+):
+    """Check the excluded fields are not validated."""
+    steps = [Step(name="Step", path=path_factory())]
+    with django_assert_num_queries(0):
+        BatchValidator.validate(steps, exclude=("uuid", "name"))
+
+
+def test_batch_validation_saved_instances(
+    step_factory: StepFactory,
+    django_assert_num_queries,
+):
+    """Check the saved instances do not conflict with themselves."""
+    steps = step_factory.create_batch(2)
+    steps[0].name = "Renamed step"
+    with django_assert_num_queries(BATCH_QUERIES - 2):
+        BatchValidator.validate(steps)
+
+
+def test_batch_validation_duplicate_in_batch(path_factory: PathFactory):
+    """Check the unique constraint is checked within the batch."""
+    path = path_factory()
+    steps = [Step(name="Step", path=path) for _ in range(2)]
+    with pytest.raises(ValidationError, match=NON_FIELD_ERRORS):
+        BatchValidator.validate(steps)
+
+
+def test_batch_validation_taken_values(step_factory: StepFactory):
+    """Check the unique constraint is checked against the saved rows."""
+    step = step_factory()
+    with pytest.raises(ValidationError, match=NON_FIELD_ERRORS):
+        BatchValidator.validate([Step(name=step.name, path=step.path)])
+
+
+def test_batch_validation_crossed_values(
+    step_factory: StepFactory,
+    path_factory: PathFactory,
+):
+    """Check only the whole combinations of the unique values conflict."""
+    step = step_factory()
+    steps = [
+        Step(name=step.name, path=path_factory()),
+        Step(name="Other step", path=step.path),
+    ]
+    BatchValidator.validate(steps)
+
+
+def test_batch_validation_swapped_values(step_factory: StepFactory):
+    """Check the saved instances can't swap their unique values."""
+    step = step_factory()
+    other_step = step_factory(path=step.path)
+    step_name = step.name
+    step.name = other_step.name
+    other_step.name = step_name
+    with pytest.raises(ValidationError, match=NON_FIELD_ERRORS):
+        BatchValidator.validate([step, other_step])
+
+
+def test_batch_validation_left_values(step_factory: StepFactory):
+    """Check the values left by the other instance of the batch are taken."""
+    step = step_factory()
+    other_step = step_factory(path=step.path)
+    taken_name = other_step.name
+    other_step.name = "Renamed step"
+    step.name = taken_name
+    with pytest.raises(ValidationError, match=NON_FIELD_ERRORS):
+        BatchValidator.validate([other_step, step])
+
+
+def test_batch_validation_errors_per_instance(path_factory: PathFactory):
+    """Check all the errors of the first invalid instance are raised.
+
+    Errors of the fields come first, then of the model and the relations.
+    """
+    path = path_factory()
+    steps = [
+        Step(name="Step", path=path),
+        Step(name="", path=path_factory.build(), is_first=True, is_final=True),
+    ]
+    with pytest.raises(ValidationError, match=ERRORS_PER_INSTANCE):
+        BatchValidator.validate(steps)
+
+
+def test_batch_validation_missing_foreign_key(path_factory: PathFactory):
+    """Check the related instances have to exist."""
+    steps = [Step(name="Step", path=path_factory.build())]
+    with pytest.raises(ValidationError, match="path"):
+        BatchValidator.validate(steps)
+
+
+def test_batch_validation_required_foreign_key():
+    """Check the not nullable foreign keys have to be set."""
+    with pytest.raises(ValidationError, match="creator"):
+        BatchValidator.validate([Path(name="Path")])
+
+
+def test_option_clean_does_not_load_steps(django_assert_num_queries):
+    """Check the steps are compared by their primary keys."""
+    option = Option(name="Option", step_id=uuid4(), next_step_id=uuid4())
+    with django_assert_num_queries(0):
+        option.clean()
+
+
+def test_save_without_validation(step_factory: StepFactory):
+    """Check the validation is skipped for already validated instances."""
+    step = step_factory()
+    step.is_first = True
+    step.is_final = True
+    with pytest.raises(ValidationError):
+        step.save()
+    step.save(update_fields=["name"], validate=False)
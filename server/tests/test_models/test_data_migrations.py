@@ -0,0 +1,131 @@
+"""Tests for the data migrations of the trees app."""
+
+from importlib import import_module
+from typing import Callable
+
+import pytest
+from django.apps.registry import Apps
+from django.db import connection
+from django.db.migrations.loader import MigrationLoader
+from django.test import override_settings
+
+from server.apps.trees.models import Option, Solution, Step, Tree
+from server.tests.factories import SolutionFactory, TreeFactory
+from server.tests.test_helpers import create_path_step_options_for_tree
+
+pytestmark = [pytest.mark.django_db]
+
+
+def migration_function(migration_name: str, function_name: str) -> Callable:
+    """Import the data function of the trees migration.
+
+    Args:
+        migration_name (str): name of the migration module.
+        function_name (str): name of the function run by the migration.
+
+    Returns:
+        Callable: data function of the migration.
+    """
+    module = import_module(f"server.apps.trees.migrations.{migration_name}")
+    return getattr(module, function_name)
+
+
+def migration_apps(migration_name: str) -> Apps:
+    """Return the historical models right after the trees migration.
+
+    Args:
+        migration_name (str): name of the migration module.
+
+    Returns:
+        Apps: registry of the historical models.
+    """
+    # The tests run without migrations, load them back from the app.
+    with override_settings(MIGRATION_MODULES={}):
+        loader = MigrationLoader(connection)
+    return loader.project_state(("trees", migration_name)).apps
+
+
+def test_fill_first_steps(
+    tree_factory: TreeFactory,
+    django_capture_on_commit_callbacks,
+):
+    """Check the migrated first steps match the refreshed ones."""
+    tree, empty_tree = tree_factory.create_batch(2)
+    with django_capture_on_commit_callbacks(execute=True):
+        create_path_step_options_for_tree(
+            "First Step",
+            tree,
+            2,
+            next_step=True,
+        )
+    tree.refresh_from_db()
+    first_step = tree.first_step
+    Tree.objects.update(first_step={})
+
+    fill_first_steps = migration_function(
+        "0002_tree_first_step",
+        "fill_first_steps",
+    )
+    fill_first_steps(migration_apps("0002_tree_first_step"), None)
+
+    tree.refresh_from_db()
+    empty_tree.refresh_from_db()
+    assert tree.first_step == first_step
+    assert not empty_tree.first_step
+
+
+def test_render_descriptions(solution_factory: SolutionFactory):
+    """Check the migrated solutions have the rendered descriptions."""
+    solution = solution_factory(description="# Title")
+    Solution.objects.update(description_html="")
+
+    render_descriptions = migration_function(
+        "0005_solution_description_html",
+        "render_descriptions",
+    )
+    render_descriptions(
+        migration_apps("0005_solution_description_html"),
+        None,
+    )
+
+    solution.refresh_from_db()
+    assert "Title</h1>" in solution.description_html
+
+
+def test_fill_memberships(tree_factory: TreeFactory):
+    """Check the migrated memberships match the ones kept by the signals."""
+    tree = tree_factory()
+    create_path_step_options_for_tree("First Step", tree, 2, next_step=True)
+    steps = set(Step.objects.values_list("pk", "trees"))
+    options = set(Option.objects.values_list("pk", "trees"))
+    Tree.steps.through.objects.all().delete()
+    Tree.options.through.objects.all().delete()
+
+    fill_memberships = migration_function(
+        "0009_tree_memberships",
+        "fill_memberships",
+    )
+    fill_memberships(migration_apps("0009_tree_memberships"), None)
+
+    assert set(Step.objects.values_list("pk", "trees")) == steps
+    assert set(Option.objects.values_list("pk", "trees")) == options
+
+
+def test_fill_search_vectors(
+    tree_factory: TreeFactory,
+    solution_factory: SolutionFactory,
+):
+    """Check the migrated trees and solutions can be searched."""
+    tree = tree_factory(name="Printer")
+    solution = solution_factory(name="Restart")
+    Tree.objects.update(search_vector=None)
+    Solution.objects.update(search_vector=None)
+
+    fill_search_vectors = migration_function(
+        "0011_search_vectors",
+        "fill_search_vectors",
+    )
+    fill_search_vectors(migration_apps("0011_search_vectors"), None)
+
+    assert list(Tree.objects.filter(search_vector="printer")) == [tree]
+    assert list(Solution.objects.filter(search_vector="restart")) == [solution]
@@ -0,0 +1,41 @@
+"""Tests for the time-ordered primary keys."""
+
+import pytest
+
+from server.apps.generic import identifiers
+from server.tests.factories import PathFactory
+
+GENERATED_COUNT = 1000
+FROZEN_TIME = 1700000000000000000
+FROZEN_TIMESTAMP = 1700000000000
+
+
+def test_uuid7_layout():
+    """Test the keys are version 7 and start with the current time."""
+    first_key = identifiers.uuid7()
+    second_key = identifiers.uuid7()
+    assert first_key.version == 7
+    assert first_key.variant == "specified in RFC 4122"
+    first_timestamp = first_key.int >> identifiers.TIMESTAMP_SHIFT
+    assert second_key.int >> identifiers.TIMESTAMP_SHIFT >= first_timestamp
+
+
+def test_uuid7_monotonic_within_millisecond(monkeypatch: pytest.MonkeyPatch):
+    """Test the keys keep increasing when the clock stops or overflows."""
+    monkeypatch.setattr(identifiers.time, "time_ns", lambda: FROZEN_TIME)
+    generator = identifiers.MonotonicUUIDGenerator()
+    keys = [generator() for _ in range(GENERATED_COUNT)]
+    assert keys == sorted(set(keys))
+    generator.random_bits = identifiers.MAX_RANDOM
+    overflown_key = generator()
+    assert overflown_key > keys[-1]
+    assert generator.timestamp == FROZEN_TIMESTAMP + 1
+
+
+@pytest.mark.django_db
+def test_primary_keys_ordered(path_factory: PathFactory):
+    """Test the models are created with the time-ordered keys."""
+    paths = path_factory.create_batch(3)
+    path_pks = [path.pk for path in paths]
+    assert path_pks == sorted(path_pks)
+    assert paths[0].pk.version == 7
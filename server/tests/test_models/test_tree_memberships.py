@@ -0,0 +1,139 @@
+"""Tests for the steps and options memberships in the trees."""
+
+import pytest
+from django.contrib import admin
+from django.test import RequestFactory
+from django.urls import reverse
+from rest_framework.status import HTTP_404_NOT_FOUND
+from rest_framework.test import APIClient
+
+from server.apps.trees.graph import TreeGraphCache
+from server.apps.trees.models import Tree
+from server.apps.trees.selectors import StepSelector
+from server.apps.users.models import User
+from server.tests.factories import (
+    OptionFactory,
+    PathFactory,
+    StepFactory,
+    TreeFactory,
+)
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_memberships_follow_paths(
+    tree_factory: TreeFactory,
+    path_factory: PathFactory,
+    step_factory: StepFactory,
+    option_factory: OptionFactory,
+):
+    """Test moving the step and removing the path update the memberships."""
+    old_tree, new_tree = tree_factory.create_batch(2)
+    old_path, new_path = path_factory.create_batch(2)
+    old_tree.paths.add(old_path)
+    new_tree.paths.add(new_path)
+    step = step_factory(path=old_path)
+    option = option_factory(step=step)
+    assert list(old_tree.options.all()) == [option]
+
+    step.path = new_path
+    step.save()
+
+    assert not old_tree.steps.exists()
+    assert list(new_tree.options.all()) == [option]
+    new_tree.paths.remove(new_path)
+    assert not new_tree.steps.exists()
+
+
+def test_memberships_of_shared_path(
+    tree_factory: TreeFactory,
+    path_factory: PathFactory,
+    step_factory: StepFactory,
+    option_factory: OptionFactory,
+):
+    """Test only the memberships of the changed tree and path are synced."""
+    tree, other_tree = tree_factory.create_batch(2)
+    path, other_path = path_factory.create_batch(2)
+    path.trees.add(tree, other_tree)
+    other_tree.paths.add(other_path)
+    option = option_factory(step=step_factory(path=path))
+    other_option = option_factory(step=step_factory(path=other_path))
+
+    tree.paths.remove(path)
+
+    assert not tree.options.exists()
+    assert set(other_tree.options.all()) == {option, other_option}
+
+    option.step = other_option.step
+    option.save()
+    path.trees.clear()
+
+    assert set(other_tree.options.all()) == {option, other_option}
+    assert not other_tree.steps.filter(path=path).exists()
+
+
+def test_step_membership(
+    tree_factory: TreeFactory,
+    path_factory: PathFactory,
+    step_factory: StepFactory,
+):
+    """Test the membership of the step is probed for the tree."""
+    tree = tree_factory()
+    path = path_factory()
+    tree.paths.add(path)
+    step = step_factory(path=path)
+    other_step = step_factory()
+
+    assert StepSelector.is_in_tree(step.pk, tree) is True
+    assert StepSelector.is_in_tree(other_step.pk, tree) is False
+    assert StepSelector.is_in_tree("not-uuid", tree) is False
+    step.delete()
+    assert not tree.steps.exists()
+
+
+def test_change_step_outside_tree(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+    step_factory: StepFactory,
+):
+    """Test the step outside the tree is rejected before the graph compiles."""
+    tree = tree_factory()
+    response = api_client.get(
+        reverse(
+            "trees:trees-change-step",
+            kwargs={"pk": tree.pk, "step_uuid": step_factory().pk},
+        ),
+    )
+
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert TreeGraphCache.get(tree.pk) is None
+
+
+def test_memberships_follow_admin_paths(
+    rf: RequestFactory,
+    admin_user: User,
+    tree_factory: TreeFactory,
+    step_factory: StepFactory,
+):
+    """Test the paths set in the admin form update the memberships."""
+    tree = tree_factory()
+    step = step_factory()
+    request = rf.get("/")
+    request.user = admin_user
+    form_class = admin.site._registry[Tree].get_form(  # noqa: WPS437
+        request,
+        tree,
+    )
+    form = form_class(
+        data={
+            "name": tree.name,
+            "description": tree.description,
+            "creator": tree.creator_id,
+            "paths": [step.path_id],
+        },
+        instance=tree,
+    )
+
+    assert form.is_valid()
+    form.save()
+    assert list(tree.steps.all()) == [step]
@@ -0,0 +1,139 @@
+"""Tests for the materialized statistics of the trees."""
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from server.apps.trees.derived_models import TreeStatistics
+from server.apps.trees.selectors import (
+    STATISTICS_FIELDS,
+    TreeStatisticsSelector,
+)
+from server.tests.factories import (
+    OptionFactory,
+    PathFactory,
+    SolutionFactory,
+    StepFactory,
+    TreeFactory,
+)
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_statistics_follow_edits(
+    tree_factory: TreeFactory,
+    step_factory: StepFactory,
+    option_factory: OptionFactory,
+    solution_factory: SolutionFactory,
+    django_capture_on_commit_callbacks,
+):
+    """Test the statistics are measured from the merged graph of the tree."""
+    tree = tree_factory()
+    with django_capture_on_commit_callbacks(execute=True):
+        first_step = step_factory(is_first=True)
+        middle_step = step_factory()
+        path, other_path = first_step.path, middle_step.path
+        tree.paths.add(path, other_path)
+        shallow_final = step_factory(
+            path=path,
+            is_final=True,
+            solution=solution_factory(),
+        )
+        deep_final = step_factory(
+            path=other_path,
+            is_final=True,
+            solution=solution_factory(),
+        )
+        option_factory(step=first_step, next_step=middle_step)
+        option_factory(step=first_step, next_step=shallow_final)
+        option_factory(step=middle_step, next_step=deep_final)
+
+    assert TreeStatistics.objects.filter(tree=tree).values(
+        *STATISTICS_FIELDS,
+    ).get() == {
+        "paths_count": 2,
+        "steps_count": 4,
+        "options_count": 3,
+        "solutions_count": 2,
+        "max_depth": 2,
+        "average_depth": (1 + 2) / 2,
+    }
+
+    with django_capture_on_commit_callbacks(execute=True):
+        deep_final.delete()
+    statistics = TreeStatistics.objects.get(tree=tree)
+    assert statistics.solutions_count == 1
+    assert statistics.max_depth == 1
+
+
+def test_tree_list_ordered_by_statistics(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+    path_factory: PathFactory,
+    step_factory: StepFactory,
+    django_capture_on_commit_callbacks,
+):
+    """Test the trees are sorted by the statistics, read as plain columns."""
+    empty_tree, large_tree = tree_factory.create_batch(2)
+    path = path_factory()
+    with django_capture_on_commit_callbacks(execute=True):
+        large_tree.paths.add(path)
+        step_factory.create_batch(3, path=path)
+    TreeStatistics.objects.filter(tree=empty_tree).delete()
+
+    response = api_client.get(
+        reverse("trees:trees-list"),
+        {"ordering": "-steps_count", "fields": "name,steps_count"},
+    )
+
+    assert response.json()["results"] == [
+        {"name": large_tree.name, "steps_count": 3},
+        {"name": empty_tree.name, "steps_count": 0},
+    ]
+
+
+def test_tree_list_statistics_pages(
+    api_client: APIClient,
+    tree_factory: TreeFactory,
+    path_factory: PathFactory,
+    step_factory: StepFactory,
+):
+    """Test paging through the trees sharing the statistics.
+
+    Cursor keeps all the ordering fields, so no tree repeats or goes
+    missing between the pages of the equal statistics.
+    """
+    large_tree = tree_factory()
+    tree_factory.create_batch(4)
+    path = path_factory()
+    large_tree.paths.add(path)
+    step_factory(path=path)
+    trees = TreeStatisticsSelector.with_statistics().order_by(
+        "-steps_count",
+        "created_at",
+        "uuid",
+    )
+    response = api_client.get(
+        reverse("trees:trees-list"),
+        {"ordering": "-steps_count", "fields": "name", "page_size": 2},
+    )
+    names = [tree["name"] for tree in response.json()["results"]]
+    while response.json()["next"]:
+        response = api_client.get(response.json()["next"])
+        names.extend(tree["name"] for tree in response.json()["results"])
+
+    assert names == [tree.name for tree in trees]
+    assert names[0] == large_tree.name
+
+
+def test_refresh_trees_command(tree_factory: TreeFactory):
+    """Test the statistics of all the trees are filled by the command."""
+    trees = tree_factory.create_batch(3)
+    TreeStatistics.objects.all().delete()
+
+    call_command("refresh_trees", chunk_size=2)
+
+    assert set(TreeStatistics.objects.values_list("tree", flat=True)) == {
+        tree.pk for tree in trees
+    }
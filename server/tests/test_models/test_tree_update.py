@@ -0,0 +1,88 @@
+"""Tests for the diff-based updates of the trees."""
+
+import pytest
+
+from server.apps.trees.services.tree import TreeService, TreeUpdatePayload
+from server.tests.factories import PathFactory, StepFactory, TreeFactory
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_update_tree_paths_diff(
+    tree_factory: TreeFactory,
+    path_factory: PathFactory,
+    django_capture_on_commit_callbacks,
+):
+    """Test only the differing paths are changed, with a single refresh."""
+    kept_path, removed_path, added_path = path_factory.create_batch(3)
+    tree = tree_factory()
+    with django_capture_on_commit_callbacks(execute=True):
+        tree.paths.add(kept_path, removed_path)
+    tree.refresh_from_db()
+    tree_version = tree.version
+
+    with django_capture_on_commit_callbacks(execute=True):
+        TreeService.update_tree(
+            tree,
+            TreeUpdatePayload(name=tree.name, paths=[kept_path, added_path]),
+        )
+    tree.refresh_from_db()
+
+    assert set(tree.paths.all()) == {kept_path, added_path}
+    assert tree.version == tree_version + 1
+
+
+def test_update_tree_paths_reported(
+    tree_factory: TreeFactory,
+    step_factory: StepFactory,
+):
+    """Test the changed paths are reported and their memberships synced."""
+    kept_step, removed_step, added_step = step_factory.create_batch(3)
+    tree = tree_factory()
+    tree.paths.add(kept_step.path, removed_step.path)
+
+    changed_pks = TreeService.update_paths(
+        tree,
+        [kept_step.path, added_step.path],
+    )
+
+    assert changed_pks == ({added_step.path.pk}, {removed_step.path.pk})
+    assert set(tree.steps.all()) == {kept_step, removed_step}
+
+    TreeService.paths_changed({tree.pk}, set.union(*changed_pks))
+
+    assert set(tree.steps.all()) == {kept_step, added_step}
+    assert TreeService.update_paths(tree, None) == (set(), set())
+
+
+def test_update_tree_unchanged(
+    tree_factory: TreeFactory,
+    path_factory: PathFactory,
+    django_assert_num_queries,
+    django_capture_on_commit_callbacks,
+):
+    """Test nothing is written when neither the name nor paths change.
+
+    The paths are read within the savepoint of the update.
+    """
+    path = path_factory()
+    tree = tree_factory()
+    with django_capture_on_commit_callbacks(execute=True):
+        tree.paths.add(path)
+    tree.refresh_from_db()
+    tree_version = tree.version
+
+    with django_assert_num_queries(3) as captured:
+        TreeService.update_tree(
+            tree,
+            TreeUpdatePayload(name=tree.name, paths=[path]),
+        )
+        statements = [query["sql"].split()[0] for query in captured]
+    with django_capture_on_commit_callbacks(execute=True):
+        TreeService.update_tree(tree, TreeUpdatePayload(name="Renamed"))
+    tree.refresh_from_db()
+
+    assert statements == ["SAVEPOINT", "SELECT", "RELEASE"]
+    assert tree.name == "Renamed"
+    assert tree.version == tree_version
+    assert tree.paths.get() == path
@@ -1,7 +1,10 @@
 """Tests for tree app models."""
+from unittest.mock import Mock, call
+
 import pytest
 from django.core.exceptions import ValidationError
 
+from server.apps.trees.rendering import DescriptionRenderer
 from server.tests.factories import (
     OptionFactory,
     PathFactory,
@@ -82,3 +85,25 @@ def test_steps_not_equal_constraint(
     option.next_step = step
     with pytest.raises(ValidationError):
         option.save()
+
+
+# Rendered descriptions
+
+
+def test_solution_description_rendered_on_save(
+    solution_factory: SolutionFactory,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Check the description is rendered once, until it changes."""
+    render = Mock(wraps=DescriptionRenderer.render)
+    monkeypatch.setattr(DescriptionRenderer, "render", render)
+    solution = solution_factory(description="**Bold**")
+    solution.save()
+    solution.description = "*Italic*"
+    solution.save()
+
+    assert render.call_args_list == [call("**Bold**"), call("*Italic*")]
+    assert solution.description_html == "<p><em>Italic</em></p>"
+    assert solution.description_hash == DescriptionRenderer.content_hash(
+        "*Italic*",
+    )
@@ -0,0 +1,214 @@
+"""Tests for the query plans of the traversal selectors."""
+
+from typing import Callable, Iterator
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from server.apps.trees.graph import TreeGraphCache
+from server.apps.trees.models import Option, Solution, Step, Tree
+from server.apps.trees.selectors import (
+    SearchSelector,
+    SolutionSelector,
+    StepSelector,
+    TreeSelector,
+)
+from server.apps.trees.services.tree_refresh import TreeRefreshService
+from server.tests.factories import PathFactory, SolutionFactory, TreeFactory
+from server.tests.test_helpers import create_nested_path_steps
+
+pytestmark = [pytest.mark.django_db]
+
+SEEDED_TREES_COUNT = 20
+INDEXED_TABLES = frozenset(
+    ("trees_step", "trees_option", "trees_treestep", "trees_treeoption"),
+)
+SEARCHED_TABLES = frozenset(("trees_tree", "trees_solution"))
+SCAN_NODES = frozenset(
+    ("Seq Scan", "Index Scan", "Index Only Scan", "Bitmap Heap Scan"),
+)
+BITMAP_NODES = frozenset(("Bitmap Heap Scan", "BitmapAnd", "BitmapOr"))
+DISABLED_PLANS = ("enable_seqscan", "enable_mergejoin", "enable_hashjoin")
+
+
+def is_bounded(plan: dict) -> bool:
+    """Tell whether the plan node reads only the rows the index matches.
+
+    Bitmap heap scan has only the recheck condition, the index
+    conditions belong to the bitmap index scans below it. Rows left
+    after the index condition may still be filtered, as on the small
+    seeded tables the planner prefers the smaller index of one column
+    to the unique index of both, whichever order the tests run in.
+
+    Args:
+        plan (dict): node of the JSON query plan.
+
+    Returns:
+        bool: whether the rows are limited by the index conditions.
+    """
+    if plan["Node Type"] in BITMAP_NODES:
+        return all(is_bounded(subplan) for subplan in plan["Plans"])
+    return "Index Cond" in plan
+
+
+def find_full_scans(plan: dict) -> Iterator[str]:
+    """Find the tables scanned as a whole by the plan node.
+
+    Whole table is read by the sequential scan, or by the index scan
+    without the index condition.
+
+    Args:
+        plan (dict): node of the JSON query plan.
+
+    Yields:
+        str: name of the scanned table.
+    """
+    if plan["Node Type"] in SCAN_NODES and not is_bounded(plan):
+        yield plan["Relation Name"]
+    for subplan in plan.get("Plans", ()):
+        yield from find_full_scans(subplan)
+
+
+def find_sequential_scans(plan: dict) -> Iterator[str]:
+    """Find the tables read without any index by the plan node.
+
+    Args:
+        plan (dict): node of the JSON query plan.
+
+    Yields:
+        str: name of the scanned table.
+    """
+    if plan["Node Type"] == "Seq Scan":
+        yield plan["Relation Name"]
+    for subplan in plan.get("Plans", ()):
+        yield from find_sequential_scans(subplan)
+
+
+def full_scans(
+    run_queries: Callable[[], object],
+    find_scans: Callable[[dict], Iterator[str]] = find_full_scans,
+) -> set[str]:
+    """Explain the selects of the function, with sequential scans disabled.
+
+    Merge and hash joins, which read the whole inputs, are disabled
+    as well, so the planner falls back to the full scans only
+    if no index fits.
+
+    Args:
+        run_queries (Callable[[], object]): function running the queries.
+        find_scans (Callable[[dict], Iterator[str]]): finds the tables
+            scanned by the plan node.
+
+    Returns:
+        set[str]: names of the tables scanned sequentially.
+    """
+    context = CaptureQueriesContext(connection)
+    with context:
+        run_queries()
+    scanned_tables: set[str] = set()
+    with connection.cursor() as cursor:
+        for setting in DISABLED_PLANS:
+            cursor.execute(f"SET LOCAL {setting} = off")
+        for query in context.captured_queries:
+            if query["sql"].startswith("SELECT"):
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {query['sql']}")
+                plan = cursor.fetchone()[0][0]["Plan"]
+                scanned_tables.update(find_scans(plan))
+    return scanned_tables
+
+
+@pytest.fixture(name="seeded_tree")
+def seeded_tree_fixture(
+    tree_factory: TreeFactory,
+    path_factory: PathFactory,
+) -> Tree:
+    """Seed the trees with steps, options and solutions.
+
+    Args:
+        tree_factory (TreeFactory): tree factory.
+        path_factory (PathFactory): path factory.
+
+    Returns:
+        Tree: one of the seeded trees.
+    """
+    trees = tree_factory.create_batch(SEEDED_TREES_COUNT)
+    for tree in trees:
+        path = path_factory()
+        create_nested_path_steps(path)
+        tree.paths.add(path)
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+    return trees[0]
+
+
+def test_selector_plans(seeded_tree: Tree):
+    """Test the traversal selectors use the indexes of the tree members."""
+    path = seeded_tree.paths.get()
+    step = path.steps.get(is_first=True)
+
+    scanned_tables = full_scans(
+        lambda: (
+            TreeGraphCache.build(seeded_tree.pk),
+            SolutionSelector.for_path(path),
+            list(TreeSelector.for_step(step)),
+            TreeRefreshService.rebuild_trees([seeded_tree.pk]),
+            StepSelector.is_in_tree(step.pk, seeded_tree),
+        ),
+    )
+
+    assert scanned_tables & INDEXED_TABLES == set()
+
+
+def test_similar_names_plans(seeded_tree: Tree):
+    """Test the similar names are found with the indexes.
+
+    Names are filtered by the trigram index, or by the similarity
+    among the rows of the scope index, whichever the planner prefers.
+    """
+    path = seeded_tree.paths.get()
+    step = path.steps.get(is_first=True)
+
+    scanned_tables = full_scans(
+        lambda: (
+            list(
+                SearchSelector.similar_names(
+                    Step,
+                    {"path": path.pk},
+                    step.name,
+                    1,
+                ),
+            ),
+            list(
+                SearchSelector.similar_names(
+                    Option,
+                    {"tree": seeded_tree.pk},
+                    step.name,
+                    1,
+                ),
+            ),
+        ),
+        find_sequential_scans,
+    )
+
+    assert scanned_tables & INDEXED_TABLES == set()
+
+
+def test_search_plans(
+    tree_factory: TreeFactory,
+    solution_factory: SolutionFactory,
+):
+    """Test the search finds the matches with the search vector indexes."""
+    tree_factory.create_batch(SEEDED_TREES_COUNT)
+    solution_factory.create_batch(SEEDED_TREES_COUNT)
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+
+    scanned_tables = full_scans(
+        lambda: (
+            list(SearchSelector.search(Tree.objects.all(), "pattern", 1)),
+            list(SearchSelector.search(Solution.objects.all(), "pattern", 1)),
+        ),
+    )
+
+    assert scanned_tables & SEARCHED_TABLES == set()
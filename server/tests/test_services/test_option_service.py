@@ -0,0 +1,64 @@
+"""Tests for the bulk updates of the options by the option service."""
+
+import pytest
+from django.core.exceptions import ValidationError
+
+from server.apps.trees.models import Option
+from server.apps.trees.services.option import OptionService
+from server.tests.factories import OptionFactory, StepFactory, TreeFactory
+
+pytestmark = [pytest.mark.django_db]
+
+MOVED_COUNT = 20
+MOVE_MAX_QUERIES = 20
+
+
+def test_move_options(
+    tree_factory: TreeFactory,
+    step_factory: StepFactory,
+    option_factory: OptionFactory,
+    django_assert_max_num_queries,
+    django_capture_on_commit_callbacks,
+):
+    """Test re-parenting the options refreshes the trees of both steps."""
+    options = option_factory.create_batch(MOVED_COUNT)
+    new_step = step_factory()
+    tree = tree_factory()
+    tree.paths.add(new_step.path)
+    tree.refresh_from_db()
+
+    with django_assert_max_num_queries(MOVE_MAX_QUERIES):
+        with django_capture_on_commit_callbacks(execute=True):
+            moved_count = OptionService.move_options(options, new_step)
+    tree_version = tree.version
+    tree.refresh_from_db()
+
+    assert moved_count == MOVED_COUNT
+    assert set(Option.objects.values_list("step", flat=True)) == {new_step.pk}
+    assert tree.version == tree_version + 1
+
+
+def test_move_options_name_taken(option_factory: OptionFactory):
+    """Test the options cannot be moved next to the option with the name."""
+    taken_option = option_factory()
+    option = option_factory(name=taken_option.name)
+    step_pk = option.step_id
+
+    with pytest.raises(ValidationError, match="already exists"):
+        OptionService.move_options([option], taken_option.step)
+
+    assert Option.objects.get(pk=option.pk).step_id == step_pk
+    assert option.step_id == step_pk
+
+
+def test_relink_options_none(
+    step_factory: StepFactory,
+    django_assert_num_queries,
+):
+    """Test relinking no options does not query anything."""
+    next_step = step_factory()
+
+    with django_assert_num_queries(0):
+        relinked_count = OptionService.relink_options([], next_step)
+
+    assert relinked_count == 0